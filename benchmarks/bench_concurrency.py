@@ -0,0 +1,73 @@
+"""
+Measures read throughput of a ConcurrentStudentSystem with 1..N reader threads while a writer
+keeps adding grades.
+
+Usage:
+    python -m benchmarks.bench_concurrency [students] [seconds]
+
+On CPython the global interpreter lock keeps pure-Python readers from running truly in
+parallel, so the numbers show lock overhead and fairness rather than linear scaling.
+"""
+import random
+import sys
+import threading
+import time
+
+from benchmarks.datagen import generate_students
+from src.concurrent_system import ConcurrentStudentSystem
+
+
+def measure(system: ConcurrentStudentSystem, readers: int, seconds: float) -> tuple[float, float]:
+    """
+    Runs reader threads and one writer thread for a fixed time.
+
+    Args:
+        system (ConcurrentStudentSystem): System under test.
+        readers (int): Number of reader threads.
+        seconds (float): Duration of the run.
+
+    Returns:
+        tuple[float, float]: Reads per second and writes per second.
+    """
+    stop = threading.Event()
+    counts = [0] * (readers + 1)
+    students = system.students
+    keys = [(s.name, s.last_name, s.year) for s in students[:1000]]
+
+    def reader(slot):
+        rng = random.Random(slot)
+        while not stop.is_set():
+            system.find_student(*rng.choice(keys))
+            system.get_class_average("1A")
+            counts[slot] += 1
+
+    def writer():
+        rng = random.Random(-1)
+        while not stop.is_set():
+            with system.writing():
+                rng.choice(students).add_grade("math", 4.0)
+            counts[readers] += 1
+
+    threads = [threading.Thread(target=reader, args=(slot,)) for slot in range(readers)]
+    threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return sum(counts[:readers]) / seconds, counts[readers] / seconds
+
+
+def main() -> None:
+    students = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 2.0
+    system = ConcurrentStudentSystem()
+    system.add_students_bulk(generate_students(students))
+    for readers in (1, 2, 4, 8):
+        reads, writes = measure(system, readers, seconds)
+        print(f"{readers} readers: {reads:12.0f} reads/s, writer: {writes:10.0f} writes/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Measures JournalStorage start-up time: loading a snapshot and replaying journals of growing length,
+compared with replaying the same history from the journal alone.
+
+Usage:
+    python -m benchmarks.bench_journal [students] [max_entries]
+"""
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+from benchmarks.datagen import generate_students
+from src.journal import JournalStorage
+
+
+def startup_seconds(directory: str) -> tuple[float, int]:
+    """
+    Opens a journal directory and returns how long loading took.
+
+    Args:
+        directory (str): Storage directory.
+
+    Returns:
+        tuple[float, int]: Load time in seconds and number of journal entries replayed.
+    """
+    start = time.perf_counter()
+    storage = JournalStorage(directory, snapshot_every=None)
+    storage.load()
+    seconds = time.perf_counter() - start
+    entries = storage._entries
+    storage.close()
+    return seconds, entries
+
+
+def append_grades(directory: str, entries: int, seed: int) -> None:
+    """
+    Adds random grades through the storage, so that each one is journalled.
+
+    Args:
+        directory (str): Storage directory.
+        entries (int): Number of grades to add.
+        seed (int): Random seed.
+    """
+    rng = random.Random(seed)
+    with JournalStorage(directory, snapshot_every=None) as storage:
+        students = storage.load().students
+        for _ in range(entries):
+            rng.choice(students).add_grade(f"subject{rng.randrange(8)}", rng.randint(2, 12) / 2)
+
+
+def main() -> None:
+    students = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    max_entries = int(sys.argv[2]) if len(sys.argv) > 2 else 200_000
+    base = tempfile.mkdtemp()
+    try:
+        directory = f"{base}/db"
+        with JournalStorage(directory, snapshot_every=None) as storage:
+            storage.load().add_students_bulk(generate_students(students))
+        seconds, entries = startup_seconds(directory)
+        print(f"{students} students, 20 grades each")
+        print(f"{'journal only':<30} {entries:>9} entries {seconds * 1000:9.1f} ms")
+        with JournalStorage(directory, snapshot_every=None) as storage:
+            storage.load()
+            storage.snapshot()
+        tail = 0
+        step = max_entries // 4
+        while tail <= max_entries:
+            seconds, entries = startup_seconds(directory)
+            print(f"{'snapshot + journal tail':<30} {entries:>9} entries {seconds * 1000:9.1f} ms")
+            append_grades(directory, step, tail)
+            tail += step
+    finally:
+        shutil.rmtree(base)
+
+
+if __name__ == "__main__":
+    main()
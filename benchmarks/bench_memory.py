@@ -0,0 +1,86 @@
+"""
+Measures memory used per student by the compact Student layout and by the original one.
+
+The original layout (an instance __dict__ plus dict[str, list[float]] of boxed floats) is
+reproduced by LegacyStudent below so both can be measured side by side.
+
+Usage:
+    python -m benchmarks.bench_memory [students] [subjects] [grades_per_subject]
+"""
+import gc
+import random
+import sys
+import tracemalloc
+
+from src.student import Student
+
+
+class LegacyStudent:
+    """
+    Student with the original storage layout, kept only for comparison.
+    """
+
+    def __init__(self, name: str, last_name: str, class_grade: str, major: str, year: int):
+        self.name = name
+        self.last_name = last_name
+        self.class_grade = class_grade
+        self.major = major
+        self.year = year
+        self.grades: dict[str, list[float]] = {}
+
+    def add_grade(self, subject: str, grade: float) -> None:
+        if subject not in self.grades:
+            self.grades[subject] = []
+        self.grades[subject].append(grade)
+
+
+SUBJECTS = ["math", "physics", "chemistry", "biology", "history", "english", "polish", "art"]
+CLASSES = [f"{year}{letter}" for year in range(1, 5) for letter in "ABCDE"]
+MAJORS = ["Math", "Physics", "Chemistry", "Biology", "Humanities"]
+
+
+def bytes_per_student(student_cls, students: int, subjects: int, grades_per_subject: int) -> float:
+    """
+    Builds a roster with the given class and returns the traced memory divided by its size.
+
+    Args:
+        student_cls: Student implementation to measure.
+        students (int): Number of students to create.
+        subjects (int): Number of subjects per student.
+        grades_per_subject (int): Number of grades per subject.
+
+    Returns:
+        float: Allocated bytes per student.
+    """
+    rng = random.Random(0)
+    gc.collect()
+    tracemalloc.start()
+    roster = []
+    for i in range(students):
+        # Strings are built at runtime, as they would be when read from input or a file.
+        student = student_cls(f"Name{i}", f"Last{i}", "".join(rng.choice(CLASSES)),
+                              "".join(rng.choice(MAJORS)), 2020 + i % 5)
+        for subject in SUBJECTS[:subjects]:
+            subject = "".join(subject)
+            for _ in range(grades_per_subject):
+                student.add_grade(subject, rng.randint(2, 12) / 2)
+        roster.append(student)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del roster
+    return current / students
+
+
+def main() -> None:
+    students = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    subjects = int(sys.argv[2]) if len(sys.argv) > 2 else 6
+    grades_per_subject = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+    legacy = bytes_per_student(LegacyStudent, students, subjects, grades_per_subject)
+    compact = bytes_per_student(Student, students, subjects, grades_per_subject)
+    print(f"{students} students, {subjects} subjects x {grades_per_subject} grades each")
+    print(f"legacy layout:  {legacy:10.1f} bytes/student")
+    print(f"compact layout: {compact:10.1f} bytes/student ({compact / legacy:.0%} of legacy)")
+
+
+if __name__ == "__main__":
+    main()
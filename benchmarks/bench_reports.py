@@ -0,0 +1,76 @@
+"""
+Compares per-class/per-major reports built with one roster scan per group against
+src.reports.generate_reports with 1..N worker processes.
+
+Usage:
+    python -m benchmarks.bench_reports [students] [classes] [max_workers]
+
+The speedup of the process pool depends on the number of CPU cores; on a single core
+it only adds the cost of sending the groups to the workers. The "collect payloads" line is
+the part of a pooled run that stays in the parent process whatever the number of cores.
+"""
+import os
+import sys
+import time
+
+from benchmarks.datagen import generate_system
+from src.reports import GROUP_KINDS, _group, _student_payload, _student_record, generate_reports, render_group_report
+from src.student_system import StudentSystem
+
+
+def per_group_reports(system: StudentSystem) -> int:
+    """
+    Builds the same reports the old way: one roster scan per class and per major.
+
+    Args:
+        system (StudentSystem): System to report on.
+
+    Returns:
+        int: Number of groups reported.
+    """
+    classes = {s.class_grade.lower() for s in system.iter_students()}
+    majors = {s.major.lower() for s in system.iter_students()}
+    for class_grade in classes:
+        students = system.sort_students_by_avg_in_class(class_grade)
+        render_group_report("class", class_grade, [_student_record(s) for s in students])
+    for major in majors:
+        students = system.get_students_from_major(major)
+        render_group_report("major", major, [_student_record(s) for s in students])
+    return len(classes) + len(majors)
+
+
+def timed(function) -> float:
+    """
+    Runs a function once and returns its duration.
+
+    Args:
+        function: Callable to time.
+
+    Returns:
+        float: Duration in seconds.
+    """
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    students = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    classes = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    max_workers = int(sys.argv[3]) if len(sys.argv) > 3 else (os.cpu_count() or 1)
+    system = generate_system(students, classes=classes, majors=8)
+    print(f"{students} students, {classes} classes, {os.cpu_count()} CPUs, groups: {', '.join(GROUP_KINDS)}")
+    print(f"{'per-group scans':<25} {timed(lambda: per_group_reports(system)) * 1000:9.1f} ms")
+    serial = timed(lambda: generate_reports(system, workers=1))
+    print(f"{'generate_reports w=1':<25} {serial * 1000:9.1f} ms")
+    collect = timed(lambda: _group(system, GROUP_KINDS, _student_payload))
+    print(f"{'collect payloads':<25} {collect * 1000:9.1f} ms")
+    workers = 2
+    while workers <= max(max_workers, 2):
+        seconds = timed(lambda: generate_reports(system, workers=workers))
+        print(f"{f'generate_reports w={workers}':<25} {seconds * 1000:9.1f} ms   speedup x{serial / seconds:.2f}")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
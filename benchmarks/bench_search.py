@@ -0,0 +1,87 @@
+"""
+Measures name search latency: prefix (autocomplete) and fuzzy search over a large roster.
+
+Usage:
+    python -m benchmarks.bench_search [students] [queries] [first_names] [last_names]
+"""
+import random
+import sys
+import time
+
+from src.search import normalize
+from src.student import Student
+from src.student_system import StudentSystem
+
+SYLLABLES = ["ka", "ko", "wa", "le", "ski", "ska", "no", "wak", "dą", "bro", "wi", "śnie", "mi", "chał", "zy", "ń",
+             "pa", "weł", "ma", "ło", "go", "rza", "ta", "kie", "wicz", "ra", "ju", "sze", "lis", "ek"]
+
+
+def random_name(rng: random.Random, parts: int) -> str:
+    """
+    Builds a pronounceable name from random syllables.
+
+    Args:
+        rng (random.Random): Random generator.
+        parts (int): Number of syllables.
+
+    Returns:
+        str: The name, capitalised.
+    """
+    return "".join(rng.choice(SYLLABLES) for _ in range(parts)).capitalize()
+
+
+def build_system(students: int, first_names: int, last_names: int) -> StudentSystem:
+    """
+    Builds a roster where names repeat like in a real school.
+
+    Args:
+        students (int): Number of students.
+        first_names (int): Number of distinct first names to draw from.
+        last_names (int): Number of distinct last names to draw from.
+
+    Returns:
+        StudentSystem: The populated system (students without grades).
+    """
+    rng = random.Random(0)
+    firsts = [random_name(rng, rng.randint(2, 3)) for _ in range(first_names)]
+    lasts = [random_name(rng, rng.randint(2, 4)) for _ in range(last_names)]
+    system = StudentSystem()
+    system.add_students_bulk(Student(rng.choice(firsts), rng.choice(lasts), "1A", "Math", 2020 + i % 5)
+                             for i in range(students))
+    return system
+
+
+def main() -> None:
+    students = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+    queries = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    first_names = int(sys.argv[3]) if len(sys.argv) > 3 else 2_000
+    last_names = int(sys.argv[4]) if len(sys.argv) > 4 else 50_000
+    system = build_system(students, first_names, last_names)
+    rng = random.Random(2)
+    sample = [rng.choice(system.students) for _ in range(queries)]
+
+    start = time.perf_counter()
+    system.search_students("a")
+    print(f"{students} students, index built in {(time.perf_counter() - start) * 1000:.0f} ms "
+          f"({len(system._name_index)} terms)")
+
+    cases = [
+        ("prefix, 3 letters of last name", lambda s: system.search_students(s.last_name[:3])),
+        ("prefix, first name + 2 letters", lambda s: system.search_students(f"{s.name} {s.last_name[:2]}")),
+        ("fuzzy, full name with a typo", lambda s: system.fuzzy_search_students(
+            f"{s.name} {normalize(s.last_name)[::-1][:2]}{normalize(s.last_name)[2:]}")),
+        ("fuzzy, first name with a typo", lambda s: system.fuzzy_search_students(s.name[1:])),
+    ]
+    for label, search in cases:
+        latencies = []
+        for student in sample:
+            start = time.perf_counter()
+            search(student)
+            latencies.append(time.perf_counter() - start)
+        latencies.sort()
+        print(f"{label:<35} median {latencies[len(latencies) // 2] * 1000:7.2f} ms   "
+              f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Compares loading a roster from the binary snapshot with pickle and the JSON-lines journal snapshot.
+
+Usage:
+    python -m benchmarks.bench_snapshot [students]
+"""
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.datagen import generate_system
+from src.journal import SNAPSHOT_FILE, JournalStorage
+from src.snapshot import Snapshot, load_snapshot, write_snapshot
+
+
+def measure(load) -> tuple[float, float]:
+    """
+    Runs a loader once for time and once more under tracemalloc for peak memory.
+
+    Args:
+        load: Callable loading the roster; its result is kept alive until measured.
+
+    Returns:
+        tuple[float, float]: Seconds and peak allocated megabytes.
+    """
+    start = time.perf_counter()
+    result = load()
+    seconds = time.perf_counter() - start
+    del result
+    tracemalloc.start()
+    result = load()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return seconds, peak / 2 ** 20
+
+
+def main() -> None:
+    students = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    system = generate_system(students)
+    directory = tempfile.mkdtemp()
+    try:
+        binary = os.path.join(directory, "students.snap")
+        pickled = os.path.join(directory, "students.pickle")
+        journal = os.path.join(directory, "journal")
+        write_snapshot(system, binary)
+        with open(pickled, "wb") as file:
+            pickle.dump(system.students, file, protocol=pickle.HIGHEST_PROTOCOL)
+        with JournalStorage(journal, snapshot_every=None) as storage:
+            storage.load().add_students_bulk(system.students)
+            storage.snapshot()
+
+        def load_pickle():
+            with open(pickled, "rb") as file:
+                return pickle.load(file)
+
+        def load_journal():
+            storage = JournalStorage(journal, snapshot_every=None)
+            loaded = storage.load()
+            storage.close()
+            return loaded
+
+        def open_lazy():
+            snapshot = Snapshot(binary)
+            return snapshot, snapshot.to_system()
+
+        print(f"{students} students, 20 grades each")
+        for label, path, load in [("pickle (list of Student)", pickled, load_pickle),
+                                  ("journal JSON snapshot", os.path.join(journal, SNAPSHOT_FILE), load_journal),
+                                  ("binary, all grades", binary, lambda: load_snapshot(binary)),
+                                  ("binary, lazy grades (mmap)", binary, open_lazy)]:
+            seconds, peak = measure(load)
+            print(f"{label:<28} {os.path.getsize(path) / 2 ** 20:8.1f} MB file {seconds * 1000:9.1f} ms "
+                  f"{peak:8.1f} MB peak")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
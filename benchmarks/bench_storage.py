@@ -0,0 +1,47 @@
+"""
+Times importing grades into a SQLite-backed StudentSystem and reloading it.
+
+Usage:
+    python -m benchmarks.bench_storage [students] [grades_per_student]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from src.storage import SQLiteStorage
+from src.student import Student
+
+
+def main() -> None:
+    students = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    grades_per_student = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.db")
+        start = time.perf_counter()
+        with SQLiteStorage(path) as storage:
+            system = storage.load()
+            for i in range(students):
+                student = Student(f"Name{i}", f"Last{i}", f"{i % 4 + 1}A", "Math", 2024)
+                system.add_student(student)
+                for _ in range(grades_per_student):
+                    student.add_grade(rng.choice(["math", "physics", "history"]), rng.randint(2, 12) / 2)
+        imported = time.perf_counter() - start
+        print(f"import of {students} students / {students * grades_per_student} grades: {imported:.2f} s")
+
+        start = time.perf_counter()
+        with SQLiteStorage(path) as storage:
+            system = storage.load()
+            loaded = time.perf_counter() - start
+            system.get_school_average()
+            start = time.perf_counter()
+            for student in system.students:
+                student.average_grade()
+            fetched = time.perf_counter() - start
+        print(f"load of student rows: {loaded:.2f} s, fetching every student's grades lazily: {fetched:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
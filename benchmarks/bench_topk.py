@@ -0,0 +1,71 @@
+"""
+Compares top_students/bottom_students with slicing the full-sort methods.
+
+Usage:
+    python -m benchmarks.bench_topk [students] [k]
+"""
+import random
+import sys
+import timeit
+
+from src.student import Student
+from src.student_system import StudentSystem
+
+CLASSES = [f"{year}{letter}" for year in range(1, 5) for letter in "ABCDE"]
+
+
+def build_system(students: int) -> StudentSystem:
+    """
+    Builds a system with random students, a few of them without grades.
+
+    Args:
+        students (int): Number of students.
+
+    Returns:
+        StudentSystem: The populated system.
+    """
+    rng = random.Random(0)
+    system = StudentSystem()
+    for i in range(students):
+        student = Student(f"Name{i}", f"Last{i}", rng.choice(CLASSES), "Math", 2024)
+        if i % 50:
+            for subject in ("math", "physics", "history"):
+                student.add_grade(subject, rng.randint(2, 12) / 2)
+        system.add_student(student)
+    return system
+
+
+def report(label: str, statement, repeat: int) -> float:
+    """
+    Times a callable and prints its best run.
+
+    Args:
+        label (str): Name printed next to the timing.
+        statement: Callable to time.
+        repeat (int): Number of runs.
+
+    Returns:
+        float: Best run time in seconds.
+    """
+    best = min(timeit.repeat(statement, number=1, repeat=repeat))
+    print(f"{label:<45} {best * 1000:9.2f} ms")
+    return best
+
+
+def main() -> None:
+    students = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    k = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    system = build_system(students)
+    print(f"{students} students, k={k}")
+    full = report("sort_class_by_avg_grade()[:k]", lambda: system.sort_class_by_avg_grade()[:k], 5)
+    top = report("top_students(k)", lambda: system.top_students(k), 5)
+    report("bottom_students(k)", lambda: system.bottom_students(k), 5)
+    print(f"speedup top_students vs full sort: {full / top:.1f}x")
+    full = report("sort_students_by_avg_in_class('1A')[:k]",
+                  lambda: system.sort_students_by_avg_in_class("1A")[:k], 20)
+    top = report("top_students(k, class_grade='1A')", lambda: system.top_students(k, class_grade="1A"), 20)
+    print(f"speedup in class: {full / top:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
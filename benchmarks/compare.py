@@ -0,0 +1,49 @@
+"""
+Compares two result files written by benchmarks.run.
+
+Usage:
+    python -m benchmarks.compare baseline.json candidate.json [--threshold 1.10]
+
+Exits with status 1 if any operation got slower than the threshold ratio.
+"""
+import argparse
+import json
+import sys
+
+
+def load(path: str) -> dict[tuple[int, str], float]:
+    """
+    Reads a result file.
+
+    Args:
+        path (str): Path of a JSON file written by benchmarks.run.
+
+    Returns:
+        dict[tuple[int, str], float]: Seconds per call keyed by (size, operation).
+    """
+    with open(path, encoding="utf-8") as file:
+        document = json.load(file)
+    return {(result["size"], result["operation"]): result["per_call"] for result in document["results"]}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=1.10)
+    args = parser.parse_args()
+    baseline, candidate = load(args.baseline), load(args.candidate)
+    regressions = 0
+    for key in sorted(baseline.keys() & candidate.keys()):
+        ratio = candidate[key] / baseline[key] if baseline[key] else float("inf")
+        flag = ""
+        if ratio > args.threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(f"{key[0]:>8} {key[1]:<32} {baseline[key] * 1e6:12.2f} us -> {candidate[key] * 1e6:12.2f} us "
+              f"x{ratio:6.2f}{flag}")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Synthetic, reproducible school data for benchmarks.
+"""
+import random
+from typing import Iterator
+
+from src.student import Student
+from src.student_system import StudentSystem
+
+FIRST_NAMES = ["Jan", "Anna", "Adam", "Ewa", "Piotr", "Katarzyna", "Paweł", "Małgorzata", "Tomasz", "Agnieszka",
+               "Michał", "Barbara", "Krzysztof", "Zofia", "Andrzej", "Dąbrówka"]
+LAST_NAMES = ["Kowalski", "Nowak", "Malinowski", "Dąbrowska", "Lis", "Wiśniewski", "Wójcik", "Kamińska",
+              "Lewandowski", "Zieliński", "Szymańska", "Woźniak", "Kozłowski", "Jankowska", "Mazur", "Krawczyk"]
+
+
+def class_names(count: int) -> list[str]:
+    """
+    Returns class grade names such as '1A', '1B', ..., '2A'.
+
+    Args:
+        count (int): Number of classes.
+
+    Returns:
+        list[str]: Class grade names.
+    """
+    return [f"{i // 26 + 1}{chr(ord('A') + i % 26)}" for i in range(count)]
+
+
+def generate_students(students: int, classes: int = 20, majors: int = 5, subjects: int = 8,
+                      grades_per_student: int = 20, years: int = 4, seed: int = 0) -> Iterator[Student]:
+    """
+    Generates students with random grades. The same arguments always give the same data.
+
+    Every student gets a unique (name, last_name, year) key.
+
+    Args:
+        students (int): Number of students.
+        classes (int): Number of distinct classes.
+        majors (int): Number of distinct majors.
+        subjects (int): Number of distinct subjects.
+        grades_per_student (int): Number of grades per student, spread over random subjects.
+        years (int): Number of distinct years, starting at 2021.
+        seed (int): Random seed.
+
+    Yields:
+        Student: Generated students.
+    """
+    rng = random.Random(seed)
+    class_list = class_names(classes)
+    major_list = [f"Major{i}" for i in range(majors)]
+    subject_list = [f"subject{i}" for i in range(subjects)]
+    for i in range(students):
+        student = Student(f"{rng.choice(FIRST_NAMES)}{i}", rng.choice(LAST_NAMES), rng.choice(class_list),
+                          rng.choice(major_list), 2021 + rng.randrange(years))
+        for _ in range(grades_per_student):
+            student.add_grade(rng.choice(subject_list), rng.randint(2, 12) / 2)
+        yield student
+
+
+def generate_system(students: int, **options) -> StudentSystem:
+    """
+    Builds a StudentSystem filled with generated students.
+
+    Args:
+        students (int): Number of students.
+        **options: Further arguments of generate_students.
+
+    Returns:
+        StudentSystem: The populated system.
+    """
+    system = StudentSystem()
+    system.add_students_bulk(generate_students(students, **options))
+    return system
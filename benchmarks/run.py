@@ -0,0 +1,145 @@
+"""
+Times StudentSystem and Student hot paths across roster sizes and writes JSON results.
+
+Usage:
+    python -m benchmarks.run [--sizes 1000 10000 100000] [--repeat 5] [--output results.json]
+
+Compare two result files with benchmarks.compare.
+"""
+import argparse
+import json
+import platform
+import random
+import subprocess
+import time
+from datetime import datetime, timezone
+
+from benchmarks.datagen import generate_system
+
+
+def best_time(function, repeat: int, setup=None, teardown=None) -> float:
+    """
+    Runs a function several times and returns the fastest run.
+
+    Args:
+        function: Callable to time.
+        repeat (int): Number of runs.
+        setup: Optional untimed callable run before every run.
+        teardown: Optional untimed callable run after every run.
+
+    Returns:
+        float: Fastest run time in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+        if teardown is not None:
+            teardown()
+    return best
+
+
+def run_size(size: int, repeat: int, lookups: int) -> list[dict]:
+    """
+    Times every benchmarked operation on a system with the given number of students.
+
+    Args:
+        size (int): Number of students.
+        repeat (int): Number of runs per operation.
+        lookups (int): Number of students looked up or removed per run of the per-student operations.
+
+    Returns:
+        list[dict]: One result per operation with total seconds and seconds per call.
+    """
+    system = generate_system(size)
+    students = system.students
+    rng = random.Random(1)
+    sample = [rng.choice(students) for _ in range(lookups)]
+    keys = [(s.name, s.last_name, s.year) for s in sample]
+    unique_sample = list(dict.fromkeys(sample))
+    year_students = []
+
+    def remove_sample():
+        for key in dict.fromkeys(keys):
+            system.remove_student(*key)
+
+    def collect_year():
+        year_students.extend(s for s in system.iter_students() if s.year == 2021)
+
+    def restore_year():
+        system.add_students_bulk(year_students)
+        year_students.clear()
+
+    operations = [
+        ("find_student", len(keys), lambda: [system.find_student(*key) for key in keys], None, None),
+        ("remove_student", len(unique_sample), remove_sample, None,
+         lambda: system.add_students_bulk(unique_sample)),
+        ("remove_students_from_year", 1, lambda: system.remove_students_from_year(2021), collect_year,
+         restore_year),
+        ("get_class_average", 1, lambda: system.get_class_average("1A"), None, None),
+        ("get_school_average", 1, system.get_school_average, None, None),
+        ("group_stats(class_grade)", 1, system.group_stats, None, None),
+        ("group_stats(subject)", 1, lambda: system.group_stats("subject"), None, None),
+        ("student.average_grade (uncached)", len(sample), lambda: [s.average_grade() for s in sample],
+         lambda: [s._forget_subject_average("") for s in sample], None),
+        ("sort_students_by_class_grade", 1, system.sort_students_by_class_grade, None, None),
+        ("sort_students_by_major", 1, system.sort_students_by_major, None, None),
+        ("sort_class_by_avg_grade", 1, system.sort_class_by_avg_grade, None, None),
+        ("sort_students_by_avg_in_class", 1, lambda: system.sort_students_by_avg_in_class("1A"), None, None),
+        ("top_students", 1, lambda: system.top_students(50), None, None),
+        ("query(class, major).order_by(average).limit", 1,
+         lambda: system.query().where(class_grade="1A", major=students[0].major).order_by("average", desc=True)
+         .limit(20).all(), None, None),
+        ("snapshot + close", 1, lambda: system.snapshot().close(), None, None),
+        ("show_all_students", 1, system.show_all_students, None, None),
+    ]
+    results = []
+    for name, calls, function, setup, teardown in operations:
+        seconds = best_time(function, repeat, setup, teardown)
+        results.append({"size": size, "operation": name, "seconds": seconds, "per_call": seconds / calls})
+    return results
+
+
+def git_revision() -> str | None:
+    """
+    Returns the current git commit, if available.
+
+    Returns:
+        str | None: Commit hash, or None outside a git checkout.
+    """
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--lookups", type=int, default=1_000)
+    parser.add_argument("--output", default="bench_results.json")
+    args = parser.parse_args()
+    results = []
+    for size in args.sizes:
+        for result in run_size(size, args.repeat, args.lookups):
+            print(f"{size:>8} {result['operation']:<32} {result['seconds'] * 1000:10.3f} ms "
+                  f"({result['per_call'] * 1e6:10.2f} us/call)")
+            results.append(result)
+    document = {
+        "meta": {"commit": git_revision(), "python": platform.python_version(),
+                 "machine": platform.machine(), "date": datetime.now(timezone.utc).isoformat(),
+                 "repeat": args.repeat, "lookups": args.lookups},
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(document, file, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Load generator for the asyncio StudentService.
+
+Starts a service on a generated school (or targets a running one with --port) and opens
+many concurrent client connections that send a mix of find, add_grade, class_average and
+top requests. Reports requests per second and latency percentiles.
+
+Usage:
+    python -m benchmarks.service_load [--students 20000] [--clients 50] [--requests 200] [--port PORT]
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from benchmarks.datagen import class_names, generate_system
+from src.service import StudentService
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """
+    Returns a percentile of already sorted values.
+
+    Args:
+        sorted_values (list[float]): Values in ascending order.
+        fraction (float): Percentile as a fraction, e.g. 0.99.
+
+    Returns:
+        float: The value at that percentile.
+    """
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+async def client(host: str, port: int, requests: int, keys: list[tuple], seed: int, latencies: list[float]) -> None:
+    """
+    Sends requests one after another over one connection, recording each latency.
+
+    Args:
+        host (str): Service address.
+        port (int): Service port.
+        requests (int): Number of requests to send.
+        keys (list[tuple]): (name, last_name, year) keys of existing students.
+        seed (int): Random seed for the request mix.
+        latencies (list[float]): List the latencies in seconds are appended to.
+    """
+    rng = random.Random(seed)
+    classes = class_names(20)
+    reader, writer = await asyncio.open_connection(host, port)
+    for request_id in range(requests):
+        name, last_name, year = rng.choice(keys)
+        roll = rng.random()
+        if roll < 0.5:
+            request = {"op": "find", "args": {"name": name, "last_name": last_name, "year": year}}
+        elif roll < 0.8:
+            request = {"op": "add_grade", "args": {"name": name, "last_name": last_name, "year": year,
+                                                   "subject": "math", "grade": rng.randint(2, 12) / 2}}
+        elif roll < 0.97:
+            request = {"op": "class_average", "args": {"class_grade": rng.choice(classes)}}
+        else:
+            request = {"op": "top", "args": {"k": 10, "class_grade": rng.choice(classes)}}
+        request["id"] = request_id
+        start = time.perf_counter()
+        writer.write(json.dumps(request).encode() + b"\n")
+        await writer.drain()
+        response = json.loads(await reader.readline())
+        latencies.append(time.perf_counter() - start)
+        if not response["ok"]:
+            raise RuntimeError(response["error"])
+    writer.close()
+    await writer.wait_closed()
+
+
+async def run(args: argparse.Namespace) -> None:
+    """
+    Runs all clients against the service and prints throughput and latency percentiles.
+
+    Args:
+        args (argparse.Namespace): Parsed command-line options.
+    """
+    system = generate_system(args.students)
+    keys = [(s.name, s.last_name, s.year) for s in system.students]
+    service = server = None
+    port = args.port
+    if port is None:
+        service = StudentService(system)
+        server = await service.start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+    latencies: list[float] = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client("127.0.0.1", port, args.requests, keys, seed, latencies)
+                           for seed in range(args.clients)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    print(f"{len(latencies)} requests from {args.clients} clients in {elapsed:.2f} s: "
+          f"{len(latencies) / elapsed:.0f} requests/s")
+    print(f"latency p50={percentile(latencies, 0.5) * 1000:.2f} ms p95={percentile(latencies, 0.95) * 1000:.2f} ms "
+          f"p99={percentile(latencies, 0.99) * 1000:.2f} ms max={latencies[-1] * 1000:.2f} ms")
+    if service is not None:
+        print(f"{service.requests} requests served in {service.batches} batches")
+        await service.stop(server)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--students", type=int, default=20_000)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--port", type=int, default=None, help="target a running service (it must serve the same generated school)")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
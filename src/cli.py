@@ -0,0 +1,297 @@
+"""
+Command-line interface for running StudentSystem operations from scripts and cron jobs.
+
+Every command loads the system from --db, runs, and leaves its changes persisted there. A
+--db path ending in .db, .sqlite or .sqlite3 is a SQLite database (SQLiteStorage); any other
+path is a directory with a snapshot and a journal (JournalStorage). Without a command, the
+interactive menu is started on the same data.
+
+Usage:
+    python -m src.cli [--db students_data] import students.csv [--format csv|jsonl]
+    python -m src.cli export [--output students.csv] [--format csv|jsonl|text] [--summary]
+                             [--class 2B] [--major math] [--year 2024]
+    python -m src.cli stats [--by class_grade|major|year|subject]
+    python -m src.cli rank [-k 10] [--class 2B] [--major math] [--bottom]
+    python -m src.cli find "jan kow" [--limit 10] [--fuzzy]
+    python -m src.cli script commands.txt
+
+A script holds one command per line (without 'python -m src.cli' and --db), '#' starts a
+comment. All lines run in one process on one loaded system; the script stops at the first
+failing line.
+
+Heavy modules (storage backends, importer, exporter, statistics) are only imported by the
+commands that need them, so short commands start quickly.
+"""
+import argparse
+import shlex
+import sys
+
+DEFAULT_DB = "students_data"
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+
+def open_storage(path: str):
+    """
+    Opens the storage backend matching a --db path.
+
+    Args:
+        path (str): SQLite database file or journal directory.
+
+    Returns:
+        Storage: The (not yet loaded) storage.
+    """
+    if path.endswith(SQLITE_SUFFIXES):
+        from src.storage import SQLiteStorage
+        return SQLiteStorage(path)
+    from src.journal import JournalStorage
+    return JournalStorage(path)
+
+
+def _student_line(position: int, student) -> str:
+    """
+    Formats one student of a ranking or search result.
+
+    Args:
+        position (int): Position in the result (1-based).
+        student (Student): Student to format.
+
+    Returns:
+        str: Position, name, class, major, year and average grade.
+    """
+    average = f"{student.average_grade():.2f}" if student._grade_count else "-"
+    return (f"{position:>4}. {student.name + ' ' + student.last_name:<40} {student.class_grade:<6} "
+            f"{student.major:<16} {student.year:<6} average={average}")
+
+
+def _import(system, args, out) -> int:
+    """
+    Imports students and grades from a CSV or JSON-lines file.
+
+    Args:
+        system (StudentSystem): System to import into.
+        args (argparse.Namespace): Parsed command line.
+        out (TextIO): Output stream.
+
+    Returns:
+        int: Exit status.
+    """
+    from src.importer import import_file
+    report = import_file(system, args.path, args.format)
+    print(report, file=out)
+    for error in report.errors:
+        print(f"{args.path}:{error.line}: {error.message}", file=sys.stderr)
+    return 0
+
+
+def _export(system, args, out) -> int:
+    """
+    Exports the students (or their summaries) matching the filters.
+
+    Args:
+        system (StudentSystem): System to export from.
+        args (argparse.Namespace): Parsed command line.
+        out (TextIO): Output stream, used when no output file is given.
+
+    Returns:
+        int: Exit status.
+    """
+    from src.exporter import export_students, export_summaries
+    filters = {field: value for field, value in (("class_grade", args.class_grade), ("major", args.major),
+                                                  ("year", args.year)) if value is not None}
+    students = system.query().where(**filters)
+    export = export_summaries if args.summary else export_students
+    if args.output == "-":
+        export(students, out, args.format)
+    else:
+        with open(args.output, "w", newline="", encoding="utf-8") as file:
+            export(students, file, args.format)
+    return 0
+
+
+def _stats(system, args, out) -> int:
+    """
+    Prints the school average and grade statistics per group.
+
+    Args:
+        system (StudentSystem): System to summarise.
+        args (argparse.Namespace): Parsed command line.
+        out (TextIO): Output stream.
+
+    Returns:
+        int: Exit status.
+    """
+    stats = system.group_stats(args.by)
+    try:
+        school_average = f"{system.get_school_average():.2f}"
+    except ValueError:  # no grades yet
+        school_average = "-"
+    lines = [f"school: {system.get_student_count()} students, average {school_average}",
+             f"{args.by:<16} {'students':>8} {'grades':>8} {'mean':>6} {'min':>5} {'max':>5} {'stdev':>6}"]
+    for key, group in stats.items():
+        if group.count:
+            values = f"{group.mean:>6.2f} {group.min:>5.2f} {group.max:>5.2f} {group.stdev:>6.2f}"
+        else:
+            values = f"{'-':>6} {'-':>5} {'-':>5} {'-':>6}"
+        lines.append(f"{str(key):<16} {group.students:>8} {group.count:>8} {values}")
+    print("\n".join(lines), file=out)
+    return 0
+
+
+def _rank(system, args, out) -> int:
+    """
+    Prints the best (or worst) students by average grade.
+
+    Args:
+        system (StudentSystem): System to rank.
+        args (argparse.Namespace): Parsed command line.
+        out (TextIO): Output stream.
+
+    Returns:
+        int: Exit status.
+    """
+    select = system.bottom_students if args.bottom else system.top_students
+    students = select(args.k, class_grade=args.class_grade, major=args.major)
+    print("\n".join(_student_line(position, s) for position, s in enumerate(students, start=1)), file=out)
+    return 0
+
+
+def _find(system, args, out) -> int:
+    """
+    Prints the students whose name starts with the query, or is close to it.
+
+    Args:
+        system (StudentSystem): System to search.
+        args (argparse.Namespace): Parsed command line.
+        out (TextIO): Output stream.
+
+    Returns:
+        int: Exit status.
+    """
+    query = " ".join(args.query)
+    students = [] if args.fuzzy else system.search_students(query, args.limit)
+    if not students:
+        students = system.fuzzy_search_students(query, limit=args.limit)
+    if not students:
+        print("No students found", file=sys.stderr)
+        return 0
+    print("\n".join(_student_line(position, s) for position, s in enumerate(students, start=1)), file=out)
+    return 0
+
+
+def _script(system, args, out) -> int:
+    """
+    Runs a file of commands, one per line, on the already loaded system.
+
+    Args:
+        system (StudentSystem): System to run the commands on.
+        args (argparse.Namespace): Parsed command line.
+        out (TextIO): Output stream.
+
+    Returns:
+        int: 0 if every line succeeded, otherwise 1 (the script stops at the failing line).
+    """
+    parser = build_parser()
+    file = sys.stdin if args.path == "-" else open(args.path, encoding="utf-8")
+    try:
+        for number, line in enumerate(file, start=1):
+            argv = shlex.split(line, comments=True)
+            if not argv:
+                continue
+            try:
+                command = parser.parse_args(argv)
+            except SystemExit:
+                print(f"{args.path}:{number}: invalid command", file=sys.stderr)
+                return 1
+            if command.db is not None or command.command in (None, "script"):
+                print(f"{args.path}:{number}: only single commands can be used in a script", file=sys.stderr)
+                return 1
+            try:
+                status = command.handler(system, command, out)
+            except (ValueError, OSError) as e:
+                print(f"{args.path}:{number}: {e}", file=sys.stderr)
+                return 1
+            if status:
+                return status
+    finally:
+        if file is not sys.stdin:
+            file.close()
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Builds the command-line parser.
+
+    Returns:
+        argparse.ArgumentParser: Parser of the global options and the subcommands.
+    """
+    parser = argparse.ArgumentParser(prog="python -m src.cli", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db", help=f"SQLite database file or journal directory (default: {DEFAULT_DB})")
+    commands = parser.add_subparsers(dest="command", metavar="command")
+
+    command = commands.add_parser("import", help="import students and grades from a CSV or JSON-lines file")
+    command.add_argument("path")
+    command.add_argument("--format", choices=("csv", "jsonl"), help="file format (default: from the extension)")
+    command.set_defaults(handler=_import)
+
+    command = commands.add_parser("export", help="export students or their summaries")
+    command.add_argument("--output", default="-", help="output file (default: standard output)")
+    command.add_argument("--format", choices=("csv", "jsonl", "text"), default="csv")
+    command.add_argument("--summary", action="store_true", help="export summaries with averages instead of data")
+    command.add_argument("--class", dest="class_grade")
+    command.add_argument("--major")
+    command.add_argument("--year", type=int)
+    command.set_defaults(handler=_export)
+
+    command = commands.add_parser("stats", help="show the school average and grade statistics per group")
+    command.add_argument("--by", choices=("class_grade", "major", "year", "subject"), default="class_grade")
+    command.set_defaults(handler=_stats)
+
+    command = commands.add_parser("rank", help="show the students with the highest (or lowest) average")
+    command.add_argument("-k", type=int, default=10, help="number of students (default: 10)")
+    command.add_argument("--class", dest="class_grade")
+    command.add_argument("--major")
+    command.add_argument("--bottom", action="store_true", help="lowest averages first")
+    command.set_defaults(handler=_rank)
+
+    command = commands.add_parser("find", help="find students by (the beginning of) their name")
+    command.add_argument("query", nargs="+")
+    command.add_argument("--limit", type=int, default=10)
+    command.add_argument("--fuzzy", action="store_true", help="only use typo-tolerant matching")
+    command.set_defaults(handler=_find)
+
+    command = commands.add_parser("script", help="run a file of commands in one process ('-' reads standard input)")
+    command.add_argument("path")
+    command.set_defaults(handler=_script)
+    return parser
+
+
+def main(argv: list[str] | None = None, out=None) -> int:
+    """
+    Runs one command (or the interactive menu) on the stored system.
+
+    Args:
+        argv (list[str] | None): Command-line arguments; None uses sys.argv.
+        out (TextIO | None): Output stream; None uses sys.stdout.
+
+    Returns:
+        int: Exit status.
+    """
+    args = build_parser().parse_args(argv)
+    out = sys.stdout if out is None else out
+    with open_storage(args.db or DEFAULT_DB) as storage:
+        system = storage.load()
+        if args.command is None:
+            from src.menu import main_menu
+            main_menu(system)
+            return 0
+        try:
+            return args.handler(system, args, out)
+        except (ValueError, OSError) as e:
+            print(f"error: {e}", file=sys.stderr)
+            return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,247 @@
+import functools
+import threading
+from contextlib import contextmanager
+
+from src.student import Student
+from src.student_system import StudentSystem
+
+
+class ReadWriteLock:
+    """
+    Lock allowing many concurrent readers or one exclusive writer.
+
+    Writers are preferred: once a writer waits, new readers wait too, so a steady stream of
+    reads cannot starve an importer. The lock is reentrant per thread: a reader may read again
+    and a writer may read or write again. Upgrading a read lock to a write lock is not allowed.
+    """
+
+    def __init__(self):
+        """
+        Initializes an unlocked lock.
+        """
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer: int | None = None
+        self._write_depth = 0
+        self._waiting_writers = 0
+        self._local = threading.local()
+
+    def acquire_read(self) -> None:
+        """
+        Acquires the lock for reading, waiting while a writer holds it or waits for it.
+        """
+        local = self._local
+        if self._writer == threading.get_ident():
+            local.reads_in_write = getattr(local, "reads_in_write", 0) + 1
+            return
+        reads = getattr(local, "reads", 0)
+        if reads:
+            local.reads = reads + 1
+            return
+        with self._condition:
+            while self._writer is not None or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+        local.reads = 1
+
+    def release_read(self) -> None:
+        """
+        Releases a read acquisition made by the current thread.
+        """
+        local = self._local
+        if self._writer == threading.get_ident() and getattr(local, "reads_in_write", 0):
+            local.reads_in_write -= 1
+            return
+        local.reads -= 1
+        if local.reads == 0:
+            with self._condition:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._condition.notify_all()
+
+    def acquire_write(self) -> None:
+        """
+        Acquires the lock for writing, waiting until no other thread reads or writes.
+
+        Raises:
+            RuntimeError: If the current thread holds the lock only for reading.
+        """
+        me = threading.get_ident()
+        if self._writer == me:
+            self._write_depth += 1
+            return
+        if getattr(self._local, "reads", 0):
+            raise RuntimeError("Cannot upgrade a read lock to a write lock")
+        with self._condition:
+            self._waiting_writers += 1
+            while self._writer is not None or self._readers:
+                self._condition.wait()
+            self._waiting_writers -= 1
+            self._writer = me
+            self._write_depth = 1
+
+    def release_write(self) -> None:
+        """
+        Releases a write acquisition made by the current thread.
+        """
+        self._write_depth -= 1
+        if self._write_depth == 0:
+            with self._condition:
+                self._writer = None
+                self._condition.notify_all()
+
+    @contextmanager
+    def read_locked(self):
+        """
+        Holds the lock for reading for the duration of a with block.
+        """
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_locked(self):
+        """
+        Holds the lock for writing for the duration of a with block.
+        """
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+_READ_METHODS = ("find_student", "show_all_students", "get_student_count", "get_class_average",
+                 "get_school_average", "group_stats", "get_students_from_major", "sort_students_by_class_grade",
+                 "sort_students_by_major", "sort_class_by_avg_grade", "get_students_by_class",
+                 "sort_students_by_avg_in_class", "top_students", "bottom_students")
+
+_WRITE_METHODS = ("add_student", "add_students_bulk", "remove_student", "remove_students_from_year",
+                  "enable_gradebook", "disable_gradebook", "add_listener", "remove_listener",
+                  "search_students", "fuzzy_search_students", "grade_percentile", "grade_histogram",
+                  "get_subject_average", "get_subject_grade_count", "get_students_with_subject",
+                  "top_students_in_subject", "get_subject_class_averages", "_close_version")
+
+
+def _locked(name: str, write: bool):
+    """
+    Builds a method that calls the StudentSystem method of the same name under the system lock.
+
+    The StudentSystem method is looked up on every call, so instrumentation enabled later applies.
+
+    Args:
+        name (str): Name of the StudentSystem method.
+        write (bool): Whether the method needs the write lock.
+
+    Returns:
+        Callable: The locking method.
+    """
+    @functools.wraps(getattr(StudentSystem, name))
+    def method(self, *args, **kwargs):
+        lock = self._lock.write_locked() if write else self._lock.read_locked()
+        with lock:
+            return getattr(StudentSystem, name)(self, *args, **kwargs)
+    return method
+
+
+class ConcurrentStudentSystem(StudentSystem):
+    """
+    StudentSystem that can be shared between threads.
+
+    Every StudentSystem method takes a shared read lock or an exclusive write lock, so many
+    lookups, averages and sorts run at once while additions and removals (including the whole
+    of remove_students_from_year) are atomic. Sorts and averages see a consistent state.
+    Name searches, grade percentiles and subject queries take the write lock, as their indexes
+    are built (and the name list re-sorted) on demand.
+
+    Changes made directly on Student objects (add_grade, change_class_grade, ...) must happen
+    inside writing(), and code reading several values of a student should use reading().
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty system with its own read/write lock.
+        """
+        super().__init__()
+        self._lock = ReadWriteLock()
+
+    def reading(self):
+        """
+        Returns a context manager holding the system's read lock.
+
+        Returns:
+            ContextManager: Read lock for a with block.
+        """
+        return self._lock.read_locked()
+
+    def writing(self):
+        """
+        Returns a context manager holding the system's write lock, e.g. around Student changes.
+
+        Returns:
+            ContextManager: Write lock for a with block.
+        """
+        return self._lock.write_locked()
+
+    @property
+    def students(self) -> list[Student]:
+        """
+        Returns a consistent copy of all students in the order they were added.
+
+        Returns:
+            list[Student]: A new list with every student in the system.
+        """
+        with self._lock.read_locked():
+            return list(self._roster)
+
+    def iter_students(self):
+        """
+        Iterates over a consistent copy of the roster, so no lock is held between items.
+
+        Yields:
+            Student: Each student in the system.
+        """
+        yield from self.students
+
+    def iter_student_lines(self):
+        """
+        Streams the lines of show_all_students from a consistent copy of the roster.
+
+        Yields:
+            str: A student's name and class grade.
+        """
+        for s in self.students:
+            yield f"{s.name} {s.last_name} {s.class_grade}"
+
+    def snapshot(self):
+        """
+        Takes a version of the system under the write lock; its reads take the read lock only
+        for as long as each read, so a report never blocks writers for its whole run.
+
+        Returns:
+            SystemVersion: The read-only version.
+        """
+        with self._lock.write_locked():
+            return self._open_version(self._lock.read_locked)
+
+    def _run_query(self, query):
+        """
+        Executes a query under the read lock and returns a copy of its results, so no lock is held between items.
+
+        Args:
+            query (Query): Query to execute.
+
+        Returns:
+            Iterator[Student]: The results of the query.
+        """
+        with self._lock.read_locked():
+            return iter(list(query._run()))
+
+
+for _name in _READ_METHODS:
+    setattr(ConcurrentStudentSystem, _name, _locked(_name, write=False))
+for _name in _WRITE_METHODS:
+    setattr(ConcurrentStudentSystem, _name, _locked(_name, write=True))
+del _name
@@ -0,0 +1,302 @@
+import threading
+import time
+from collections import deque
+from typing import NamedTuple
+
+from src.student import Student
+
+DEFAULT_MAXSIZE = 10_000
+
+
+class StudentAdded(NamedTuple):
+    """
+    A student was added to the system (add_student, add_students_bulk).
+    """
+    student: Student
+
+
+class StudentRemoved(NamedTuple):
+    """
+    A student was removed from the system (remove_student, remove_students_from_year).
+    """
+    student: Student
+
+
+class GradeAdded(NamedTuple):
+    """
+    A grade was added (Student.add_grade).
+    """
+    student: Student
+    subject: str
+    grade: float
+
+
+class GradeRemoved(NamedTuple):
+    """
+    The last grade of a subject was removed (Student.remove_last_grade).
+    """
+    student: Student
+    subject: str
+    grade: float
+
+
+class SubjectDeleted(NamedTuple):
+    """
+    All grades of a subject were deleted (Student.delete_subject).
+    """
+    student: Student
+    subject: str
+    grades: tuple[float, ...]
+    removed_sum: float
+
+
+class GradesCleared(NamedTuple):
+    """
+    All grades of a student were deleted (Student.delete_all_grades).
+    """
+    student: Student
+    grades: dict[str, tuple[float, ...]]
+    removed_sum: float
+    removed_count: int
+
+
+class StudentRenamed(NamedTuple):
+    """
+    A student's name changed (Student.change_name); the event holds the previous name.
+    """
+    student: Student
+    old_name: str
+    old_last_name: str
+
+
+class ClassChanged(NamedTuple):
+    """
+    A student moved to another class (Student.change_class_grade); the event holds the previous class.
+    """
+    student: Student
+    old_class_grade: str
+
+
+class MajorChanged(NamedTuple):
+    """
+    A student's major changed (Student.change_major); the event holds the previous major.
+    """
+    student: Student
+    old_major: str
+
+
+class StudentChanged(NamedTuple):
+    """
+    Coalesced event: a student present before and after the batch changed in any way
+    (grades, name, class, major, or was removed and added again).
+    """
+    student: Student
+
+
+class EventBatch(NamedTuple):
+    """
+    Events taken from a stream by EventStream.poll.
+
+    If overflowed is True, the stream dropped events since the previous poll because it was full,
+    so the consumer should rebuild its state from the system instead of applying the events alone.
+    """
+    events: list
+    overflowed: bool
+
+
+def to_event(change: str, student: Student, *args):
+    """
+    Builds the typed event of a change reported to a StudentSystem listener.
+
+    Grades in the event are copied into tuples, so consumers cannot alter the system through them.
+
+    Args:
+        change (str): Kind of change, e.g. 'grade_added'.
+        student (Student): The affected student.
+        *args: Change details.
+
+    Returns:
+        The event, e.g. GradeAdded(student, 'math', 4.5).
+
+    Raises:
+        ValueError: If the change is unknown.
+    """
+    if change == "grade_added":
+        return GradeAdded(student, *args)
+    if change == "grade_removed":
+        return GradeRemoved(student, *args)
+    if change == "subject_deleted":
+        subject, grades_list, removed_sum = args
+        return SubjectDeleted(student, subject, tuple(grades_list), removed_sum)
+    if change == "grades_cleared":
+        old_grades, removed_sum, removed_count = args
+        grades = {subject: tuple(grades_list) for subject, grades_list in old_grades.items()}
+        return GradesCleared(student, grades, removed_sum, removed_count)
+    if change == "renamed":
+        return StudentRenamed(student, *args)
+    if change == "class_changed":
+        return ClassChanged(student, *args)
+    if change == "major_changed":
+        return MajorChanged(student, *args)
+    if change == "student_added":
+        return StudentAdded(student)
+    if change == "student_removed":
+        return StudentRemoved(student)
+    raise ValueError(f"Unknown change: {change}")
+
+
+class EventStream:
+    """
+    Bounded queue of the typed change events of a StudentSystem, created by StudentSystem.subscribe.
+
+    Writers only append to the queue; consumers take events in batches with poll, from any
+    thread, and apply them incrementally instead of rescanning the roster. When the queue is
+    full the oldest events are dropped and the next batch is flagged as overflowed.
+
+    With coalesce=True the stream keeps at most one event per student, the net effect of
+    everything that happened to it since the last poll: StudentAdded, StudentRemoved or
+    StudentChanged (a student added and removed again within a batch is left out). maxsize then
+    bounds the number of students, and a consumer only re-reads each changed student once.
+    """
+
+    def __init__(self, system, maxsize: int = DEFAULT_MAXSIZE, coalesce: bool = False):
+        """
+        Initializes an empty stream; StudentSystem.subscribe registers it with the system.
+
+        Args:
+            system (StudentSystem): The system the events come from.
+            maxsize (int): Maximum number of queued events (coalesced: students).
+            coalesce (bool): Whether to merge the events of each student.
+
+        Raises:
+            ValueError: If maxsize is not positive.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+        self._system = system
+        self.maxsize = maxsize
+        self.coalesce = coalesce
+        self._events: deque = deque()
+        self._students: dict[Student, type] = {}
+        self._overflowed = False
+        self._closed = False
+        self._condition = threading.Condition(threading.Lock())
+
+    def __len__(self) -> int:
+        """
+        Returns the number of queued events.
+
+        Returns:
+            int: Queued events (coalesced: students with a pending event).
+        """
+        return len(self._students) if self.coalesce else len(self._events)
+
+    @property
+    def closed(self) -> bool:
+        """
+        Returns whether the stream has been unsubscribed from its system.
+
+        Returns:
+            bool: True once close has been called.
+        """
+        return self._closed
+
+    def _on_change(self, change: str, student: Student, *args) -> None:
+        """
+        Queues the event of a change; registered as a StudentSystem listener.
+
+        Args:
+            change (str): Kind of change reported by the system.
+            student (Student): The affected student.
+            *args: Change details.
+        """
+        with self._condition:
+            if self.coalesce:
+                self._coalesce(change, student)
+            else:
+                if len(self._events) >= self.maxsize:
+                    self._events.popleft()
+                    self._overflowed = True
+                self._events.append(to_event(change, student, *args))
+            self._condition.notify_all()
+
+    def _coalesce(self, change: str, student: Student) -> None:
+        """
+        Merges a change into the pending event of its student.
+
+        Args:
+            change (str): Kind of change reported by the system.
+            student (Student): The affected student.
+        """
+        students = self._students
+        pending = students.get(student)
+        if change == "student_added":
+            event = StudentAdded if pending is None else StudentChanged
+        elif change == "student_removed":
+            if pending is StudentAdded:
+                del students[student]
+                return
+            event = StudentRemoved
+        else:
+            event = pending or StudentChanged
+        if pending is None and len(students) >= self.maxsize:
+            del students[next(iter(students))]
+            self._overflowed = True
+        students[student] = event
+
+    def poll(self, max_events: int | None = None, timeout: float | None = 0) -> EventBatch:
+        """
+        Takes the oldest queued events, waiting for the first one if asked to.
+
+        Args:
+            max_events (int | None): Maximum number of events to take, or None for all.
+            timeout (float | None): Seconds to wait while the stream is empty; 0 returns at
+                                    once and None waits until an event arrives or the stream is closed.
+
+        Returns:
+            EventBatch: The events in the order they happened and whether any were dropped before them.
+        """
+        with self._condition:
+            if timeout != 0:
+                deadline = None if timeout is None else time.monotonic() + timeout
+                while not len(self) and not self._closed:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+            if self.coalesce:
+                students = self._students
+                taken = list(students.items())[:max_events]
+                for student, _ in taken:
+                    del students[student]
+                events = [event(student) for student, event in taken]
+            else:
+                count = len(self._events) if max_events is None else min(max_events, len(self._events))
+                events = [self._events.popleft() for _ in range(count)]
+            overflowed, self._overflowed = self._overflowed, False
+            return EventBatch(events, overflowed)
+
+    def close(self) -> None:
+        """
+        Unsubscribes the stream from the system; queued events can still be polled.
+        """
+        if not self._closed:
+            self._system.remove_listener(self._on_change)
+            with self._condition:
+                self._closed = True
+                self._condition.notify_all()
+
+    def __enter__(self):
+        """
+        Returns the stream itself for use in a with block.
+
+        Returns:
+            EventStream: This stream.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Unsubscribes the stream at the end of a with block.
+        """
+        self.close()
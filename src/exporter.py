@@ -0,0 +1,210 @@
+import csv
+import io
+import json
+from typing import Iterable, Iterator, TextIO
+
+from src.importer import STUDENT_FIELDS
+from src.student import Student
+
+SUMMARY_FIELDS = ("name", "class", "major", "year", "subjects", "total_grades", "average")
+
+COLUMN_WIDTHS = {"name": 24, "last_name": 20, "class_grade": 6, "class": 6, "major": 16, "year": 6,
+                 "subjects": 9, "total_grades": 13, "average": 8}
+
+
+def student_rows(students: Iterable[Student]) -> Iterator[dict[str, object]]:
+    """
+    Streams the basic data of students as rows (the columns the importer reads).
+
+    Args:
+        students (Iterable[Student]): Students to export, e.g. StudentSystem.iter_students().
+
+    Yields:
+        dict[str, object]: One row per student.
+    """
+    for student in students:
+        yield {"name": student.name, "last_name": student.last_name, "class_grade": student.class_grade,
+               "major": student.major, "year": student.year}
+
+
+def summary_rows(students: Iterable[Student]) -> Iterator[dict[str, object]]:
+    """
+    Streams Student.get_student_summary for each student.
+
+    Args:
+        students (Iterable[Student]): Students to export.
+
+    Yields:
+        dict[str, object]: One summary per student.
+    """
+    for student in students:
+        yield student.get_student_summary()
+
+
+def _chunks(lines: Iterable[str], chunk_rows: int) -> Iterator[str]:
+    """
+    Groups lines into text chunks of up to chunk_rows lines.
+
+    Args:
+        lines (Iterable[str]): Lines, each ending with a newline.
+        chunk_rows (int): Maximum number of lines per chunk.
+
+    Yields:
+        str: Joined chunks of lines.
+    """
+    buffer = []
+    for line in lines:
+        buffer.append(line)
+        if len(buffer) >= chunk_rows:
+            yield "".join(buffer)
+            buffer.clear()
+    if buffer:
+        yield "".join(buffer)
+
+
+def iter_csv(rows: Iterable[dict], fields: tuple[str, ...], chunk_rows: int = 1000) -> Iterator[str]:
+    """
+    Streams rows as CSV text chunks, starting with a header line.
+
+    Args:
+        rows (Iterable[dict]): Rows to export.
+        fields (tuple[str, ...]): Columns to write, in order.
+        chunk_rows (int): Number of rows per chunk.
+
+    Yields:
+        str: CSV text chunks.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(fields)
+    written = 0
+    for row in rows:
+        writer.writerow(["" if row[field] is None else row[field] for field in fields])
+        written += 1
+        if written % chunk_rows == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def iter_jsonl(rows: Iterable[dict], fields: tuple[str, ...], chunk_rows: int = 1000) -> Iterator[str]:
+    """
+    Streams rows as JSON-lines text chunks.
+
+    Args:
+        rows (Iterable[dict]): Rows to export.
+        fields (tuple[str, ...]): Keys to write, in order.
+        chunk_rows (int): Number of rows per chunk.
+
+    Yields:
+        str: JSON-lines text chunks.
+    """
+    lines = (json.dumps({field: row[field] for field in fields}, ensure_ascii=False) + "\n" for row in rows)
+    yield from _chunks(lines, chunk_rows)
+
+
+def _fixed_width_cell(value: object, width: int) -> str:
+    """
+    Formats one value padded or cut to the given width.
+
+    Args:
+        value (object): Value to format; floats get two decimals, None becomes '-'.
+        width (int): Width of the column.
+
+    Returns:
+        str: The formatted cell.
+    """
+    if value is None:
+        text = "-"
+    elif isinstance(value, float):
+        text = f"{value:.2f}"
+    else:
+        text = str(value)
+    return text[:width - 1].ljust(width)
+
+
+def iter_fixed_width(rows: Iterable[dict], fields: tuple[str, ...], chunk_rows: int = 1000) -> Iterator[str]:
+    """
+    Streams rows as a fixed-width text table, starting with a header line.
+
+    Args:
+        rows (Iterable[dict]): Rows to export.
+        fields (tuple[str, ...]): Columns to write, in order.
+        chunk_rows (int): Number of rows per chunk.
+
+    Yields:
+        str: Text chunks.
+    """
+    widths = [COLUMN_WIDTHS.get(field, 12) for field in fields]
+    header = "".join(field[:width - 1].ljust(width) for field, width in zip(fields, widths)).rstrip() + "\n"
+    lines = ("".join(_fixed_width_cell(row[field], width) for field, width in zip(fields, widths)).rstrip() + "\n"
+             for row in rows)
+    yield header
+    yield from _chunks(lines, chunk_rows)
+
+
+FORMATS = {"csv": iter_csv, "jsonl": iter_jsonl, "text": iter_fixed_width}
+
+
+def export_rows(rows: Iterable[dict], file: TextIO, fields: tuple[str, ...], file_format: str = "csv",
+                chunk_rows: int = 1000) -> None:
+    """
+    Writes rows to a file in chunks, so memory use stays flat however many rows there are.
+
+    Args:
+        rows (Iterable[dict]): Rows to export, e.g. from student_rows or summary_rows.
+        file (TextIO): Open text file (or sys.stdout) to write to.
+        fields (tuple[str, ...]): Columns to write, in order.
+        file_format (str): 'csv', 'jsonl' or 'text' (fixed-width).
+        chunk_rows (int): Number of rows written per chunk.
+
+    Raises:
+        ValueError: If the file format is not supported.
+    """
+    if file_format not in FORMATS:
+        raise ValueError(f"Unsupported file format: {file_format}")
+    for chunk in FORMATS[file_format](rows, fields, chunk_rows):
+        file.write(chunk)
+
+
+def export_students(students: Iterable[Student], file: TextIO, file_format: str = "csv",
+                    chunk_rows: int = 1000) -> None:
+    """
+    Writes the basic data of students to a file; CSV and JSON-lines output can be re-imported.
+
+    Args:
+        students (Iterable[Student]): Students to export, e.g. a sorted view.
+        file (TextIO): Open text file (or sys.stdout) to write to.
+        file_format (str): 'csv', 'jsonl' or 'text' (fixed-width).
+        chunk_rows (int): Number of rows written per chunk.
+    """
+    export_rows(student_rows(students), file, STUDENT_FIELDS, file_format, chunk_rows)
+
+
+def export_summaries(students: Iterable[Student], file: TextIO, file_format: str = "csv",
+                     chunk_rows: int = 1000) -> None:
+    """
+    Writes a summary (Student.get_student_summary) of each student to a file.
+
+    Args:
+        students (Iterable[Student]): Students to export.
+        file (TextIO): Open text file (or sys.stdout) to write to.
+        file_format (str): 'csv', 'jsonl' or 'text' (fixed-width).
+        chunk_rows (int): Number of rows written per chunk.
+    """
+    export_rows(summary_rows(students), file, SUMMARY_FIELDS, file_format, chunk_rows)
+
+
+def write_lines(lines: Iterable[str], file: TextIO, chunk_rows: int = 1000) -> None:
+    """
+    Writes lines (without trailing newlines) to a file in chunks instead of one print per line.
+
+    Args:
+        lines (Iterable[str]): Lines to write.
+        file (TextIO): Open text file (or sys.stdout) to write to.
+        chunk_rows (int): Number of lines written per chunk.
+    """
+    for chunk in _chunks((line + "\n" for line in lines), chunk_rows):
+        file.write(chunk)
@@ -0,0 +1,350 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; StudentSystem falls back to pure Python.
+    np = None
+
+from src.student import GRADE_MAX, GRADE_MIN, Student
+
+
+class GradeBook:
+    """
+    Columnar store of every grade in a StudentSystem, backed by NumPy arrays.
+
+    Each grade is one row in three parallel arrays (student id, subject id, value).
+    Statistics are computed with vectorised grouped reductions (np.bincount) instead of
+    Python loops over students. Removed grades are marked dead and compacted away in bulk.
+    """
+
+    _INITIAL_CAPACITY = 1024
+
+    def __init__(self):
+        """
+        Initializes an empty GradeBook.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+        if np is None:
+            raise ImportError("GradeBook requires NumPy")
+        self._student_ids: dict[Student, int] = {}
+        self._student_class = np.zeros(self._INITIAL_CAPACITY, dtype=np.int32)
+        self._student_major = np.zeros(self._INITIAL_CAPACITY, dtype=np.int32)
+        self._free_student_ids: list[int] = []
+        self._next_student_id = 0
+        self._classes: dict[str, int] = {}
+        self._majors: dict[str, int] = {}
+        self._subjects: dict[str, int] = {}
+        self._row_student = np.zeros(self._INITIAL_CAPACITY, dtype=np.int32)
+        self._row_subject = np.zeros(self._INITIAL_CAPACITY, dtype=np.int32)
+        self._row_value = np.zeros(self._INITIAL_CAPACITY, dtype=np.float64)
+        self._row_live = np.zeros(self._INITIAL_CAPACITY, dtype=bool)
+        self._rows: dict[int, dict[int, list[int]]] = {}
+        self._size = 0
+        self._dead = 0
+
+    @staticmethod
+    def _intern(table: dict[str, int], value: str) -> int:
+        """
+        Returns the id of a string in a string table, adding it if needed.
+
+        Args:
+            table (dict[str, int]): String table.
+            value (str): String to look up.
+
+        Returns:
+            int: Id of the string.
+        """
+        value_id = table.get(value)
+        if value_id is None:
+            value_id = table[value] = len(table)
+        return value_id
+
+    @staticmethod
+    def _grow(column, needed: int):
+        """
+        Returns the column itself, or a copy with doubled capacity if it is too small.
+
+        Args:
+            column (np.ndarray): Column to grow.
+            needed (int): Required number of slots.
+
+        Returns:
+            np.ndarray: Column with at least the needed capacity.
+        """
+        if needed <= len(column):
+            return column
+        grown = np.zeros(max(needed, 2 * len(column)), dtype=column.dtype)
+        grown[:len(column)] = column
+        return grown
+
+    def add_student(self, student: Student) -> None:
+        """
+        Registers a student and all of their current grades.
+
+        Args:
+            student (Student): Student to register.
+        """
+        if self._free_student_ids:
+            student_id = self._free_student_ids.pop()
+        else:
+            student_id = self._next_student_id
+            self._next_student_id += 1
+            self._student_class = self._grow(self._student_class, self._next_student_id)
+            self._student_major = self._grow(self._student_major, self._next_student_id)
+        self._student_ids[student] = student_id
+        self._student_class[student_id] = self._intern(self._classes, student.class_grade)
+        self._student_major[student_id] = self._intern(self._majors, student.major.lower())
+        self._rows[student_id] = {}
+        for subject, grades_list in student._grades.items():
+            for grade in grades_list:
+                self._append(student_id, subject, grade)
+
+    def remove_student(self, student: Student) -> None:
+        """
+        Unregisters a student and drops all of their grades.
+
+        Args:
+            student (Student): Registered student.
+        """
+        student_id = self._student_ids.pop(student)
+        for rows in self._rows.pop(student_id).values():
+            self._kill(rows)
+        self._free_student_ids.append(student_id)
+        self._maybe_compact()
+
+    def _append(self, student_id: int, subject: str, grade: float) -> None:
+        """
+        Appends one grade row.
+
+        Args:
+            student_id (int): Id of the student.
+            subject (str): Name of the subject.
+            grade (float): Grade value.
+        """
+        row = self._size
+        if row == len(self._row_value):
+            self._row_student = self._grow(self._row_student, row + 1)
+            self._row_subject = self._grow(self._row_subject, row + 1)
+            self._row_value = self._grow(self._row_value, row + 1)
+            self._row_live = self._grow(self._row_live, row + 1)
+        subject_id = self._intern(self._subjects, subject)
+        self._row_student[row] = student_id
+        self._row_subject[row] = subject_id
+        self._row_value[row] = grade
+        self._row_live[row] = True
+        self._rows[student_id].setdefault(subject_id, []).append(row)
+        self._size += 1
+
+    def _kill(self, rows: list[int]) -> None:
+        """
+        Marks grade rows as removed.
+
+        Args:
+            rows (list[int]): Row indices to mark.
+        """
+        self._row_live[rows] = False
+        self._dead += len(rows)
+
+    def _maybe_compact(self) -> None:
+        """
+        Drops dead rows once they make up more than half of the store.
+        """
+        if self._dead < self._INITIAL_CAPACITY or 2 * self._dead < self._size:
+            return
+        live = self._row_live[:self._size]
+        new_index = np.cumsum(live) - 1
+        self._row_student = self._row_student[:self._size][live].copy()
+        self._row_subject = self._row_subject[:self._size][live].copy()
+        self._row_value = self._row_value[:self._size][live].copy()
+        self._size = len(self._row_value)
+        self._row_live = np.ones(self._size, dtype=bool)
+        self._dead = 0
+        for subjects in self._rows.values():
+            for subject_id, rows in subjects.items():
+                subjects[subject_id] = new_index[rows].tolist()
+
+    def on_student_change(self, change: str, student: Student, *args) -> None:
+        """
+        Applies a change reported by a registered student.
+
+        Args:
+            change (str): Kind of change reported by the student.
+            student (Student): The modified student.
+            *args: Change details, as passed to StudentSystem listeners.
+        """
+        student_id = self._student_ids[student]
+        if change == "grade_added":
+            subject, grade = args
+            self._append(student_id, subject, grade)
+        elif change == "grade_removed":
+            subject, grade = args
+            self._kill([self._rows[student_id][self._subjects[subject]].pop()])
+            self._maybe_compact()
+        elif change == "subject_deleted":
+            subject = args[0]
+            subject_id = self._subjects.get(subject)
+            self._kill(self._rows[student_id].pop(subject_id, []))
+            self._maybe_compact()
+        elif change == "grades_cleared":
+            for rows in self._rows[student_id].values():
+                self._kill(rows)
+            self._rows[student_id] = {}
+            self._maybe_compact()
+        elif change == "class_changed":
+            self._student_class[student_id] = self._intern(self._classes, student.class_grade)
+        elif change == "major_changed":
+            self._student_major[student_id] = self._intern(self._majors, student.major.lower())
+
+    def _live_rows(self):
+        """
+        Returns the student ids, subject ids and values of all live grade rows.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: Student ids, subject ids and grade values.
+        """
+        live = self._row_live[:self._size]
+        return (self._row_student[:self._size][live],
+                self._row_subject[:self._size][live],
+                self._row_value[:self._size][live])
+
+    @staticmethod
+    def _grouped_averages(table: dict[str, int], group_ids, values) -> dict[str, float]:
+        """
+        Computes the average value per group with a single grouped reduction.
+
+        Args:
+            table (dict[str, int]): String table mapping group names to ids.
+            group_ids (np.ndarray): Group id of every value.
+            values (np.ndarray): Values to average.
+
+        Returns:
+            dict[str, float]: Average per group name, for groups with at least one value.
+        """
+        sums = np.bincount(group_ids, weights=values, minlength=len(table))
+        counts = np.bincount(group_ids, minlength=len(table))
+        return {name: float(sums[group_id] / counts[group_id])
+                for name, group_id in table.items() if counts[group_id]}
+
+    @staticmethod
+    def _grouped_counts(table: dict[str, int], group_ids) -> dict[str, int]:
+        """
+        Counts values per group with a single grouped reduction.
+
+        Args:
+            table (dict[str, int]): String table mapping group names to ids.
+            group_ids (np.ndarray): Group id of every value.
+
+        Returns:
+            dict[str, int]: Number of values per group name, for non-empty groups.
+        """
+        counts = np.bincount(group_ids, minlength=len(table))
+        return {name: int(counts[group_id]) for name, group_id in table.items() if counts[group_id]}
+
+    def grade_count(self) -> int:
+        """
+        Returns the number of grades in the store.
+
+        Returns:
+            int: Number of live grades.
+        """
+        return self._size - self._dead
+
+    def school_average(self) -> float:
+        """
+        Calculates the average of all grades.
+
+        Returns:
+            float: The school average grade.
+
+        Raises:
+            ValueError: If there are no grades.
+        """
+        _, _, values = self._live_rows()
+        if not len(values):
+            raise ValueError("No students with grades")
+        return float(values.mean())
+
+    def class_average(self, class_grade: str) -> float:
+        """
+        Calculates the average grade of one class (exact class name match).
+
+        Args:
+            class_grade (str): The class grade to calculate the average for.
+
+        Returns:
+            float: The average grade for the class.
+
+        Raises:
+            ValueError: If the class has no grades.
+        """
+        class_id = self._classes.get(class_grade)
+        students, _, values = self._live_rows()
+        if class_id is not None:
+            values = values[self._student_class[students] == class_id]
+            if len(values):
+                return float(values.mean())
+        raise ValueError(f"No students with grades in class {class_grade}")
+
+    def class_averages(self) -> dict[str, float]:
+        """
+        Calculates the average grade of every class at once.
+
+        Returns:
+            dict[str, float]: Average per class grade.
+        """
+        students, _, values = self._live_rows()
+        return self._grouped_averages(self._classes, self._student_class[students], values)
+
+    def major_averages(self) -> dict[str, float]:
+        """
+        Calculates the average grade of every major at once (majors are lower-cased).
+
+        Returns:
+            dict[str, float]: Average per major.
+        """
+        students, _, values = self._live_rows()
+        return self._grouped_averages(self._majors, self._student_major[students], values)
+
+    def subject_averages(self) -> dict[str, float]:
+        """
+        Calculates the average grade of every subject at once.
+
+        Returns:
+            dict[str, float]: Average per subject.
+        """
+        _, subjects, values = self._live_rows()
+        return self._grouped_averages(self._subjects, subjects, values)
+
+    def class_counts(self) -> dict[str, int]:
+        """
+        Counts the grades of every class at once.
+
+        Returns:
+            dict[str, int]: Number of grades per class grade.
+        """
+        students, _, _ = self._live_rows()
+        return self._grouped_counts(self._classes, self._student_class[students])
+
+    def subject_counts(self) -> dict[str, int]:
+        """
+        Counts the grades of every subject at once.
+
+        Returns:
+            dict[str, int]: Number of grades per subject.
+        """
+        _, subjects, _ = self._live_rows()
+        return self._grouped_counts(self._subjects, subjects)
+
+    def grade_distribution(self, bins: int = 10) -> list[int]:
+        """
+        Builds a histogram of all grades over the 1.0–6.0 scale.
+
+        Args:
+            bins (int): Number of equal-width bins.
+
+        Returns:
+            list[int]: Number of grades in each bin, from lowest to highest.
+        """
+        _, _, values = self._live_rows()
+        counts, _ = np.histogram(values, bins=bins, range=(GRADE_MIN, GRADE_MAX))
+        return counts.tolist()
@@ -0,0 +1,268 @@
+from collections import Counter
+from itertools import chain
+from typing import Iterable
+
+from src.stats import HISTOGRAM_BINS
+from src.student import GRADE_MAX, GRADE_MIN, Student
+
+RESOLUTION = 0.01
+_STEPS = round((GRADE_MAX - GRADE_MIN) / RESOLUTION)
+
+
+def _step(grade: float) -> int:
+    """
+    Returns the fine bin of a grade.
+
+    Args:
+        grade (float): Grade on the 1.0–6.0 scale.
+
+    Returns:
+        int: Index of the RESOLUTION-wide bin centred on the grade, 0 for 1.0 up to _STEPS for 6.0.
+    """
+    return round((grade - GRADE_MIN) / RESOLUTION)
+
+
+class GradeHistogram:
+    """
+    Grade counts in fixed bins of RESOLUTION (0.01) over the 1.0–6.0 scale.
+
+    Adding or removing a grade costs O(1) and any percentile O(bins), however many grades
+    there are. Grades on the 0.01 grid (all usual grades) are counted exactly; any other
+    grade is counted as the nearest multiple of 0.01.
+    """
+
+    __slots__ = ("counts", "count")
+
+    def __init__(self):
+        """
+        Initializes an empty histogram.
+        """
+        self.counts = [0] * (_STEPS + 1)
+        self.count = 0
+
+    def update(self, grades: Iterable[float], sign: int = 1) -> None:
+        """
+        Adds (or with sign=-1 removes) grades.
+
+        Args:
+            grades (Iterable[float]): Grades to count; duplicates are counted together in C by Counter.
+            sign (int): 1 to add the grades, -1 to remove them.
+        """
+        counts = self.counts
+        for grade, times in Counter(grades).items():
+            counts[_step(grade)] += sign * times
+            self.count += sign * times
+
+    def merge(self, other: "GradeHistogram") -> None:
+        """
+        Adds the grades counted by another histogram.
+
+        Args:
+            other (GradeHistogram): Histogram to add.
+        """
+        self.counts = [mine + theirs for mine, theirs in zip(self.counts, other.counts)]
+        self.count += other.count
+
+    def value(self, rank: int) -> float:
+        """
+        Returns the grade at a position in the sorted grades.
+
+        Args:
+            rank (int): 0-based position, below count.
+
+        Returns:
+            float: The rank-th smallest grade.
+        """
+        for step, times in enumerate(self.counts):
+            if rank < times:
+                return round(GRADE_MIN + step * RESOLUTION, 2)
+            rank -= times
+        raise IndexError("Rank out of range")
+
+    def percentile(self, percent: float) -> float:
+        """
+        Returns a percentile of the grades, interpolating linearly between neighbouring grades
+        (the default method of numpy.percentile; the 50th percentile equals statistics.median).
+
+        Args:
+            percent (float): Percentile between 0 and 100.
+
+        Returns:
+            float: The percentile.
+
+        Raises:
+            ValueError: If the histogram is empty or percent is outside 0–100.
+        """
+        if not 0 <= percent <= 100:
+            raise ValueError("Percentile must be between 0 and 100")
+        if not self.count:
+            raise ValueError("No grades")
+        position = percent / 100 * (self.count - 1)
+        lower = int(position)
+        low = self.value(lower)
+        if position == lower:
+            return low
+        return low + (self.value(lower + 1) - low) * (position - lower)
+
+    def histogram(self, bins: int = HISTOGRAM_BINS) -> tuple[int, ...]:
+        """
+        Merges the fine bins into equal bins, like GroupStats.histogram: bin k holds grades in
+        [1.0 + k * w, 1.0 + (k + 1) * w), and the last bin also holds 6.0.
+
+        Args:
+            bins (int): Number of bins.
+
+        Returns:
+            tuple[int, ...]: Number of grades per bin.
+        """
+        merged = [0] * bins
+        for step, times in enumerate(self.counts):
+            if times:
+                merged[min(step * bins // _STEPS, bins - 1)] += times
+        return tuple(merged)
+
+
+class GradeDistributions:
+    """
+    Grade histograms of the whole school, of every class and of every subject, kept up to date
+    from the change events of a StudentSystem.
+
+    Classes are keyed by their exact name, like get_class_average.
+    """
+
+    def __init__(self):
+        """
+        Initializes empty distributions.
+        """
+        self.school = GradeHistogram()
+        self.classes: dict[str, GradeHistogram] = {}
+        self.subjects: dict[str, GradeHistogram] = {}
+
+    @staticmethod
+    def _update(histograms: dict[str, GradeHistogram], key: str, grades: Iterable[float], sign: int) -> None:
+        """
+        Adds or removes grades in one histogram of a group, dropping it once it is empty.
+
+        Args:
+            histograms (dict[str, GradeHistogram]): Histograms per class or per subject.
+            key (str): Class or subject.
+            grades (Iterable[float]): Grades to add or remove.
+            sign (int): 1 to add, -1 to remove.
+        """
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = GradeHistogram()
+        histogram.update(grades, sign)
+        if not histogram.count:
+            del histograms[key]
+
+    def _count_grade(self, class_grade: str, subject: str, grade: float, sign: int) -> None:
+        """
+        Adds or removes a single grade; the path taken by add_grade and remove_last_grade.
+
+        Args:
+            class_grade (str): Class the grade belongs to.
+            subject (str): Subject of the grade.
+            grade (float): The grade.
+            sign (int): 1 to add, -1 to remove.
+        """
+        step = _step(grade)
+        self.school.counts[step] += sign
+        self.school.count += sign
+        for histograms, key in ((self.classes, class_grade), (self.subjects, subject)):
+            histogram = histograms.get(key)
+            if histogram is None:
+                histogram = histograms[key] = GradeHistogram()
+            histogram.counts[step] += sign
+            histogram.count += sign
+            if not histogram.count:
+                del histograms[key]
+
+    def _update_grades(self, class_grade: str, grades: dict, sign: int) -> None:
+        """
+        Adds or removes a student's grades of several subjects.
+
+        Args:
+            class_grade (str): Class the grades belong to.
+            grades (dict): Grades per subject.
+            sign (int): 1 to add, -1 to remove.
+        """
+        grades = {subject: grades_list for subject, grades_list in grades.items() if grades_list}
+        if not grades:
+            return
+        self.school.update(chain.from_iterable(grades.values()), sign)
+        self._update(self.classes, class_grade, chain.from_iterable(grades.values()), sign)
+        for subject, grades_list in grades.items():
+            self._update(self.subjects, subject, grades_list, sign)
+
+    def add_students(self, students: Iterable[Student]) -> None:
+        """
+        Counts all grades of several students, e.g. when building the histograms of a whole system,
+        with one Counter pass per class and per subject.
+
+        Args:
+            students (Iterable[Student]): Students to add.
+        """
+        classes: dict[str, list] = {}
+        subjects: dict[str, list] = {}
+        for student in students:
+            if student._grade_count:
+                classes.setdefault(student.class_grade, []).extend(student._grades.values())
+                for subject, grades_list in student._grades.items():
+                    subjects.setdefault(subject, []).append(grades_list)
+        for class_grade, arrays in classes.items():
+            added = GradeHistogram()
+            added.update(chain.from_iterable(arrays))
+            self.school.merge(added)
+            self.classes.setdefault(class_grade, GradeHistogram()).merge(added)
+        for subject, arrays in subjects.items():
+            self._update(self.subjects, subject, chain.from_iterable(arrays), 1)
+
+    def on_change(self, change: str, student: Student, *args) -> None:
+        """
+        Keeps the histograms up to date; registered as a StudentSystem listener.
+
+        Args:
+            change (str): Kind of change reported by the system.
+            student (Student): The affected student.
+            *args: Change details.
+        """
+        if change == "grade_added" or change == "grade_removed":
+            subject, grade = args
+            self._count_grade(student.class_grade, subject, grade, 1 if change == "grade_added" else -1)
+        elif change == "subject_deleted":
+            subject, grades_list, removed_sum = args
+            self._update_grades(student.class_grade, {subject: grades_list}, -1)
+        elif change == "grades_cleared":
+            old_grades, removed_sum, removed_count = args
+            self._update_grades(student.class_grade, old_grades, -1)
+        elif change == "class_changed":
+            old_class_grade, = args
+            if student._grade_count:
+                for class_grade, sign in ((old_class_grade, -1), (student.class_grade, 1)):
+                    self._update(self.classes, class_grade, chain.from_iterable(student._grades.values()), sign)
+        elif change == "student_added" or change == "student_removed":
+            if student._grade_count:
+                self._update_grades(student.class_grade, student._grades, 1 if change == "student_added" else -1)
+
+    def histogram(self, class_grade: str | None = None, subject: str | None = None) -> GradeHistogram | None:
+        """
+        Returns the histogram of the school, of a class or of a subject.
+
+        Args:
+            class_grade (str | None): Class, or None.
+            subject (str | None): Subject, or None.
+
+        Returns:
+            GradeHistogram | None: The histogram, or None if the class or subject has no grades.
+
+        Raises:
+            ValueError: If both a class and a subject are given.
+        """
+        if class_grade is not None and subject is not None:
+            raise ValueError("Give either a class or a subject, not both")
+        if class_grade is not None:
+            return self.classes.get(class_grade)
+        if subject is not None:
+            return self.subjects.get(subject)
+        return self.school
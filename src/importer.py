@@ -0,0 +1,211 @@
+import csv
+import json
+from itertools import islice
+from typing import Iterable, Iterator, NamedTuple
+
+from src.student import Student, validate_grade
+from src.student_system import StudentSystem
+
+STUDENT_FIELDS = ("name", "last_name", "class_grade", "major", "year")
+
+
+class StudentRecord(NamedTuple):
+    """
+    One validated input record: a student and the grades listed for them on that line.
+    """
+    line: int
+    name: str
+    last_name: str
+    class_grade: str
+    major: str
+    year: int
+    grades: list[tuple[str, float]]
+
+
+class RowError(NamedTuple):
+    """
+    An input line that could not be imported.
+    """
+    line: int
+    message: str
+
+
+class ImportReport:
+    """
+    Summary of a bulk import: how much was added and which lines were rejected.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty report.
+        """
+        self.students_added = 0
+        self.grades_added = 0
+        self.errors: list[RowError] = []
+
+    def __str__(self) -> str:
+        """
+        Returns a short human-readable summary of the import.
+
+        Returns:
+            str: Counts of added students, grades and rejected lines.
+        """
+        return (f"Imported {self.students_added} students and {self.grades_added} grades, "
+                f"{len(self.errors)} rejected lines")
+
+
+def read_csv_rows(lines: Iterable[str]) -> Iterator[tuple[int, dict]]:
+    """
+    Streams rows of a CSV file with a header line.
+
+    Expected columns: name, last_name, class_grade, major, year and optionally subject, grade.
+    A row with a subject and grade adds that grade to the student.
+
+    Args:
+        lines (Iterable[str]): Lines of the file, e.g. an open text file.
+
+    Yields:
+        tuple[int, dict]: Line number and the row as a dictionary.
+    """
+    reader = csv.DictReader(lines)
+    for row in reader:
+        yield reader.line_num, row
+
+
+def read_jsonl_rows(lines: Iterable[str]) -> Iterator[tuple[int, dict]]:
+    """
+    Streams objects of a JSON-lines file.
+
+    Each object has name, last_name, class_grade, major and year, and optionally either
+    "subject" and "grade" or "grades" mapping subjects to lists of grades. Blank lines are skipped.
+
+    Args:
+        lines (Iterable[str]): Lines of the file, e.g. an open text file.
+
+    Yields:
+        tuple[int, dict | None]: Line number and the parsed object (None if the line is not valid JSON).
+    """
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            row = None
+        yield line_number, row
+
+
+def parse_records(rows: Iterable[tuple[int, dict]], errors: list[RowError]) -> Iterator[StudentRecord]:
+    """
+    Validates raw rows, yielding good records and collecting errors for bad ones.
+
+    Grades are checked with the same 1.0–6.0 rule as Student.add_grade.
+
+    Args:
+        rows (Iterable[tuple[int, dict]]): Line numbers and raw rows.
+        errors (list[RowError]): List that rejected lines are appended to.
+
+    Yields:
+        StudentRecord: Valid records.
+    """
+    for line, row in rows:
+        if not isinstance(row, dict):
+            errors.append(RowError(line, "Not a valid record"))
+            continue
+        missing = [field for field in STUDENT_FIELDS if not str(row.get(field) or "").strip()]
+        if missing:
+            errors.append(RowError(line, f"Missing fields: {', '.join(missing)}"))
+            continue
+        try:
+            year = int(row["year"])
+        except (TypeError, ValueError):
+            errors.append(RowError(line, f"Invalid year: {row['year']!r}"))
+            continue
+        grades = []
+        try:
+            listed = row.get("grades") or {}
+            if not isinstance(listed, dict):
+                raise ValueError(f"Invalid grades: {listed!r}")
+            listed = dict(listed)
+            if row.get("subject") or row.get("grade"):
+                subject = row.get("subject") or ""
+                values = listed.get(subject, [])
+                listed[subject] = (list(values) if isinstance(values, list) else [values]) + [row.get("grade")]
+            for subject, values in listed.items():
+                if not subject:
+                    raise ValueError("Grade without a subject")
+                for value in values if isinstance(values, list) else [values]:
+                    try:
+                        grade = float(value)
+                    except (TypeError, ValueError):
+                        raise ValueError(f"Invalid grade for {subject}: {value!r}")
+                    validate_grade(grade)
+                    grades.append((subject, grade))
+        except ValueError as e:
+            errors.append(RowError(line, str(e)))
+            continue
+        yield StudentRecord(line, str(row["name"]).strip(), str(row["last_name"]).strip(),
+                            str(row["class_grade"]).strip(), str(row["major"]).strip(), year, grades)
+
+
+def import_records(system: StudentSystem, records: Iterable[StudentRecord], report: ImportReport,
+                   batch_size: int = 1000) -> None:
+    """
+    Inserts records into the system in batches.
+
+    Records for a student already in the system (same name, last name and year) only add
+    grades; the class and major on such lines are ignored. New students are built with
+    their grades first and then added with StudentSystem.add_students_bulk.
+
+    Args:
+        system (StudentSystem): System to import into.
+        records (Iterable[StudentRecord]): Valid records.
+        report (ImportReport): Report updated with the added counts.
+        batch_size (int): Number of records handled per batch.
+    """
+    records = iter(records)
+    while batch := list(islice(records, batch_size)):
+        new_students: dict[tuple[str, str, int], Student] = {}
+        for record in batch:
+            key = (record.name, record.last_name, record.year)
+            student = new_students.get(key) or system.find_student(*key)
+            if student is None:
+                student = new_students[key] = Student(record.name, record.last_name, record.class_grade,
+                                                      record.major, record.year)
+            for subject, grade in record.grades:
+                student.add_grade(subject, grade)
+            report.grades_added += len(record.grades)
+        report.students_added += system.add_students_bulk(new_students.values())
+
+
+def import_file(system: StudentSystem, path: str, file_format: str | None = None,
+                batch_size: int = 1000) -> ImportReport:
+    """
+    Streams a CSV or JSON-lines file of students and grades into the system.
+
+    The file is read line by line, so memory use does not depend on its size.
+
+    Args:
+        system (StudentSystem): System to import into.
+        path (str): Path of the file.
+        file_format (str | None): 'csv' or 'jsonl'; guessed from the file extension if None.
+        batch_size (int): Number of records inserted per batch.
+
+    Returns:
+        ImportReport: Counts of added students and grades, and the rejected lines.
+
+    Raises:
+        ValueError: If the file format is not supported.
+    """
+    if file_format is None:
+        file_format = "jsonl" if path.endswith((".jsonl", ".json")) else "csv"
+    if file_format == "csv":
+        reader = read_csv_rows
+    elif file_format == "jsonl":
+        reader = read_jsonl_rows
+    else:
+        raise ValueError(f"Unsupported file format: {file_format}")
+    report = ImportReport()
+    with open(path, newline="", encoding="utf-8") as file:
+        import_records(system, parse_records(reader(file), report.errors), report, batch_size)
+    return report
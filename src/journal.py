@@ -0,0 +1,305 @@
+import json
+import os
+import sys
+from array import array
+
+from src.storage import Storage
+from src.student import Student
+from src.student_system import StudentSystem
+
+SNAPSHOT_FILE = "snapshot.jsonl"
+_FORMAT_VERSION = 1
+
+
+class JournalStorage(Storage):
+    """
+    Stores a StudentSystem as a snapshot plus an append-only journal of changes, in one directory.
+
+    Every change (adding or removing a student, grades, renames, class and major changes) is
+    appended to the journal as one JSON line as soon as it happens, so nothing entered is lost
+    if the program stops. Loading reads the latest snapshot and replays the journal written after it.
+    A snapshot writes the whole system to a new file, atomically replaces the previous one and
+    starts a new, empty journal, which keeps start-up fast however long the system has been used.
+
+    Snapshot file: a header line {"version", "next_id", "journal"} followed by one line per
+    student, [id, name, last_name, class_grade, major, year, {subject: [grades]}].
+    Journal line: [change, student id, *change details].
+    """
+
+    def __init__(self, directory: str, snapshot_every: int | None = 100_000, sync: bool = False):
+        """
+        Opens (or creates) the storage directory.
+
+        Args:
+            directory (str): Directory holding the snapshot and the journals.
+            snapshot_every (int | None): Number of journal entries after which a snapshot is taken
+                                         automatically; None disables automatic snapshots.
+            sync (bool): Whether every entry is also forced to disk with os.fsync (survives power
+                         loss, not only a crash of the program, at the cost of much slower writes).
+        """
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._snapshot_every = snapshot_every
+        self._sync = sync
+        self._journal = None
+        self._journal_name = "journal.0.jsonl"
+        self._entries = 0
+        self._snapshot_pending = False
+        self._ids: dict[Student, int] = {}
+        self._next_id = 1
+        self._system: StudentSystem | None = None
+
+    def _path(self, name: str) -> str:
+        """
+        Returns the path of a file in the storage directory.
+
+        Args:
+            name (str): File name.
+
+        Returns:
+            str: Path of the file.
+        """
+        return os.path.join(self._directory, name)
+
+    @staticmethod
+    def _restore_student(name: str, last_name: str, class_grade: str, major: str, year: int,
+                         grades: dict[str, list[float]]) -> Student:
+        """
+        Creates a student with stored grades; the packed grade arrays are only built on first use.
+
+        Args:
+            name (str): First name.
+            last_name (str): Last name.
+            class_grade (str): Class grade.
+            major (str): Major.
+            year (int): Year.
+            grades (dict[str, list[float]]): Grades per subject.
+
+        Returns:
+            Student: The restored student.
+        """
+        student = Student(name, last_name, class_grade, major, year)
+        if grades:
+            student._defer_grades(
+                lambda _: {sys.intern(subject): array("d", grades_list) for subject, grades_list in grades.items()},
+                sum(map(sum, grades.values())), sum(map(len, grades.values())))
+        return student
+
+    def _read_snapshot(self) -> dict[int, Student]:
+        """
+        Reads the snapshot, if there is one.
+
+        Returns:
+            dict[int, Student]: Stored students by id, in the order they were added.
+        """
+        students: dict[int, Student] = {}
+        try:
+            file = open(self._path(SNAPSHOT_FILE), encoding="utf-8")
+        except FileNotFoundError:
+            return students
+        with file:
+            header = json.loads(file.readline())
+            if header.get("version") != _FORMAT_VERSION:
+                raise ValueError(f"Unsupported snapshot version: {header.get('version')}")
+            self._next_id = header["next_id"]
+            self._journal_name = header["journal"]
+            for line in file:
+                student_id, *fields = json.loads(line)
+                students[student_id] = self._restore_student(*fields)
+        return students
+
+    def _replay(self, system: StudentSystem, students: dict[int, Student]) -> None:
+        """
+        Applies the journal written after the snapshot to a system holding the snapshot's students.
+
+        A last line cut off by a crash is dropped from the journal.
+
+        Args:
+            system (StudentSystem): System to change.
+            students (dict[int, Student]): Students of the system by id.
+        """
+        path = self._path(self._journal_name)
+        if not os.path.exists(path):
+            return
+        valid_size = 0
+        with open(path, "rb") as file:
+            for line in file:
+                if not line.endswith(b"\n"):
+                    break
+                change, student_id, *args = json.loads(line)
+                if change == "student_added":
+                    student = students[student_id] = self._restore_student(*args)
+                    self._ids[student] = student_id
+                    self._next_id = max(self._next_id, student_id + 1)
+                    system.add_student(student)
+                elif change == "student_removed":
+                    student = students.pop(student_id)
+                    del self._ids[student]
+                    system._discard(student)
+                else:
+                    self._apply(students[student_id], change, args)
+                valid_size += len(line)
+                self._entries += 1
+        if valid_size != os.path.getsize(path):
+            with open(path, "r+b") as file:
+                file.truncate(valid_size)
+
+    @staticmethod
+    def _apply(student: Student, change: str, args: list) -> None:
+        """
+        Repeats one journalled change of a student.
+
+        Args:
+            student (Student): Student to change.
+            change (str): Kind of change.
+            args (list): Change details as journalled.
+
+        Raises:
+            ValueError: If the change is unknown.
+        """
+        if change == "grade_added":
+            student.add_grade(*args)
+        elif change == "grade_removed":
+            student.remove_last_grade(args[0])
+        elif change == "subject_deleted":
+            student.delete_subject(args[0])
+        elif change == "grades_cleared":
+            student.delete_all_grades()
+        elif change == "renamed":
+            student.change_name(*args)
+        elif change == "class_changed":
+            student.change_class_grade(args[0])
+        elif change == "major_changed":
+            student.change_major(args[0])
+        else:
+            raise ValueError(f"Unknown journal entry: {change}")
+
+    def load(self) -> StudentSystem:
+        """
+        Loads the latest snapshot, replays the journal after it and starts journalling the system's changes.
+
+        Returns:
+            StudentSystem: The loaded system.
+
+        Raises:
+            RuntimeError: If this storage has already been loaded.
+        """
+        if self._system is not None:
+            raise RuntimeError("Storage is already loaded")
+        students = self._read_snapshot()
+        self._ids = {student: student_id for student_id, student in students.items()}
+        system = StudentSystem()
+        system.add_students_bulk(students.values())
+        self._replay(system, students)
+        for name in os.listdir(self._directory):
+            if name.startswith("journal.") and name != self._journal_name:
+                os.remove(self._path(name))  # left over by a snapshot interrupted by a crash
+        self._journal = open(self._path(self._journal_name), "a", encoding="utf-8")
+        system.add_listener(self._on_change)
+        self._system = system
+        return system
+
+    def _write(self, entry: list) -> None:
+        """
+        Appends one entry to the journal and hands it to the operating system.
+
+        Once snapshot_every entries are written, an automatic snapshot is only marked as pending:
+        _on_change takes it when every student of the system has been journalled.
+
+        Args:
+            entry (list): [change, student id, *details].
+        """
+        self._journal.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._journal.flush()
+        if self._sync:
+            os.fsync(self._journal.fileno())
+        self._entries += 1
+        if self._snapshot_every is not None and self._entries >= self._snapshot_every:
+            self._snapshot_pending = True
+
+    def _on_change(self, change: str, student: Student, *args) -> None:
+        """
+        Journals a change in the loaded system and takes a pending automatic snapshot.
+
+        While add_students_bulk notifies its batch, later students of the batch are already in the
+        roster but have no id yet, so the snapshot waits until every student has been journalled.
+
+        Args:
+            change (str): Kind of change reported by the system.
+            student (Student): The affected student.
+            *args: Change details.
+        """
+        if change == "student_added":
+            student_id = self._ids[student] = self._next_id
+            self._next_id += 1
+            self._write([change, student_id, student.name, student.last_name, student.class_grade,
+                         student.major, student.year, student.grades])
+        elif change == "student_removed":
+            self._write([change, self._ids.pop(student)])
+        elif change == "grade_added":
+            subject, grade = args
+            self._write([change, self._ids[student], subject, grade])
+        elif change in ("grade_removed", "subject_deleted"):
+            self._write([change, self._ids[student], args[0]])
+        elif change == "grades_cleared":
+            self._write([change, self._ids[student]])
+        elif change == "renamed":
+            self._write([change, self._ids[student], student.name, student.last_name])
+        elif change == "class_changed":
+            self._write([change, self._ids[student], student.class_grade])
+        elif change == "major_changed":
+            self._write([change, self._ids[student], student.major])
+        if self._snapshot_pending and len(self._ids) == self._system.get_student_count():
+            self.snapshot()
+
+    def snapshot(self) -> None:
+        """
+        Writes the whole system to a new snapshot and starts an empty journal.
+
+        The snapshot is written to a temporary file and then renamed over the old one, so a
+        crash at any point leaves either the old snapshot with its journal or the new one.
+
+        Raises:
+            RuntimeError: If the storage has not been loaded.
+        """
+        if self._system is None:
+            raise RuntimeError("Storage is not loaded")
+        generation = int(self._journal_name.split(".")[1]) + 1
+        journal_name = f"journal.{generation}.jsonl"
+        temporary = self._path(SNAPSHOT_FILE + ".tmp")
+        with open(temporary, "w", encoding="utf-8") as file:
+            file.write(json.dumps({"version": _FORMAT_VERSION, "next_id": self._next_id,
+                                   "journal": journal_name}) + "\n")
+            for student in self._system.iter_students():
+                file.write(json.dumps([self._ids[student], student.name, student.last_name, student.class_grade,
+                                       student.major, student.year, student.grades], ensure_ascii=False) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+        new_journal = open(self._path(journal_name), "w", encoding="utf-8")
+        os.replace(temporary, self._path(SNAPSHOT_FILE))
+        self._journal.close()
+        os.remove(self._path(self._journal_name))
+        self._journal = new_journal
+        self._journal_name = journal_name
+        self._entries = 0
+        self._snapshot_pending = False
+
+    def flush(self) -> None:
+        """
+        Forces the journal to disk.
+        """
+        if self._journal is not None:
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+
+    def close(self) -> None:
+        """
+        Forces the journal to disk, stops journalling the system and closes the journal.
+        """
+        if self._journal is None:
+            return
+        self.flush()
+        self._system.remove_listener(self._on_change)
+        self._system = None
+        self._journal.close()
+        self._journal = None
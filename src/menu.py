@@ -1,3 +1,8 @@
+import sys
+
+from src import metrics
+from src.exporter import write_lines
+from src.journal import JournalStorage
 from src.student import Student
 from src.student_system import StudentSystem
 
@@ -219,9 +224,22 @@ def find_student_prompt(system: StudentSystem):
         return None
     student = system.find_student(name, last_name, year)
     if not student:
-        print("Nie znaleziono takiego studenta.")
+        student = choose_suggested_student(system, f"{name} {last_name}")
     return student
 
+def choose_suggested_student(system: StudentSystem, full_name: str):
+    suggestions = system.fuzzy_search_students(full_name, limit=5)
+    if not suggestions:
+        print("Nie znaleziono takiego studenta.")
+        return None
+    print("Nie znaleziono takiego studenta. Czy chodziło o:")
+    for number, suggestion in enumerate(suggestions, start=1):
+        print(f"{number}. {suggestion.name} {suggestion.last_name}, klasa {suggestion.class_grade}, rok {suggestion.year}")
+    choice = input("Wybierz numer (Enter - anuluj): ")
+    if choice.isdigit() and 1 <= int(choice) <= len(suggestions):
+        return suggestions[int(choice) - 1]
+    return None
+
 # --- ZARZĄDZANIE SZKOŁĄ ---
 def school_management_menu(system: StudentSystem):
     while True:
@@ -233,21 +251,21 @@ def school_management_menu(system: StudentSystem):
         print("5. Średnia ocen klasy")
         print("6. Średnia ocen szkoły")
         print("7. Posortuj studentów")
+        print("8. Statystyki wydajności")
+        print("9. Wyszukaj studenta")
         print("0. Powrót do głównego menu")
         choice = input("Wybierz opcję: ")
 
         if choice == "1":
-            print(system.show_all_students())
+            write_lines(system.iter_student_lines(), sys.stdout)
         elif choice == "2":
             class_grade = input("Podaj klasę (np. 1A): ")
             students = system.get_students_by_class(class_grade)
-            for student in students:
-                print(student)
+            write_lines(map(str, students), sys.stdout)
         elif choice == "3":
             major = input("Podaj specjalizację: ")
             students = system.get_students_from_major(major)
-            for student in students:
-                print(student)
+            write_lines(map(str, students), sys.stdout)
         elif choice == "4":
             print(f"Liczba studentów: {system.get_student_count()}")
         elif choice == "5":
@@ -265,11 +283,56 @@ def school_management_menu(system: StudentSystem):
                 print(e)
         elif choice == "7":
             sort_students_menu(system)
+        elif choice == "8":
+            show_performance_stats()
+        elif choice == "9":
+            search_students_prompt(system)
         elif choice == "0":
             break
         else:
             print("Nieprawidłowa opcja, spróbuj ponownie.")
 
+def search_students_prompt(system: StudentSystem):
+    query = input("Początek imienia lub nazwiska: ")
+    students = system.search_students(query, limit=20) or system.fuzzy_search_students(query, limit=20)
+    if not students:
+        print("Nie znaleziono studentów.")
+        return
+    write_lines((f"{s.name} {s.last_name}, klasa {s.class_grade}, rok {s.year}" for s in students), sys.stdout)
+
+def show_performance_stats():
+    collected = metrics.active()
+    print("\n--- Statystyki wydajności ---")
+    print(f"Zbieranie statystyk: {'włączone' if collected is not None else 'wyłączone'}")
+    print("1. Pokaż statystyki")
+    print("2. Włącz zbieranie statystyk")
+    print("3. Wyłącz zbieranie statystyk")
+    print("4. Wyzeruj statystyki")
+    choice = input("Wybierz opcję: ")
+
+    if choice == "1":
+        if collected is None:
+            print("Zbieranie statystyk jest wyłączone.")
+            return
+        snapshot = collected.snapshot()
+        if not snapshot:
+            print("Brak zebranych statystyk.")
+            return
+        print(metrics.format_snapshot(snapshot))
+    elif choice == "2":
+        if collected is None:
+            metrics.enable()
+        print("Włączono zbieranie statystyk wydajności.")
+    elif choice == "3":
+        metrics.disable()
+        print("Wyłączono zbieranie statystyk wydajności.")
+    elif choice == "4":
+        if collected is not None:
+            collected.reset()
+        print("Wyzerowano statystyki wydajności.")
+    else:
+        print("Nieprawidłowa opcja.")
+
 def sort_students_menu(system: StudentSystem):
     print("\n--- Sortowanie studentów ---")
     print("1. Po klasie")
@@ -291,10 +354,10 @@ def sort_students_menu(system: StudentSystem):
         print("Nieprawidłowa opcja sortowania.")
         return
 
-    for student in students:
-        print(student)
+    write_lines(map(str, students), sys.stdout)
 
 # --- START PROGRAMU ---
 if __name__ == "__main__":
-    system = StudentSystem()
-    main_menu(system)
+    with JournalStorage("students_data") as storage:
+        system = storage.load()
+        main_menu(system)
@@ -0,0 +1,212 @@
+import functools
+import time
+
+_CLASSES: list[type] = []
+_originals: dict[tuple[type, str], object] = {}
+_active = None
+
+
+class OperationStats:
+    """
+    Call count, latency histogram and rows scanned for one instrumented operation.
+
+    Latencies go into power-of-two buckets of microseconds: bucket k holds calls that
+    took less than 2**k microseconds (and at least 2**(k-1)).
+    """
+
+    __slots__ = ("calls", "errors", "total_seconds", "max_seconds", "rows", "buckets")
+
+    def __init__(self):
+        """
+        Initializes empty statistics.
+        """
+        self.calls = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.rows = 0
+        self.buckets: dict[int, int] = {}
+
+    def to_dict(self) -> dict[str, object]:
+        """
+        Returns the statistics as a plain dictionary.
+
+        Returns:
+            dict[str, object]: Calls, errors, total/mean/max seconds, rows scanned and the histogram.
+        """
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "total_seconds": self.total_seconds,
+            "mean_seconds": self.total_seconds / self.calls if self.calls else 0.0,
+            "max_seconds": self.max_seconds,
+            "rows": self.rows,
+            "histogram": {f"<{2 ** bucket}us": count for bucket, count in sorted(self.buckets.items())},
+        }
+
+
+class Metrics:
+    """
+    Collects OperationStats for every instrumented operation while instrumentation is enabled.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty collection.
+        """
+        self._operations: dict[str, OperationStats] = {}
+
+    def record(self, operation: str, seconds: float, rows: int = 0, error: bool = False) -> None:
+        """
+        Records one call of an operation.
+
+        Args:
+            operation (str): Name of the operation, e.g. 'StudentSystem.find_student'.
+            seconds (float): Duration of the call.
+            rows (int): Number of students the call visited.
+            error (bool): Whether the call raised an exception.
+        """
+        stats = self._operations.get(operation)
+        if stats is None:
+            stats = self._operations[operation] = OperationStats()
+        stats.calls += 1
+        stats.errors += error
+        stats.total_seconds += seconds
+        if seconds > stats.max_seconds:
+            stats.max_seconds = seconds
+        stats.rows += rows
+        bucket = int(seconds * 1_000_000).bit_length()
+        stats.buckets[bucket] = stats.buckets.get(bucket, 0) + 1
+
+    def snapshot(self) -> dict[str, dict[str, object]]:
+        """
+        Returns a copy of the statistics collected so far.
+
+        Returns:
+            dict[str, dict[str, object]]: Statistics per operation name.
+        """
+        return {operation: stats.to_dict() for operation, stats in sorted(self._operations.items())}
+
+    def reset(self) -> None:
+        """
+        Forgets all collected statistics.
+        """
+        self._operations.clear()
+
+
+def instrumented(rows=None):
+    """
+    Marks a method as an instrumented operation. Marking does not wrap the method, so it costs nothing
+    until instrumentation is enabled.
+
+    Args:
+        rows: Optional callable (instance, result) -> int giving the number of students the call visited.
+
+    Returns:
+        Callable: Decorator returning the method unchanged.
+    """
+    def mark(function):
+        function._instrument_rows = rows
+        return function
+    return mark
+
+
+def instrument_class(cls: type) -> type:
+    """
+    Class decorator registering a class whose marked methods are wrapped when instrumentation is enabled.
+
+    Args:
+        cls (type): Class to register.
+
+    Returns:
+        type: The same class.
+    """
+    _CLASSES.append(cls)
+    return cls
+
+
+def _wrap(operation: str, function, metrics: Metrics):
+    """
+    Wraps a method so that each call is timed and recorded.
+
+    Args:
+        operation (str): Name under which calls are recorded.
+        function: Method to wrap.
+        metrics (Metrics): Collection to record into.
+
+    Returns:
+        Callable: The wrapping method.
+    """
+    rows = function._instrument_rows
+
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            result = function(self, *args, **kwargs)
+        except BaseException:
+            metrics.record(operation, time.perf_counter() - start, error=True)
+            raise
+        metrics.record(operation, time.perf_counter() - start, rows(self, result) if rows else 0)
+        return result
+    return wrapper
+
+
+def enable(metrics: Metrics | None = None) -> Metrics:
+    """
+    Turns instrumentation on by wrapping every marked method of the registered classes.
+
+    Args:
+        metrics (Metrics | None): Collection to record into; a new one is created if None.
+
+    Returns:
+        Metrics: The active collection.
+    """
+    global _active
+    disable()
+    _active = metrics if metrics is not None else Metrics()
+    for cls in _CLASSES:
+        for name, function in list(vars(cls).items()):
+            if hasattr(function, "_instrument_rows"):
+                _originals[(cls, name)] = function
+                setattr(cls, name, _wrap(f"{cls.__name__}.{name}", function, _active))
+    return _active
+
+
+def disable() -> None:
+    """
+    Turns instrumentation off, restoring the original methods.
+    """
+    global _active
+    for (cls, name), function in _originals.items():
+        setattr(cls, name, function)
+    _originals.clear()
+    _active = None
+
+
+def active() -> Metrics | None:
+    """
+    Returns the collection in use while instrumentation is enabled.
+
+    Returns:
+        Metrics | None: The active collection, or None if instrumentation is disabled.
+    """
+    return _active
+
+
+def format_snapshot(snapshot: dict[str, dict[str, object]]) -> str:
+    """
+    Formats a snapshot as a human-readable table.
+
+    Args:
+        snapshot (dict[str, dict[str, object]]): Result of Metrics.snapshot().
+
+    Returns:
+        str: One line per operation with calls, mean and max latency, rows scanned and the histogram.
+    """
+    lines = []
+    for operation, stats in snapshot.items():
+        histogram = " ".join(f"{bucket}:{count}" for bucket, count in stats["histogram"].items())
+        lines.append(f"{operation:<45} calls={stats['calls']:<8} mean={stats['mean_seconds'] * 1e6:.1f}us "
+                     f"max={stats['max_seconds'] * 1e6:.1f}us rows={stats['rows']} [{histogram}]")
+    return "\n".join(lines)
@@ -0,0 +1,250 @@
+import copy
+import heapq
+from itertools import islice
+from operator import attrgetter
+
+from src.student import Student
+from src.student_system import StudentSystem, _average_no_grades_last, _average_or_lowest
+
+FILTER_FIELDS = ("class_grade", "major", "year", "name", "last_name")
+ORDER_FIELDS = ("average", "class_grade", "major", "year", "name", "last_name")
+
+# Filters answered by a secondary index of StudentSystem, by field.
+_INDEXES = {"class_grade": "_by_class", "major": "_by_major", "year": "_by_year"}
+# Fields compared case-insensitively, like get_students_by_class and get_students_from_major.
+_CASE_INSENSITIVE = ("class_grade", "major")
+
+
+def _normalized(field: str, value):
+    """
+    Returns a filter value in the form it is compared in.
+
+    Args:
+        field (str): Filtered field.
+        value: Value given by the caller.
+
+    Returns:
+        The value, lower-cased for classes and majors.
+    """
+    return value.lower() if field in _CASE_INSENSITIVE else value
+
+
+class Query:
+    """
+    Lazy, chainable query over the students of a StudentSystem.
+
+    Building a query does no work: where, order_by and limit return a new query, and the
+    students are only visited when the query is iterated. Running it starts from the smallest
+    index group matching an equality filter (class, major, year, or the exact name and year),
+    checks the other conditions as students stream past, and keeps only the best `limit`
+    students in a heap when the results are ordered, so no intermediate lists are built.
+
+    Example:
+        system.query().where(class_grade="2B", major="math").order_by("average", desc=True).limit(20)
+    """
+
+    def __init__(self, system: StudentSystem):
+        """
+        Initializes a query returning every student of the system in roster order.
+
+        Args:
+            system (StudentSystem): System to query.
+        """
+        self._system = system
+        self._filters: tuple[tuple[str, object], ...] = ()
+        self._predicates: tuple = ()
+        self._order: tuple[str, bool] | None = None
+        self._limit: int | None = None
+
+    def where(self, *predicates, **filters) -> "Query":
+        """
+        Returns a query further restricted to the students matching every condition.
+
+        Conditions of successive calls all apply.
+
+        Args:
+            *predicates: Callables taking a Student and returning True for students to keep.
+            **filters: Field values the students must have: class_grade and major (case-insensitive),
+                       year, name and last_name.
+
+        Returns:
+            Query: The restricted query.
+
+        Raises:
+            ValueError: If a filter names an unsupported field.
+        """
+        for field in filters:
+            if field not in FILTER_FIELDS:
+                raise ValueError(f"Unsupported filter: {field}")
+        query = copy.copy(self)
+        query._filters = self._filters + tuple((field, _normalized(field, value)) for field, value in filters.items())
+        query._predicates = self._predicates + predicates
+        return query
+
+    def order_by(self, field: str, desc: bool = False) -> "Query":
+        """
+        Returns the query with its results ordered by a field, replacing any previous order.
+
+        Classes and majors are ordered case-insensitively. Ordered by average, students without
+        grades come last in both directions, as in top_students and bottom_students. Ties keep roster order.
+
+        Args:
+            field (str): 'average', 'class_grade', 'major', 'year', 'name' or 'last_name'.
+            desc (bool): Whether to order from the highest value down.
+
+        Returns:
+            Query: The ordered query.
+
+        Raises:
+            ValueError: If the field is not supported.
+        """
+        if field not in ORDER_FIELDS:
+            raise ValueError(f"Unsupported order: {field}")
+        query = copy.copy(self)
+        query._order = (field, desc)
+        return query
+
+    def limit(self, n: int) -> "Query":
+        """
+        Returns the query returning at most n students.
+
+        Args:
+            n (int): Maximum number of students.
+
+        Returns:
+            Query: The limited query.
+
+        Raises:
+            ValueError: If n is negative.
+        """
+        if n < 0:
+            raise ValueError("Limit cannot be negative")
+        query = copy.copy(self)
+        query._limit = n if self._limit is None else min(n, self._limit)
+        return query
+
+    def _source(self):
+        """
+        Picks the students to scan: the smallest index group matching an equality filter, or the whole roster.
+
+        Returns:
+            tuple: (students in roster order, set of the (field, value) filters they all match).
+        """
+        system = self._system
+        best, size = None, len(system._roster)
+        for field, value in self._filters:
+            index = _INDEXES.get(field)
+            if index is not None and len(getattr(system, index).get(value, ())) < size:
+                best, size = (field, value), len(getattr(system, index).get(value, ()))
+        values = dict(self._filters)
+        if "name" in values and "last_name" in values and "year" in values:
+            key = (values["name"], values["last_name"], values["year"])
+            bucket = system._by_key.get(key, [])
+            if len(bucket) <= size:
+                return bucket, set(zip(("name", "last_name", "year"), key))
+        if best is None:
+            return system._roster, set()
+        return system._group_members(getattr(system, _INDEXES[best[0]]), best[1]), {best}
+
+    def _matching(self):
+        """
+        Returns the students matching every condition, in roster order, filtered as they are consumed.
+
+        Returns:
+            Iterator[Student]: The matching students.
+        """
+        source, answered = self._source()
+        checks = [(attrgetter(field), field in _CASE_INSENSITIVE, value)
+                  for field, value in self._filters if (field, value) not in answered]
+        predicates = self._predicates
+        if not checks and not predicates:
+            return iter(source)
+        if not checks and len(predicates) == 1:
+            return filter(predicates[0], source)
+
+        def matches(student: Student) -> bool:
+            for get, lower, value in checks:
+                actual = get(student)
+                if (actual.lower() if lower else actual) != value:
+                    return False
+            for predicate in predicates:
+                if not predicate(student):
+                    return False
+            return True
+
+        return filter(matches, source)
+
+    def _sort_key(self):
+        """
+        Returns the sort key of the query's order.
+
+        Returns:
+            Callable: Key for sorted, heapq.nsmallest and heapq.nlargest.
+        """
+        field, desc = self._order
+        if field == "average":
+            return _average_or_lowest if desc else _average_no_grades_last
+        if field in _CASE_INSENSITIVE:
+            return lambda student: getattr(student, field).lower()
+        return attrgetter(field)
+
+    def _run(self):
+        """
+        Executes the query against the current state of the system.
+
+        Ordered results with a limit are selected with a heap of `limit` students (O(n log k));
+        like sorted, heapq keeps ties in the order they were scanned, i.e. roster order.
+
+        Returns:
+            Iterator[Student]: The results.
+        """
+        students = self._matching()
+        if self._order is None:
+            return islice(students, self._limit)
+        key = self._sort_key()
+        desc = self._order[1]
+        if self._limit is None:
+            return iter(sorted(students, key=key, reverse=desc))
+        select = heapq.nlargest if desc else heapq.nsmallest
+        return iter(select(self._limit, students, key=key))
+
+    def __iter__(self):
+        """
+        Runs the query.
+
+        Without an order, results stream straight from the scan; students must not be added
+        or removed until the iteration is over.
+
+        Returns:
+            Iterator[Student]: The matching students.
+        """
+        return self._system._run_query(self)
+
+    def all(self) -> list[Student]:
+        """
+        Runs the query and collects its results.
+
+        Returns:
+            list[Student]: The matching students.
+        """
+        return list(self)
+
+    def first(self) -> Student | None:
+        """
+        Runs the query for its first result only.
+
+        Returns:
+            Student | None: The first matching student, or None if there is none.
+        """
+        return next(iter(self.limit(1)), None)
+
+    def count(self) -> int:
+        """
+        Counts the matching students (up to the limit) without collecting them.
+
+        Returns:
+            int: Number of matching students.
+        """
+        query = copy.copy(self)
+        query._order = None  # ordering does not change how many students match
+        return sum(1 for _ in query)
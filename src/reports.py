@@ -0,0 +1,197 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from src.exporter import SUMMARY_FIELDS
+from src.student import Student
+from src.student_system import StudentSystem
+
+GROUP_KINDS = ("class", "major")
+
+_TOTAL_GRADES = SUMMARY_FIELDS.index("total_grades")
+_AVERAGE = SUMMARY_FIELDS.index("average")
+_GRADE_SUM = len(SUMMARY_FIELDS)
+
+
+def _student_record(student: Student) -> tuple:
+    """
+    Converts a student into a small picklable record for a worker process.
+
+    Only the summary and the grade total are sent, never the grades themselves.
+
+    Args:
+        student (Student): Student to convert.
+
+    Returns:
+        tuple: The values of Student.get_student_summary in SUMMARY_FIELDS order, then the sum of grades.
+    """
+    summary = student.get_student_summary()
+    return tuple(summary[field] for field in SUMMARY_FIELDS) + (student._grade_sum,)
+
+
+def _student_payload(student: Student) -> tuple:
+    """
+    Converts a student into picklable data from which a worker process builds its summary.
+
+    All grades travel as one bytes buffer, which pickles far faster than an array per subject.
+
+    Args:
+        student (Student): Student to convert.
+
+    Returns:
+        tuple: Name, last name, class, major, year, subjects, grades per subject, packed grades,
+               sum and number of grades.
+    """
+    grades = student._grades
+    return (student.name, student.last_name, student.class_grade, student.major, student.year,
+            tuple(grades), tuple(map(len, grades.values())), b"".join(map(array.tobytes, grades.values())),
+            student._grade_sum, student._grade_count)
+
+
+def _payload_record(payload: tuple) -> tuple:
+    """
+    Rebuilds a student from its payload and turns it into a record; runs in a worker process.
+
+    Args:
+        payload (tuple): Data made by _student_payload.
+
+    Returns:
+        tuple: The record made by _student_record.
+    """
+    name, last_name, class_grade, major, year, subjects, lengths, packed, grade_sum, grade_count = payload
+    values = array("d")
+    values.frombytes(packed)
+    grades = {}
+    start = 0
+    for subject, length in zip(subjects, lengths):
+        grades[subject] = values[start:start + length]
+        start += length
+    student = Student(name, last_name, class_grade, major, year)
+    # A throwaway read-only copy: only what get_student_summary reads is set.
+    student._grades = grades
+    student._grade_sum, student._grade_count = grade_sum, grade_count
+    return _student_record(student)
+
+
+def _group(system: StudentSystem, kinds: tuple[str, ...], convert) -> dict[tuple[str, str], list]:
+    """
+    Groups all students by class and/or major in a single pass over the roster.
+
+    Args:
+        system (StudentSystem): System to report on.
+        kinds (tuple[str, ...]): Groupings to build: 'class' and/or 'major'.
+        convert: Callable turning a student into the item stored in its groups.
+
+    Returns:
+        dict[tuple[str, str], list]: Converted students per (kind, group name), in roster order.
+    """
+    groups: dict[tuple[str, str], list] = {}
+    for student in system.iter_students():
+        record = convert(student)
+        if "class" in kinds:
+            groups.setdefault(("class", student.class_grade.lower()), []).append(record)
+        if "major" in kinds:
+            groups.setdefault(("major", student.major.lower()), []).append(record)
+    return groups
+
+
+def group_records(system: StudentSystem, kinds: tuple[str, ...] = GROUP_KINDS) -> dict[tuple[str, str], list]:
+    """
+    Groups the records of all students by class and/or major in a single pass over the roster.
+
+    Groups use the same case-insensitive matching as get_students_by_class and get_students_from_major.
+
+    Args:
+        system (StudentSystem): System to report on.
+        kinds (tuple[str, ...]): Groupings to build: 'class' and/or 'major'.
+
+    Returns:
+        dict[tuple[str, str], list]: Student records per (kind, group name), in roster order.
+    """
+    return _group(system, kinds, _student_record)
+
+
+def _record_average(record: tuple) -> float:
+    """
+    Sort key ranking records like _average_or_lowest ranks students.
+
+    Args:
+        record (tuple): Student record.
+
+    Returns:
+        float: The student's average grade, or -inf if they have no grades.
+    """
+    average = record[_AVERAGE]
+    return float("-inf") if average is None else average
+
+
+def render_group_report(kind: str, group: str, records: list) -> str:
+    """
+    Renders the report of one group: its average and every student ranked by average grade.
+
+    Runs in a worker process, so it only takes and returns plain data.
+
+    Args:
+        kind (str): 'class' or 'major'.
+        group (str): Name of the group.
+        records (list): Student records of the group.
+
+    Returns:
+        str: The report text.
+    """
+    records = sorted(records, key=_record_average, reverse=True)
+    grade_count = sum(record[_TOTAL_GRADES] for record in records)
+    grade_sum = sum(record[_GRADE_SUM] for record in records)
+    average = f"{grade_sum / grade_count:.2f}" if grade_count else "-"
+    lines = [f"=== {kind} {group}: {len(records)} students, average {average} ==="]
+    for position, (name, class_grade, major, year, subjects, total_grades, student_average, _) in enumerate(
+            records, start=1):
+        student_average = "-" if student_average is None else f"{student_average:.2f}"
+        lines.append(f"{position:>4}. {name:<40} {class_grade:<6} {major:<16} {year:<6} "
+                     f"subjects={subjects:<3} grades={total_grades:<4} average={student_average}")
+    return "\n".join(lines)
+
+
+def _render_task(task: tuple) -> str:
+    """
+    Builds the summaries of one group's students and renders its report; runs in a worker process.
+
+    Args:
+        task (tuple): Kind, group name and the payloads of the group's students.
+
+    Returns:
+        str: The report text.
+    """
+    kind, group, payloads = task
+    return render_group_report(kind, group, [_payload_record(payload) for payload in payloads])
+
+
+def generate_reports(system: StudentSystem, workers: int | None = None,
+                     kinds: tuple[str, ...] = GROUP_KINDS) -> dict[tuple[str, str], str]:
+    """
+    Builds the reports of every class and/or major.
+
+    Students are grouped in one pass (instead of one roster scan per class). With several
+    workers, building every student's get_student_summary, sorting and rendering are spread
+    per group over a pool of processes, and the parent only collects each student's data;
+    otherwise every summary is built once in this process and shared by the student's groups.
+
+    Args:
+        system (StudentSystem): System to report on.
+        workers (int | None): Number of worker processes; None uses one per CPU, 0 or 1 renders in this process.
+        kinds (tuple[str, ...]): Groupings to report: 'class' and/or 'major'.
+
+    Returns:
+        dict[tuple[str, str], str]: Report text per (kind, group name), ordered by kind and group name.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        groups = group_records(system, kinds)
+        return {(kind, group): render_group_report(kind, group, groups[(kind, group)])
+                for kind, group in sorted(groups)}
+    groups = _group(system, kinds, _student_payload)
+    tasks = [(kind, group, groups[(kind, group)]) for kind, group in sorted(groups)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        texts = executor.map(_render_task, tasks, chunksize=max(1, len(tasks) // (4 * workers)))
+        return {(kind, group): text for (kind, group, _), text in zip(tasks, texts)}
@@ -0,0 +1,335 @@
+import unicodedata
+from bisect import bisect_left
+from collections import Counter
+from functools import lru_cache
+from itertools import chain
+
+from src.student import Student
+
+# Letters that Unicode does not decompose into a base letter and a diacritic.
+_UNDECOMPOSED = str.maketrans({"ł": "l", "Ł": "L", "đ": "d", "Đ": "D", "ø": "o", "Ø": "O", "ı": "i"})
+
+_REBUILD_PENDING = 64
+
+
+@lru_cache(maxsize=1 << 16)
+def normalize(text: str) -> str:
+    """
+    Normalises a name for searching: without diacritics, case-insensitive, single spaces.
+
+    Results are cached, as the same first and last names recur across many students.
+
+    Args:
+        text (str): Name or query, e.g. 'Dąbrowska'.
+
+    Returns:
+        str: Normalised text, e.g. 'dabrowska'.
+    """
+    decomposed = unicodedata.normalize("NFKD", text.translate(_UNDECOMPOSED))
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.casefold().split())
+
+
+def trigrams(term: str) -> set[str]:
+    """
+    Returns the trigrams of a term, padded so that its start and end form trigrams too.
+
+    Args:
+        term (str): Normalised term.
+
+    Returns:
+        set[str]: The distinct trigrams.
+    """
+    padded = f"  {term} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _allowed_distance(letters: int) -> int:
+    """
+    Returns the default edit distance allowed for a query of the given length.
+
+    Args:
+        letters (int): Number of letters in the query.
+
+    Returns:
+        int: 0 for up to 2 letters, 1 for up to 5, 2 for longer queries.
+    """
+    return 0 if letters <= 2 else 1 if letters <= 5 else 2
+
+
+def bounded_distance(a: str, b: str, limit: int) -> int:
+    """
+    Computes the Levenshtein distance of two strings, giving up once it exceeds a limit.
+
+    Args:
+        a (str): First string.
+        b (str): Second string.
+        limit (int): Largest distance of interest.
+
+    Returns:
+        int: The distance, or limit + 1 if it is larger than the limit.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    if a == b:
+        return 0
+    over = limit + 1
+    # Only cells within `limit` of the diagonal can stay within the limit; all others count as `over`.
+    previous = [j if j <= limit else over for j in range(len(b) + 1)]
+    for i, char in enumerate(a, start=1):
+        current = [over] * (len(b) + 1)
+        if i <= limit:
+            current[0] = i
+        best = current[0]
+        for j in range(max(1, i - limit), min(len(b), i + limit) + 1):
+            value = previous[j - 1] + (char != b[j - 1])
+            if previous[j] < value:
+                value = previous[j] + 1
+            if current[j - 1] < value:
+                value = current[j - 1] + 1
+            if value > over:
+                value = over
+            current[j] = value
+            if value < best:
+                best = value
+        if best > limit:
+            return over
+        previous = current
+    return previous[-1]
+
+
+class NameIndex:
+    """
+    Search index over student names, for autocomplete and typo-tolerant lookup.
+
+    Students are indexed under their normalised first and last names. The distinct names are
+    kept in a sorted list for prefix search by bisection and in a trigram index that narrows
+    fuzzy search down to a few candidates before computing edit distances. Full-name queries
+    such as 'jan kow' or 'kowalski j' are answered from the students of the exactly matching word.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty index.
+        """
+        self._students: dict[str, dict[Student, None]] = {}
+        self._names: dict[Student, tuple[str, str]] = {}
+        self._trigrams: dict[str, set[str]] = {}
+        self._trigram_counts: dict[str, int] = {}
+        self._sorted: list[str] = []
+        self._pending: list[str] = []
+        self._stale = 0
+
+    def __len__(self) -> int:
+        """
+        Returns the number of distinct indexed names.
+
+        Returns:
+            int: Number of names.
+        """
+        return len(self._students)
+
+    def add(self, student: Student) -> None:
+        """
+        Indexes a student.
+
+        Args:
+            student (Student): Student to index.
+        """
+        first, last = self._names[student] = normalize(student.name), normalize(student.last_name)
+        for name in (first, last):
+            students = self._students.get(name)
+            if students is None:
+                if not name:
+                    continue
+                students = self._students[name] = {}
+                self._pending.append(name)
+                name_trigrams = trigrams(name)
+                self._trigram_counts[name] = len(name_trigrams)
+                for trigram in name_trigrams:
+                    self._trigrams.setdefault(trigram, set()).add(name)
+            students[student] = None
+
+    def remove(self, student: Student) -> None:
+        """
+        Removes a student from the index, under the name it was indexed with.
+
+        Args:
+            student (Student): Student to remove.
+        """
+        for name in self._names.pop(student):
+            students = self._students.get(name)
+            if students is None or student not in students:
+                continue  # empty name, or first name equal to last name
+            del students[student]
+            if not students:
+                del self._students[name]
+                del self._trigram_counts[name]
+                self._stale += 1
+                for trigram in trigrams(name):
+                    names = self._trigrams[trigram]
+                    names.discard(name)
+                    if not names:
+                        del self._trigrams[trigram]
+
+    def on_change(self, change: str, student: Student, *args) -> None:
+        """
+        Keeps the index up to date; registered as a StudentSystem listener.
+
+        Args:
+            change (str): Kind of change reported by the system.
+            student (Student): The affected student.
+            *args: Change details.
+        """
+        if change == "student_added":
+            self.add(student)
+        elif change == "student_removed":
+            self.remove(student)
+        elif change == "renamed":
+            self.remove(student)
+            self.add(student)
+
+    def _ordered_names(self) -> list[str]:
+        """
+        Returns the sorted list of names, merging names added since the last search.
+
+        A few new names are inserted in place; after a bulk load, or once many removed names
+        linger in the list, it is rebuilt with a single sort.
+
+        Returns:
+            list[str]: Sorted names; may still contain removed names, which callers skip.
+        """
+        if len(self._pending) > _REBUILD_PENDING or self._stale > len(self._sorted) // 2 + _REBUILD_PENDING:
+            self._sorted = sorted(self._students)
+            self._stale = 0
+        else:
+            for name in self._pending:
+                if name in self._students:
+                    position = bisect_left(self._sorted, name)
+                    if position == len(self._sorted) or self._sorted[position] != name:
+                        self._sorted.insert(position, name)
+        self._pending.clear()
+        return self._sorted
+
+    def prefix(self, query: str, limit: int = 10) -> list[Student]:
+        """
+        Finds students whose first name, last name or full name (in either order) starts with the query,
+        ignoring case and diacritics.
+
+        Args:
+            query (str): Beginning of a name, e.g. 'kowal', 'jan kow' or 'kowalski j'.
+            limit (int): Maximum number of students returned.
+
+        Returns:
+            list[Student]: Matching students, ordered by the matching name.
+        """
+        query = normalize(query)
+        if not query or limit <= 0:
+            return []
+        names = self._ordered_names()
+        found: dict[Student, None] = {}
+        for position in range(bisect_left(names, query), len(names)):
+            name = names[position]
+            if not name.startswith(query):
+                break
+            for student in self._students.get(name, ()):
+                found[student] = None
+                if len(found) >= limit:
+                    return list(found)
+        words = query.split(" ")
+        full_names = []
+        for split in range(1, len(words)):
+            head, tail = " ".join(words[:split]), " ".join(words[split:])
+            for student in self._students.get(head, ()):
+                first, last = self._names[student]
+                if first == head and last.startswith(tail):
+                    full_names.append((f"{first} {last}", student))
+                if last == head and first.startswith(tail):
+                    full_names.append((f"{last} {first}", student))
+        full_names.sort(key=lambda item: item[0])
+        for _, student in full_names:
+            found[student] = None
+            if len(found) >= limit:
+                break
+        return list(found)
+
+    def _close_names(self, word: str, max_distance: int) -> dict[str, int]:
+        """
+        Finds the first and last names within an edit distance of a word.
+
+        Each edit adds or removes at most three trigrams on either side, so only names of a
+        similar length sharing at least max(trigrams of the word, trigrams of the name) - 3 * max_distance
+        trigrams with the word (counted in C by Counter) get their edit distance computed.
+
+        Args:
+            word (str): Normalised word.
+            max_distance (int): Largest edit distance allowed.
+
+        Returns:
+            dict[str, int]: Edit distance per close name.
+        """
+        word_trigrams = trigrams(word)
+        edited = 3 * max_distance
+        shared = Counter(chain.from_iterable(self._trigrams.get(trigram, ()) for trigram in word_trigrams))
+        counts = self._trigram_counts
+        if len(word_trigrams) <= edited:
+            # Very short words can be close to short names without sharing any trigram.
+            for name, count in counts.items():
+                if count <= edited and name not in shared:
+                    shared[name] = 0
+        close = {}
+        for name, count in shared.items():
+            if count + edited >= max(len(word_trigrams), counts[name]) and abs(len(name) - len(word)) <= max_distance:
+                distance = bounded_distance(word, name, max_distance)
+                if distance <= max_distance:
+                    close[name] = distance
+        return close
+
+    def fuzzy(self, query: str, max_distance: int | None = None, limit: int = 10) -> list[Student]:
+        """
+        Finds students whose name is within an edit distance of the query, ignoring case and diacritics.
+
+        A one-word query is matched against first and last names. A longer query is split into
+        its first word and the rest, matched as first and last name in either order, and the
+        distances of both parts together must stay within max_distance.
+
+        Args:
+            query (str): First name, last name or full name, possibly misspelled.
+            max_distance (int | None): Largest total number of inserted, deleted or replaced letters;
+                                       None allows 0 for up to 2 letters, 1 for up to 5 and 2 for longer
+                                       queries, and the same per part of a full name.
+            limit (int): Maximum number of students returned.
+
+        Returns:
+            list[Student]: Matching students, closest names first.
+        """
+        words = normalize(query).split(" ")
+        if words == [""] or limit <= 0:
+            return []
+        parts = [words[0], " ".join(words[1:])] if len(words) > 1 else words
+        if max_distance is None:
+            max_distance = _allowed_distance(sum(map(len, words)))
+            limits = [min(max_distance, _allowed_distance(len(part))) for part in parts]
+        else:
+            limits = [max_distance] * len(parts)
+        distances: dict[Student, int] = {}
+        if len(words) == 1:
+            for name, distance in self._close_names(words[0], limits[0]).items():
+                for student in self._students[name]:
+                    if distance < distances.get(student, distance + 1):
+                        distances[student] = distance
+        else:
+            first_part = self._close_names(parts[0], limits[0])
+            second_part = self._close_names(parts[1], limits[1])
+            if sum(len(self._students[name]) for name in second_part) < sum(
+                    len(self._students[name]) for name in first_part):
+                first_part, second_part = second_part, first_part
+            for name, distance in first_part.items():
+                for student in self._students[name]:
+                    for mine, other in (self._names[student], reversed(self._names[student])):
+                        if mine == name and other in second_part:
+                            total = distance + second_part[other]
+                            if total <= max_distance and total < distances.get(student, max_distance + 1):
+                                distances[student] = total
+        ranked = sorted(distances, key=lambda student: (distances[student], self._names[student]))
+        return ranked[:limit]
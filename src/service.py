@@ -0,0 +1,348 @@
+"""
+Asyncio service exposing StudentSystem operations over a local TCP socket.
+
+Protocol: one JSON object per line in each direction. A request looks like
+{"id": 1, "op": "find", "args": {"name": "Jan", "last_name": "Kowalski", "year": 2023}} and is
+answered with {"id": 1, "ok": true, "result": ...} or {"id": 1, "ok": false, "error": "..."}.
+Requests on one connection may be pipelined; responses carry the request id.
+
+Usage:
+    python -m src.service [--host 127.0.0.1] [--port 8765] [--db students_data]
+"""
+import argparse
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from src.student import Student
+from src.student_system import StudentSystem
+
+
+def _summary(student: Student | None) -> dict[str, object] | None:
+    """
+    Converts a student into a JSON-friendly summary.
+
+    Args:
+        student (Student | None): Student to convert.
+
+    Returns:
+        dict[str, object] | None: Student.get_student_summary plus first_name and last_name fields, or None.
+    """
+    if student is None:
+        return None
+    summary = student.get_student_summary()
+    summary["first_name"] = student.name
+    summary["last_name"] = student.last_name
+    return summary
+
+
+def _find(system: StudentSystem, name: str, last_name: str, year: int):
+    """
+    Handles the 'find' operation.
+
+    Args:
+        system (StudentSystem): Served system.
+        name (str): First name.
+        last_name (str): Last name.
+        year (int): Year.
+
+    Returns:
+        dict[str, object] | None: Summary of the student, or None if not found.
+    """
+    return _summary(system.find_student(name, last_name, year))
+
+
+def _add_grade(system: StudentSystem, name: str, last_name: str, year: int, subject: str, grade: float):
+    """
+    Handles the 'add_grade' operation.
+
+    Args:
+        system (StudentSystem): Served system.
+        name (str): First name.
+        last_name (str): Last name.
+        year (int): Year.
+        subject (str): Subject of the grade.
+        grade (float): The grade.
+
+    Returns:
+        bool: True once the grade is added.
+
+    Raises:
+        ValueError: If the student is not found or the grade is invalid.
+    """
+    student = system.find_student(name, last_name, year)
+    if student is None:
+        raise ValueError(f"Student {name} {last_name} ({year}) not found")
+    student.add_grade(subject, grade)
+    return True
+
+
+def _class_average(system: StudentSystem, class_grade: str):
+    """
+    Handles the 'class_average' operation.
+
+    Args:
+        system (StudentSystem): Served system.
+        class_grade (str): The class grade.
+
+    Returns:
+        float: The class average.
+    """
+    return system.get_class_average(class_grade)
+
+
+def _school_average(system: StudentSystem):
+    """
+    Handles the 'school_average' operation.
+
+    Args:
+        system (StudentSystem): Served system.
+
+    Returns:
+        float: The school average.
+    """
+    return system.get_school_average()
+
+
+def _top(system: StudentSystem, k: int = 10, class_grade: str | None = None, major: str | None = None):
+    """
+    Handles the 'top' operation.
+
+    Args:
+        system (StudentSystem): Served system.
+        k (int): Number of students.
+        class_grade (str | None): Class grade to filter by.
+        major (str | None): Major to filter by.
+
+    Returns:
+        list[dict[str, object]]: Summaries of the students with the highest average.
+    """
+    return [_summary(student) for student in system.top_students(k, class_grade, major)]
+
+
+def _bottom(system: StudentSystem, k: int = 10, class_grade: str | None = None, major: str | None = None):
+    """
+    Handles the 'bottom' operation.
+
+    Args:
+        system (StudentSystem): Served system.
+        k (int): Number of students.
+        class_grade (str | None): Class grade to filter by.
+        major (str | None): Major to filter by.
+
+    Returns:
+        list[dict[str, object]]: Summaries of the students with the lowest average.
+    """
+    return [_summary(student) for student in system.bottom_students(k, class_grade, major)]
+
+
+OPERATIONS = {
+    "find": _find,
+    "add_grade": _add_grade,
+    "class_average": _class_average,
+    "school_average": _school_average,
+    "top": _top,
+    "bottom": _bottom,
+}
+
+
+class StudentService:
+    """
+    Serves StudentSystem operations to many concurrent clients.
+
+    Requests from all connections go into one queue. A batcher takes everything queued at
+    once (up to max_batch requests) and runs the whole batch on a single worker thread, so
+    sorts never block the event loop and the system is only ever touched by one thread.
+    """
+
+    def __init__(self, system: StudentSystem, max_batch: int = 256):
+        """
+        Initializes the service.
+
+        Args:
+            system (StudentSystem): System to serve. It must not be changed by other threads while served.
+            max_batch (int): Maximum number of requests executed per batch.
+        """
+        self._system = system
+        self._max_batch = max_batch
+        self._queue: asyncio.Queue | None = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="student-service")
+        self._batcher: asyncio.Task | None = None
+        self.batches = 0
+        self.requests = 0
+
+    def _execute_batch(self, batch: list[dict]) -> list[dict]:
+        """
+        Runs a batch of requests on the worker thread.
+
+        Every request is answered on its own: an exception in one request, whatever its type,
+        only fails that request, and the changes made by the others stay reported as done.
+
+        Args:
+            batch (list[dict]): Decoded requests.
+
+        Returns:
+            list[dict]: Responses in the same order.
+        """
+        responses = []
+        for request in batch:
+            response = {"id": request.get("id")}
+            try:
+                operation = OPERATIONS.get(request.get("op"))
+                if operation is None:
+                    raise ValueError(f"Unknown operation: {request.get('op')!r}")
+                response["result"] = operation(self._system, **request.get("args", {}))
+                response["ok"] = True
+            except Exception as e:
+                response["ok"] = False
+                response["error"] = str(e)
+            responses.append(response)
+        return responses
+
+    async def _run_batches(self) -> None:
+        """
+        Drains the request queue in batches until cancelled.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            items = [await self._queue.get()]
+            while len(items) < self._max_batch and not self._queue.empty():
+                items.append(self._queue.get_nowait())
+            try:
+                responses = await loop.run_in_executor(self._executor, self._execute_batch,
+                                                       [request for request, _ in items])
+            except Exception as e:
+                responses = [{"id": request.get("id"), "ok": False, "error": str(e)} for request, _ in items]
+            self.batches += 1
+            self.requests += len(items)
+            for (_, future), response in zip(items, responses):
+                if not future.cancelled():
+                    future.set_result(response)
+
+    async def call(self, request: dict) -> dict:
+        """
+        Queues one request and waits for its response.
+
+        Args:
+            request (dict): Decoded request with 'id', 'op' and 'args'.
+
+        Returns:
+            dict: The response.
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((request, future))
+        return await future
+
+    async def _respond(self, line: bytes, writer: asyncio.StreamWriter) -> None:
+        """
+        Handles one request line and writes its response line.
+
+        Args:
+            line (bytes): Raw request line.
+            writer (asyncio.StreamWriter): Connection to answer on.
+        """
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("Request must be a JSON object")
+        except ValueError as e:
+            response = {"id": None, "ok": False, "error": f"Invalid request: {e}"}
+        else:
+            response = await self.call(request)
+        writer.write(json.dumps(response, ensure_ascii=False).encode() + b"\n")
+        await writer.drain()
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serves one client connection until it closes.
+
+        Args:
+            reader (asyncio.StreamReader): Incoming stream.
+            writer (asyncio.StreamWriter): Outgoing stream.
+        """
+        pending = set()
+        try:
+            while line := await reader.readline():
+                if line.strip():
+                    task = asyncio.create_task(self._respond(line, writer))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        finally:
+            writer.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765) -> asyncio.AbstractServer:
+        """
+        Starts listening and the batcher.
+
+        Args:
+            host (str): Address to bind.
+            port (int): Port to bind (0 picks a free port).
+
+        Returns:
+            asyncio.AbstractServer: The running server.
+        """
+        self._queue = asyncio.Queue()
+        self._batcher = asyncio.create_task(self._run_batches())
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    async def stop(self, server: asyncio.AbstractServer) -> None:
+        """
+        Stops the server, the batcher and the worker thread.
+
+        Args:
+            server (asyncio.AbstractServer): Server returned by start.
+        """
+        server.close()
+        await server.wait_closed()
+        self._batcher.cancel()
+        try:
+            await self._batcher
+        except asyncio.CancelledError:
+            pass
+        self._executor.shutdown()
+
+
+async def serve(system: StudentSystem, host: str, port: int) -> None:
+    """
+    Serves the system until the process is stopped.
+
+    Args:
+        system (StudentSystem): System to serve.
+        host (str): Address to bind.
+        port (int): Port to bind.
+    """
+    service = StudentService(system)
+    server = await service.start(host, port)
+    print(f"Serving on {', '.join(str(sock.getsockname()) for sock in server.sockets)}")
+    try:
+        await server.serve_forever()
+    finally:
+        await service.stop(server)
+
+
+def main() -> None:
+    """
+    Parses the command line, loads the storage and serves it until interrupted.
+
+    --db is opened like in the CLI and the menu (src.cli.open_storage): a SQLite database for
+    .db/.sqlite/.sqlite3 paths, otherwise a journal directory, students_data by default.
+    """
+    from src.cli import DEFAULT_DB, open_storage
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--db", default=DEFAULT_DB,
+                        help=f"SQLite database file or journal directory to serve (default: {DEFAULT_DB})")
+    args = parser.parse_args()
+    with open_storage(args.db) as storage:
+        system = storage.load()
+        try:
+            asyncio.run(serve(system, args.host, args.port))
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
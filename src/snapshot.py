@@ -0,0 +1,304 @@
+import gc
+import mmap
+import os
+import struct
+import sys
+from array import array
+from contextlib import contextmanager
+from functools import partial
+
+from src.student import Student
+from src.student_system import StudentSystem
+
+MAGIC = b"SMSSNAP\x00"
+_FORMAT_VERSION = 1
+
+# magic, version, students, strings, subject runs, grades,
+# offsets of: string offsets, string data, student records, subject runs, grades
+_HEADER = struct.Struct("<8sIIIIQQQQQQ")
+# name, last name, class, major (string ids), year, first subject run, subject runs, grade sum, grade count
+_STUDENT = struct.Struct("<IIIIiIIdI")
+# subject (string id), first grade, number of grades
+_RUN = struct.Struct("<IQI")
+_GRADE_SIZE = array("d").itemsize
+
+
+@contextmanager
+def _gc_paused():
+    """
+    Pauses the cyclic garbage collector, which would otherwise rescan the growing heap
+    many times while hundreds of thousands of (acyclic) objects are created.
+    """
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if collecting:
+            gc.enable()
+
+
+def _packed(values: array) -> bytes:
+    """
+    Returns the bytes of an array in little-endian order.
+
+    Args:
+        values (array): Array to pack.
+
+    Returns:
+        bytes: Little-endian bytes.
+    """
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def write_snapshot(system: StudentSystem, path: str) -> None:
+    """
+    Writes all students and grades of a system to a binary snapshot file.
+
+    Layout (little-endian): a header, a string table (offsets, then UTF-8 data) holding every
+    name, class, major and subject once, fixed-width student records, fixed-width subject runs
+    and all grades packed as doubles. Each student's subject runs, and each run's grades, are contiguous.
+
+    The file is written to a temporary file and then renamed over the path, so a Snapshot that
+    still maps the old file keeps reading it, and a crash never leaves a half-written snapshot.
+
+    Args:
+        system (StudentSystem): System to write.
+        path (str): Path of the snapshot file.
+    """
+    strings: dict[str, int] = {}
+
+    def string_id(value: str) -> int:
+        value_id = strings.get(value)
+        if value_id is None:
+            value_id = strings[value] = len(strings)
+        return value_id
+
+    records = bytearray()
+    runs = bytearray()
+    grades = array("d")
+    run_count = 0
+    students = 0
+    for student in system.iter_students():
+        first_run = run_count
+        for subject, grades_list in student._grades.items():
+            runs += _RUN.pack(string_id(subject), len(grades), len(grades_list))
+            grades.extend(grades_list)
+            run_count += 1
+        records += _STUDENT.pack(string_id(student.name), string_id(student.last_name),
+                                 string_id(student.class_grade), string_id(student.major), student.year,
+                                 first_run, run_count - first_run, student._grade_sum, student._grade_count)
+        students += 1
+    encoded = [value.encode("utf-8") for value in strings]
+    string_offsets = array("Q", [0])
+    for data in encoded:
+        string_offsets.append(string_offsets[-1] + len(data))
+    string_data = b"".join(encoded)
+
+    offsets_at = _HEADER.size
+    data_at = offsets_at + len(string_offsets) * string_offsets.itemsize
+    records_at = data_at + len(string_data)
+    runs_at = records_at + len(records)
+    grades_at = runs_at + len(runs)
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as file:
+        file.write(_HEADER.pack(MAGIC, _FORMAT_VERSION, students, len(strings), run_count, len(grades),
+                                offsets_at, data_at, records_at, runs_at, grades_at))
+        file.write(_packed(string_offsets))
+        file.write(string_data)
+        file.write(records)
+        file.write(runs)
+        file.write(_packed(grades))
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary, path)
+
+
+class Snapshot:
+    """
+    Binary snapshot opened through mmap.
+
+    Opening only reads the header; strings are decoded, student records turned into Student
+    objects and grades copied out of the file only when they are accessed. Students of a
+    system built with to_system read their grades from the mapping on first use, so the
+    snapshot must stay open while such a system is used.
+    """
+
+    def __init__(self, path: str):
+        """
+        Opens a snapshot file.
+
+        Args:
+            path (str): Path of the snapshot file.
+
+        Raises:
+            ValueError: If the file is not a snapshot in a supported version.
+        """
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) < _HEADER.size:
+            self._mmap.close()
+            raise ValueError(f"Not a supported student snapshot: {path}")
+        (magic, version, self._students, string_count, self._run_count, self._grade_count, offsets_at,
+         self._data_at, self._records_at, self._runs_at, self._grades_at) = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != _FORMAT_VERSION:
+            self._mmap.close()
+            raise ValueError(f"Not a supported student snapshot: {path}")
+        self._string_offsets = array("Q")
+        self._string_offsets.frombytes(self._mmap[offsets_at:self._data_at])
+        if sys.byteorder == "big":
+            self._string_offsets.byteswap()
+        self._strings: list[str | None] = [None] * string_count
+
+    def __len__(self) -> int:
+        """
+        Returns the number of students in the snapshot.
+
+        Returns:
+            int: Number of students.
+        """
+        return self._students
+
+    def __getitem__(self, index: int) -> Student:
+        """
+        Materialises one student with its grades.
+
+        Args:
+            index (int): Position of the student (0-based, in roster order).
+
+        Returns:
+            Student: A new Student object.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if not -self._students <= index < self._students:
+            raise IndexError("Snapshot index out of range")
+        record = _STUDENT.unpack_from(self._mmap, self._records_at + (index % self._students) * _STUDENT.size)
+        student = self._student(record)
+        student._grades  # copy the grades out of the mapping now, so the student outlives the snapshot
+        return student
+
+    def _string(self, string_id: int) -> str:
+        """
+        Returns a string of the string table, decoding it on first use.
+
+        Args:
+            string_id (int): Id of the string.
+
+        Returns:
+            str: The string.
+        """
+        value = self._strings[string_id]
+        if value is None:
+            start, end = self._string_offsets[string_id], self._string_offsets[string_id + 1]
+            value = self._strings[string_id] = sys.intern(
+                self._mmap[self._data_at + start:self._data_at + end].decode("utf-8"))
+        return value
+
+    def _student(self, record: tuple) -> Student:
+        """
+        Builds a student from a record; its grades are read from the mapping on first use.
+
+        Args:
+            record (tuple): Unpacked student record.
+
+        Returns:
+            Student: The student.
+        """
+        name, last_name, class_grade, major, year, first_run, runs, grade_sum, grade_count = record
+        string = self._string
+        student = Student(string(name), string(last_name), string(class_grade), string(major), year)
+        if runs:
+            student._defer_grades(partial(self._load_grades, first_run, runs), grade_sum, grade_count)
+        return student
+
+    def _load_grades(self, first_run: int, runs: int, student: Student) -> dict[str, array]:
+        """
+        Copies one student's grades out of the mapping.
+
+        Args:
+            first_run (int): Index of the student's first subject run.
+            runs (int): Number of subject runs.
+            student (Student): The student (unused; required by Student._defer_grades).
+
+        Returns:
+            dict[str, array]: Grades per subject.
+
+        Raises:
+            ValueError: If the snapshot has been closed.
+        """
+        start = self._runs_at + first_run * _RUN.size
+        runs = list(_RUN.iter_unpack(self._mmap[start:start + runs * _RUN.size]))
+        first_grade = runs[0][1]
+        start = self._grades_at + first_grade * _GRADE_SIZE
+        end = self._grades_at + (runs[-1][1] + runs[-1][2]) * _GRADE_SIZE
+        values = array("d")
+        values.frombytes(self._mmap[start:end])
+        if sys.byteorder == "big":
+            values.byteswap()
+        string = self._string
+        return {string(subject): values[offset - first_grade:offset - first_grade + count]
+                for subject, offset, count in runs}
+
+    def to_system(self) -> StudentSystem:
+        """
+        Builds a StudentSystem holding every student of the snapshot.
+
+        Only the fixed-width student records are read; grades stay in the mapping until a
+        student's grades are first used, while class and school averages are correct at once.
+
+        Returns:
+            StudentSystem: The loaded system.
+        """
+        records = memoryview(self._mmap)[self._records_at:self._records_at + self._students * _STUDENT.size]
+        try:
+            with _gc_paused():
+                system = StudentSystem()
+                system.add_students_bulk(self._student(record) for record in _STUDENT.iter_unpack(records))
+        finally:
+            records.release()
+        return system
+
+    def close(self) -> None:
+        """
+        Closes the mapping. Grades not loaded by then can no longer be read.
+        """
+        self._mmap.close()
+
+    def __enter__(self):
+        """
+        Returns the snapshot itself for use in a with block.
+
+        Returns:
+            Snapshot: This snapshot.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Closes the mapping at the end of a with block.
+        """
+        self.close()
+
+
+def load_snapshot(path: str) -> StudentSystem:
+    """
+    Loads a whole snapshot into a StudentSystem, reading every grade before closing the file.
+
+    Use Snapshot(path).to_system() instead to load grades lazily.
+
+    Args:
+        path (str): Path of the snapshot file.
+
+    Returns:
+        StudentSystem: The loaded system.
+    """
+    with Snapshot(path) as snapshot, _gc_paused():
+        system = snapshot.to_system()
+        for student in system.iter_students():
+            student._grades
+    return system
@@ -0,0 +1,132 @@
+import math
+from collections import Counter
+from itertools import chain
+from typing import Iterable, NamedTuple
+
+from src.student import GRADE_MAX, GRADE_MIN, Student
+
+HISTOGRAM_BINS = 10
+GROUP_BY = ("class_grade", "major", "year", "subject")
+
+
+class GroupStats(NamedTuple):
+    """
+    Statistics of the grades in one group of students.
+
+    The histogram splits the 1.0–6.0 scale into HISTOGRAM_BINS equal bins, like
+    GradeBook.grade_distribution: bin k holds grades in [1.0 + k * w, 1.0 + (k + 1) * w),
+    and the last bin also holds 6.0. Mean, min, max and stdev are None for a group without grades.
+    """
+    key: object
+    students: int
+    count: int
+    mean: float | None
+    min: float | None
+    max: float | None
+    stdev: float | None
+    histogram: tuple[int, ...]
+
+
+def histogram_edges(bins: int = HISTOGRAM_BINS) -> list[float]:
+    """
+    Returns the bin edges of the grade histograms.
+
+    Args:
+        bins (int): Number of bins.
+
+    Returns:
+        list[float]: bins + 1 edges from 1.0 to 6.0.
+    """
+    width = (GRADE_MAX - GRADE_MIN) / bins
+    return [GRADE_MIN + i * width for i in range(bins)] + [GRADE_MAX]
+
+
+class _Accumulator:
+    """
+    Grade arrays of one group, collected during the pass and counted per distinct value at the end.
+
+    Grades take few distinct values, so counting them all at once (a C loop in Counter) and
+    deriving every statistic from the distinct values is much cheaper than a Python loop per grade.
+    """
+
+    __slots__ = ("students", "arrays")
+
+    def __init__(self):
+        """
+        Initializes an empty accumulator with no students and no grade arrays.
+        """
+        self.students = 0
+        self.arrays: list = []
+
+    def result(self, key, bins: int) -> GroupStats:
+        """
+        Turns the counted grades into GroupStats.
+
+        Args:
+            key: Group key.
+            bins (int): Number of histogram bins.
+
+        Returns:
+            GroupStats: Statistics of the group (population standard deviation).
+        """
+        histogram = [0] * bins
+        values = Counter(chain.from_iterable(self.arrays))
+        if not values:
+            return GroupStats(key, self.students, 0, None, None, None, None, tuple(histogram))
+        scale = bins / (GRADE_MAX - GRADE_MIN)
+        count = 0
+        total = 0.0
+        for grade, times in values.items():
+            count += times
+            total += grade * times
+            index = int((grade - GRADE_MIN) * scale)
+            histogram[index if index < bins else bins - 1] += times
+        mean = total / count
+        variance = sum((grade - mean) ** 2 * times for grade, times in values.items()) / count
+        return GroupStats(key, self.students, count, mean, min(values), max(values), math.sqrt(variance),
+                          tuple(histogram))
+
+
+def group_stats(students: Iterable[Student], by: str, bins: int = HISTOGRAM_BINS) -> dict[object, GroupStats]:
+    """
+    Computes grade statistics per group in a single pass over the students' grades.
+
+    Classes and majors are grouped case-insensitively (keys are lower-cased), like
+    get_students_by_class and get_students_from_major. Grouping by class, major or year
+    includes students without grades in the student counts; grouping by subject only
+    counts students having grades in that subject.
+
+    Args:
+        students (Iterable[Student]): Students to aggregate.
+        by (str): 'class_grade', 'major', 'year' or 'subject'.
+        bins (int): Number of histogram bins.
+
+    Returns:
+        dict[object, GroupStats]: Statistics per group key, ordered by key.
+
+    Raises:
+        ValueError: If 'by' is not a supported grouping.
+    """
+    if by not in GROUP_BY:
+        raise ValueError(f"Unsupported grouping: {by}")
+    groups: dict[object, _Accumulator] = {}
+    for student in students:
+        if by == "subject":
+            for subject, grades_list in student._grades.items():
+                if grades_list:
+                    group = groups.get(subject)
+                    if group is None:
+                        group = groups[subject] = _Accumulator()
+                    group.students += 1
+                    group.arrays.append(grades_list)
+            continue
+        key = getattr(student, by)
+        if by != "year":
+            key = key.lower()
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = _Accumulator()
+        group.students += 1
+        if student._grade_count:
+            group.arrays.extend(student._grades.values())
+    return {key: groups[key].result(key, bins) for key in sorted(groups)}
@@ -0,0 +1,232 @@
+import sqlite3
+from abc import ABC, abstractmethod
+from array import array
+from itertools import groupby
+
+from src.student import Student
+from src.student_system import StudentSystem
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS students (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    last_name TEXT NOT NULL,
+    class_grade TEXT NOT NULL,
+    major TEXT NOT NULL,
+    year INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS grades (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    student_id INTEGER NOT NULL REFERENCES students(id),
+    subject TEXT NOT NULL,
+    value REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS grades_by_student ON grades (student_id, subject);
+"""
+
+_INSERT_STUDENT = "INSERT INTO students (id, name, last_name, class_grade, major, year) VALUES (?, ?, ?, ?, ?, ?)"
+_DELETE_STUDENT = "DELETE FROM students WHERE id = ?"
+_RENAME_STUDENT = "UPDATE students SET name = ?, last_name = ? WHERE id = ?"
+_CHANGE_CLASS = "UPDATE students SET class_grade = ? WHERE id = ?"
+_CHANGE_MAJOR = "UPDATE students SET major = ? WHERE id = ?"
+_INSERT_GRADE = "INSERT INTO grades (student_id, subject, value) VALUES (?, ?, ?)"
+_DELETE_LAST_GRADE = ("DELETE FROM grades WHERE id = "
+                      "(SELECT MAX(id) FROM grades WHERE student_id = ? AND subject = ?)")
+_DELETE_SUBJECT = "DELETE FROM grades WHERE student_id = ? AND subject = ?"
+_DELETE_GRADES = "DELETE FROM grades WHERE student_id = ?"
+
+
+class Storage(ABC):
+    """
+    Base class for persistent StudentSystem backends.
+
+    A backend loads a StudentSystem and then listens to its changes, writing them out.
+    Backends must implement load, flush and close; an incomplete one cannot be created.
+    """
+
+    @abstractmethod
+    def load(self) -> StudentSystem:
+        """
+        Loads the stored students into a new StudentSystem and starts persisting its changes.
+
+        Returns:
+            StudentSystem: The loaded system.
+        """
+
+    @abstractmethod
+    def flush(self) -> None:
+        """
+        Writes all pending changes.
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """
+        Writes all pending changes and releases the backend.
+        """
+
+    def __enter__(self):
+        """
+        Returns the storage itself for use in a with block.
+
+        Returns:
+            Storage: This storage.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Closes the storage at the end of a with block.
+        """
+        self.close()
+
+
+class SQLiteStorage(Storage):
+    """
+    Stores students and grades in a SQLite database file.
+
+    Student rows are loaded up front, but each student's grades are only fetched on first
+    access. Changes are queued and written in batches, one transaction per batch.
+    """
+
+    def __init__(self, path: str, batch_size: int = 10_000):
+        """
+        Opens (or creates) the database.
+
+        Args:
+            path (str): Path of the database file (':memory:' for a temporary database).
+            batch_size (int): Number of queued changes that triggers an automatic flush.
+        """
+        # Access is serialised by the caller, but may come from a worker thread (e.g. the service).
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+        self._batch_size = batch_size
+        self._pending: list[tuple[str, tuple]] = []
+        self._ids: dict[Student, int] = {}
+        self._next_id = 1
+        self._system: StudentSystem | None = None
+
+    def load(self) -> StudentSystem:
+        """
+        Loads the stored students into a new StudentSystem and starts persisting its changes.
+
+        Grades stay in the database until a student's grades are first used; class and
+        school averages are available immediately from per-student totals.
+
+        Returns:
+            StudentSystem: The loaded system.
+
+        Raises:
+            RuntimeError: If this storage has already been loaded.
+        """
+        if self._system is not None:
+            raise RuntimeError("Storage is already loaded")
+        system = StudentSystem()
+        totals = {student_id: (grade_sum, grade_count) for student_id, grade_sum, grade_count in
+                  self._connection.execute(
+                      "SELECT student_id, SUM(value), COUNT(*) FROM grades GROUP BY student_id")}
+        for student_id, name, last_name, class_grade, major, year in self._connection.execute(
+                "SELECT id, name, last_name, class_grade, major, year FROM students ORDER BY id"):
+            student = Student(name, last_name, class_grade, major, year)
+            if student_id in totals:
+                student._defer_grades(self._load_grades, *totals[student_id])
+            self._ids[student] = student_id
+            self._next_id = student_id + 1
+            system.add_student(student)
+        system.add_listener(self._on_change)
+        self._system = system
+        return system
+
+    def _load_grades(self, student: Student) -> dict[str, array]:
+        """
+        Fetches one student's grades, in the order they were added.
+
+        Args:
+            student (Student): Student stored in this database.
+
+        Returns:
+            dict[str, array]: Grades per subject.
+        """
+        grades: dict[str, array] = {}
+        for subject, value in self._connection.execute(
+                "SELECT subject, value FROM grades WHERE student_id = ? ORDER BY id", (self._ids[student],)):
+            if subject not in grades:
+                grades[subject] = array("d")
+            grades[subject].append(value)
+        return grades
+
+    def _queue(self, sql: str, params: tuple) -> None:
+        """
+        Queues one write, flushing once the batch is full.
+
+        Args:
+            sql (str): Statement to execute.
+            params (tuple): Statement parameters.
+        """
+        self._pending.append((sql, params))
+        if len(self._pending) >= self._batch_size:
+            self.flush()
+
+    def _on_change(self, change: str, student: Student, *args) -> None:
+        """
+        Queues the database writes for a change in the loaded system.
+
+        Args:
+            change (str): Kind of change reported by the system.
+            student (Student): The affected student.
+            *args: Change details.
+        """
+        if change == "grade_added":
+            subject, grade = args
+            self._queue(_INSERT_GRADE, (self._ids[student], subject, grade))
+        elif change == "grade_removed":
+            self._queue(_DELETE_LAST_GRADE, (self._ids[student], args[0]))
+        elif change == "subject_deleted":
+            self._queue(_DELETE_SUBJECT, (self._ids[student], args[0]))
+        elif change == "grades_cleared":
+            self._queue(_DELETE_GRADES, (self._ids[student],))
+        elif change == "renamed":
+            self._queue(_RENAME_STUDENT, (student.name, student.last_name, self._ids[student]))
+        elif change == "class_changed":
+            self._queue(_CHANGE_CLASS, (student.class_grade, self._ids[student]))
+        elif change == "major_changed":
+            self._queue(_CHANGE_MAJOR, (student.major, self._ids[student]))
+        elif change == "student_added":
+            student_id = self._ids[student] = self._next_id
+            self._next_id += 1
+            self._queue(_INSERT_STUDENT, (student_id, student.name, student.last_name,
+                                          student.class_grade, student.major, student.year))
+            for subject, grades_list in student._grades.items():
+                for grade in grades_list:
+                    self._queue(_INSERT_GRADE, (student_id, subject, grade))
+        elif change == "student_removed":
+            student._grades  # the removed student keeps its grades, so fetch them before deleting
+            student_id = self._ids.pop(student)
+            self._queue(_DELETE_GRADES, (student_id,))
+            self._queue(_DELETE_STUDENT, (student_id,))
+
+    def flush(self) -> None:
+        """
+        Writes all pending changes in a single transaction.
+
+        Consecutive writes of the same kind are sent together with executemany.
+        """
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        with self._connection:
+            for sql, group in groupby(pending, key=lambda item: item[0]):
+                self._connection.executemany(sql, [params for _, params in group])
+
+    def close(self) -> None:
+        """
+        Writes all pending changes, stops persisting the system and closes the database.
+
+        Grades that were never accessed cannot be loaded afterwards, so the system
+        should not be used once its storage is closed.
+        """
+        self.flush()
+        if self._system is not None:
+            self._system.remove_listener(self._on_change)
+            self._system = None
+        self._connection.close()
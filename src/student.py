@@ -1,8 +1,39 @@
+import sys
+from array import array
+
+from src.metrics import instrument_class, instrumented
+
+GRADE_MIN = 1.0
+GRADE_MAX = 6.0
+
+
+def validate_grade(grade: float) -> None:
+    """
+    Checks that a grade is on the school's 1.0–6.0 scale.
+
+    Args:
+        grade (float): Grade value to check.
+
+    Raises:
+        ValueError: If the grade is not in the valid range (1.0–6.0).
+    """
+    if not GRADE_MIN <= grade <= GRADE_MAX:
+        raise ValueError("Grade must be between 1.0 and 6.0")
+
+
+@instrument_class
 class Student:
     """
     Represents a student with basic information, specialization, class, and a record of grades for each subject.
+
+    Students are stored compactly: the class uses __slots__, repeated strings (class, major,
+    subjects) are interned and grades are kept in packed array('d') buffers per subject.
     """
 
+    __slots__ = ("name", "last_name", "class_grade", "major", "year", "_grade_store", "_grade_loader",
+                 "_average", "_subject_averages", "_subject_sums", "_grade_sum", "_grade_count", "_listeners",
+                 "_new_subject")
+
     def __init__(self, name: str, last_name: str, class_grade: str, major: str, year: int):
         """
         Initializes a Student object.
@@ -16,10 +47,114 @@ class Student:
         """
         self.name = name
         self.last_name = last_name
-        self.class_grade = class_grade
-        self.major = major
+        self.class_grade = sys.intern(class_grade)
+        self.major = sys.intern(major)
         self.year = year
-        self.grades: dict[str, list[float]] = {}
+        self._grade_store: dict[str, array] | None = {}
+        self._grade_loader = None
+        self._average: float | None = None
+        self._subject_averages: dict[str, float] | None = None
+        self._subject_sums: dict[str, float] = {}
+        self._grade_sum = 0.0
+        self._grade_count = 0
+        self._listeners: tuple = ()
+        self._new_subject: str | None = None
+
+    @property
+    def _grades(self) -> dict[str, array]:
+        """
+        Returns the grade storage, fetching it first if the grades are loaded lazily.
+
+        Returns:
+            dict[str, array]: Grades per subject.
+        """
+        if self._grade_store is None:
+            self._grade_store = self._grade_loader(self)
+            self._grade_loader = None
+            self._subject_sums = {subject: sum(grades_list) for subject, grades_list in self._grade_store.items()}
+        return self._grade_store
+
+    @_grades.setter
+    def _grades(self, grades: dict[str, array]) -> None:
+        """
+        Replaces the grade storage, cancelling any pending lazy load.
+
+        Args:
+            grades (dict[str, array]): New grades per subject.
+        """
+        self._grade_store = grades
+        self._grade_loader = None
+
+    def _defer_grades(self, loader, grade_sum: float, grade_count: int) -> None:
+        """
+        Makes the grades load lazily on first access, e.g. from persistent storage.
+
+        Only the totals are known up front, so aggregates stay correct without loading.
+
+        Args:
+            loader: Callable taking the student and returning its grades as dict[str, array('d')].
+            grade_sum (float): Sum of all of the student's grades.
+            grade_count (int): Number of the student's grades.
+        """
+        self._grade_store = None
+        self._grade_loader = loader
+        self._subject_sums = {}
+        self._grade_sum = grade_sum
+        self._grade_count = grade_count
+        self._average = None
+        self._subject_averages = None
+
+    def _add_listener(self, listener) -> None:
+        """
+        Registers a callable notified as listener(change, student, *args) after every change.
+
+        Args:
+            listener: Callable to register.
+        """
+        self._listeners += (listener,)
+
+    def _remove_listener(self, listener) -> None:
+        """
+        Unregisters a previously registered listener.
+
+        Args:
+            listener: Callable to unregister.
+        """
+        listeners = list(self._listeners)
+        listeners.remove(listener)
+        self._listeners = tuple(listeners)
+
+    def _forget_subject_average(self, subject: str) -> None:
+        """
+        Drops the cached averages affected by a change of grades in the given subject.
+
+        Args:
+            subject (str): Name of the subject whose grades changed.
+        """
+        self._average = None
+        if self._subject_averages:
+            self._subject_averages.pop(subject, None)
+
+    def _notify(self, change: str, *args) -> None:
+        """
+        Informs every registered listener (e.g. an owning StudentSystem) about a change.
+
+        Args:
+            change (str): Kind of change, e.g. 'renamed'.
+            *args: Change details, such as the previous values.
+        """
+        for listener in self._listeners:
+            listener(change, self, *args)
+
+    @property
+    def grades(self) -> dict[str, list[float]]:
+        """
+        Returns a copy of all grades, so that changes to it cannot bypass the cached averages.
+
+        Returns:
+            dict[str, list[float]]: Dictionary of all subjects and copies of their grade lists.
+        """
+        return {subject: list(grades_list) for subject, grades_list in self._grades.items()}
 
     def __str__(self) -> str:
         """
@@ -40,6 +175,7 @@ class Student:
         return (f"Student (name={self.name!r}, last_name={self.last_name!r}, "
                 f"class={self.class_grade!r}, major={self.major!r}, year={self.year!r})")
 
+    @instrumented()
     def add_grade(self, subject: str, grade: float) -> None:
         """
         Adds a grade for the specified subject.
@@ -51,12 +187,29 @@ class Student:
         Raises:
             ValueError: If the grade is not in the valid range (1.0–6.0).
         """
-        if grade < 1.0 or grade > 6.0:
-            raise ValueError("Grade must be between 1.0 and 6.0")
-        if subject not in self.grades:
-            self.grades[subject] = []
-        self.grades[subject].append(grade)
+        validate_grade(grade)
+        grades = self._grades
+        created = subject not in grades
+        if created:
+            subject = sys.intern(subject)
+            grades[subject] = array("d")
+            self._subject_sums[subject] = 0.0
+        grades[subject].append(grade)
+        self._forget_subject_average(subject)
+        self._subject_sums[subject] += grade
+        self._grade_sum += grade
+        self._grade_count += 1
+        if not created:
+            self._notify("grade_added", subject, grade)
+            return
+        # Lets listeners tell a new subject from one whose grades had all been removed.
+        self._new_subject = subject
+        try:
+            self._notify("grade_added", subject, grade)
+        finally:
+            self._new_subject = None
 
+    @instrumented()
     def remove_last_grade(self, subject: str) -> float:
         """
         Removes and returns the last grade added for the specified subject.
@@ -70,10 +223,18 @@ class Student:
         Raises:
             ValueError: If the subject has no grades.
         """
-        if subject not in self.grades or not self.grades[subject]:
+        grades_list = self._grades.get(subject)
+        if not grades_list:
             raise ValueError(f"No grades for subject: {subject}")
-        return self.grades[subject].pop()
-
+        grade = grades_list.pop()
+        self._forget_subject_average(subject)
+        self._subject_sums[subject] = self._subject_sums[subject] - grade if grades_list else 0.0
+        self._grade_count -= 1
+        self._grade_sum = self._grade_sum - grade if self._grade_count else 0.0
+        self._notify("grade_removed", subject, grade)
+        return grade
+
+    @instrumented()
     def get_subject_grades(self, subject: str) -> list[float]:
         """
         Retrieves all grades for the specified subject.
@@ -82,28 +243,32 @@ class Student:
             subject (str): Name of the subject.
 
         Returns:
-            list[float]: List of grades for the subject.
+            list[float]: A copy of the list of grades for the subject.
 
         Raises:
             ValueError: If the subject has no grades.
         """
-        if subject not in self.grades or not self.grades[subject]:
+        if subject not in self._grades or not self._grades[subject]:
             raise ValueError(f"No grades for subject: {subject}")
-        return self.grades[subject]
+        return list(self._grades[subject])
 
+    @instrumented()
     def get_all_grades(self) -> dict[str, list[float]]:
         """
         Returns a copy of all grades for all subjects.
 
         Returns:
-            dict[str, list[float]]: Dictionary of all subjects and their grades.
+            dict[str, list[float]]: Dictionary of all subjects and copies of their grade lists.
         """
-        return self.grades.copy()
+        return self.grades
 
+    @instrumented()
     def average_subject_grade(self, subject: str) -> float:
         """
         Calculates the average grade for a given subject.
 
+        The result is cached until a grade for that subject changes.
+
         Args:
             subject (str): Name of the subject.
 
@@ -113,29 +278,42 @@ class Student:
         Raises:
             ValueError: If the subject has no grades.
         """
-        if subject not in self.grades or not self.grades[subject]:
+        if self._subject_averages is not None and subject in self._subject_averages:
+            return self._subject_averages[subject]
+        if subject not in self._grades or not self._grades[subject]:
             raise ValueError(f"No grades for subject: {subject}")
-        return sum(self.grades[subject]) / len(self.grades[subject])
+        average = sum(self._grades[subject]) / len(self._grades[subject])
+        if self._subject_averages is None:
+            self._subject_averages = {}
+        self._subject_averages[subject] = average
+        return average
 
+    @instrumented()
     def average_grade(self) -> float:
         """
         Calculates the average grade across all subjects.
 
+        The result is cached until any grade of the student changes.
+
         Returns:
             float: Overall average grade.
 
         Raises:
             ValueError: If the student has no grades at all.
         """
+        if self._average is not None:
+            return self._average
         total = 0
         count = 0
-        for grades_list in self.grades.values():
+        for grades_list in self._grades.values():
             total += sum(grades_list)
             count += len(grades_list)
         if count == 0:
             raise ValueError(f"Student {self.name} {self.last_name} has no grades")
-        return total / count
+        self._average = total / count
+        return self._average
 
+    @instrumented()
     def delete_subject(self, subject: str) -> bool:
         """
         Deletes all grades for the specified subject.
@@ -149,11 +327,17 @@ class Student:
         Raises:
             ValueError: If the subject does not exist for this student.
         """
-        if subject not in self.grades:
+        if subject not in self._grades:
             raise ValueError(f"{subject} is not a valid subject for this student")
-        del self.grades[subject]
+        grades_list = self._grades.pop(subject)
+        self._forget_subject_average(subject)
+        removed_sum = self._subject_sums.pop(subject)
+        self._grade_count -= len(grades_list)
+        self._grade_sum = self._grade_sum - removed_sum if self._grade_count else 0.0
+        self._notify("subject_deleted", subject, grades_list, removed_sum)
         return True
 
+    @instrumented()
     def change_name(self, new_name: str, new_last_name: str) -> bool:
         """
         Changes the student's name and last name.
@@ -167,10 +351,13 @@ class Student:
         """
         if self.name == new_name and self.last_name == new_last_name:
             return False
+        old_name, old_last_name = self.name, self.last_name
         self.name = new_name
         self.last_name = new_last_name
+        self._notify("renamed", old_name, old_last_name)
         return True
 
+    @instrumented()
     def change_major(self, new_major: str) -> bool:
         """
         Changes the student's major.
@@ -183,9 +370,12 @@ class Student:
         """
         if self.major == new_major:
             return False
-        self.major = new_major
+        old_major = self.major
+        self.major = sys.intern(new_major)
+        self._notify("major_changed", old_major)
         return True
 
+    @instrumented()
     def change_class_grade(self, new_class_grade: str) -> bool:
         """
         Changes the student's class grade.
@@ -198,9 +388,12 @@ class Student:
         """
         if self.class_grade == new_class_grade:
             return False
-        self.class_grade = new_class_grade
+        old_class_grade = self.class_grade
+        self.class_grade = sys.intern(new_class_grade)
+        self._notify("class_changed", old_class_grade)
         return True
 
+    @instrumented()
     def delete_all_grades(self) -> bool:
         """
         Deletes all grades for the student.
@@ -208,9 +401,18 @@ class Student:
         Returns:
             bool: True after all grades are cleared.
         """
-        self.grades.clear()
+        old_grades = self._grades
+        removed_sum, removed_count = self._grade_sum, self._grade_count
+        self._grades = {}
+        self._average = None
+        self._subject_averages = None
+        self._subject_sums = {}
+        self._grade_sum = 0.0
+        self._grade_count = 0
+        self._notify("grades_cleared", old_grades, removed_sum, removed_count)
         return True
 
+    @instrumented()
     def get_student_summary(self) -> dict[str, object]:
         """
         Returns a summary of the student's basic information and statistics.
@@ -224,8 +426,8 @@ class Student:
             "class": self.class_grade,
             "major": self.major,
             "year": self.year,
-            "subjects": len(self.grades),
-            "total_grades": sum(len(g) for g in self.grades.values()),
+            "subjects": len(self._grades),
+            "total_grades": self._grade_count,
         }
         try:
             summary["average"] = self.average_grade()
@@ -1,5 +1,85 @@
+import contextlib
+import heapq
+
+from src.metrics import instrument_class, instrumented
+from src.histograms import GradeDistributions
+from src.search import NameIndex
+from src.stats import HISTOGRAM_BINS, GroupStats, group_stats
 from src.student import Student
+from src.subjects import SubjectIndex
+
+
+def _average_or_lowest(student: Student) -> float:
+    """
+    Sort key ranking students by average grade, with students without grades lowest.
+
+    Args:
+        student (Student): Student to rank.
+
+    Returns:
+        float: The student's average grade, or -inf if they have no grades.
+    """
+    return student.average_grade() if student._grade_count else float('-inf')
+
+
+def _average_no_grades_last(student: Student) -> tuple[bool, float]:
+    """
+    Ascending sort key by average grade that still places students without grades last.
+
+    Args:
+        student (Student): Student to rank.
+
+    Returns:
+        tuple[bool, float]: (has no grades, average grade or 0.0).
+    """
+    if student._grade_count:
+        return False, student.average_grade()
+    return True, 0.0
+
 
+def _result_size(system: "StudentSystem", result: list) -> int:
+    """
+    Rows-scanned counter for operations that visit exactly the students they return.
+
+    Args:
+        system (StudentSystem): The instrumented system.
+        result (list): List of students returned by the operation.
+
+    Returns:
+        int: Number of students visited.
+    """
+    return len(result)
+
+
+def _result_count(system: "StudentSystem", result: int) -> int:
+    """
+    Rows-scanned counter for operations returning the number of students they handled.
+
+    Args:
+        system (StudentSystem): The instrumented system.
+        result (int): Number of students returned by the operation.
+
+    Returns:
+        int: Number of students visited.
+    """
+    return result
+
+
+def _roster_size(system: "StudentSystem", result) -> int:
+    """
+    Rows-scanned counter for operations that visit every student.
+
+    Args:
+        system (StudentSystem): The instrumented system.
+        result: Result of the operation (unused).
+
+    Returns:
+        int: Number of students visited.
+    """
+    return len(system._roster)
+
+
+@instrument_class
 class StudentSystem:
     """
     System to manage a collection of Student objects. Provides methods to add, remove, search,
@@ -10,34 +90,418 @@ class StudentSystem:
         """
         Initializes the StudentSystem with an empty student list.
         """
-        self.students: list[Student] = []
+        self._roster: dict[Student, int] = {}
+        self._by_key: dict[tuple[str, str, int], list[Student]] = {}
+        self._by_class: dict[str, dict[Student, None]] = {}
+        self._by_major: dict[str, dict[Student, None]] = {}
+        self._by_year: dict[int, dict[Student, None]] = {}
+        self._class_totals: dict[str, list] = {}
+        self._school_sum = 0.0
+        self._school_count = 0
+        self._gradebook: "GradeBook | None" = None
+        self._name_index: NameIndex | None = None
+        self._grade_distributions: GradeDistributions | None = None
+        self._subject_index: SubjectIndex | None = None
+        self._listeners: list = []
+        self._versions: list = []
+        self._next_seq = 0
+
+    def add_listener(self, listener) -> None:
+        """
+        Registers a callable notified after every change of the system or of one of its students.
+
+        The listener is called as listener(change, student, *args), with the same changes a
+        Student reports ('grade_added', 'renamed', ...) plus 'student_added' and 'student_removed'.
+
+        Args:
+            listener: Callable to register.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener) -> None:
+        """
+        Unregisters a previously registered listener.
+
+        Args:
+            listener: Callable to unregister.
+
+        Raises:
+            ValueError: If the listener is not registered.
+        """
+        self._listeners.remove(listener)
+
+    def subscribe(self, maxsize: int = 10_000, coalesce: bool = False):
+        """
+        Subscribes a bounded stream of typed change events, for consumers that update incrementally.
+
+        Every change made through the system or to one of its students (add_student, remove_student,
+        add_grade, change_class_grade, ...) is queued as an event, e.g. GradeAdded(student, subject, grade),
+        to be taken in batches with EventStream.poll. Close the stream when done.
+
+        Args:
+            maxsize (int): Maximum number of queued events; the oldest are dropped (and flagged) beyond it.
+            coalesce (bool): Whether to keep only one event per changed student between polls.
+
+        Returns:
+            EventStream: The subscribed stream.
+
+        Raises:
+            ValueError: If maxsize is not positive.
+        """
+        from src.events import EventStream
+        stream = EventStream(self, maxsize, coalesce)
+        self.add_listener(stream._on_change)
+        return stream
+
+    @property
+    def gradebook(self) -> "GradeBook | None":
+        """
+        Returns the columnar GradeBook if it is enabled.
+
+        Returns:
+            GradeBook | None: The GradeBook, or None if it is disabled.
+        """
+        return self._gradebook
+
+    def enable_gradebook(self) -> bool:
+        """
+        Builds a NumPy-backed GradeBook from all current grades and keeps it up to date from now on.
+
+        While enabled, the GradeBook offers school-wide statistics per class, major and subject in one
+        pass over its columns; single averages (get_class_average, get_school_average) keep using the
+        O(1) running aggregates.
+
+        Returns:
+            bool: True if the GradeBook is enabled, False if NumPy is not installed.
+        """
+        if self._gradebook is not None:
+            return True
+        from src.gradebook import GradeBook  # imported on demand, as it loads NumPy
+        try:
+            gradebook = GradeBook()
+        except ImportError:
+            return False
+        for student in self._roster:
+            gradebook.add_student(student)
+        self._gradebook = gradebook
+        return True
+
+    def disable_gradebook(self) -> None:
+        """
+        Drops the GradeBook and stops keeping it up to date.
+        """
+        self._gradebook = None
+
+    def _names(self) -> NameIndex:
+        """
+        Returns the name search index, building it on first use and keeping it up to date afterwards.
+
+        Returns:
+            NameIndex: Index over the names of all students in the system.
+        """
+        if self._name_index is None:
+            index = NameIndex()
+            for student in self._roster:
+                index.add(student)
+            self._listeners.append(index.on_change)
+            self._name_index = index
+        return self._name_index
+
+    def _distributions(self) -> GradeDistributions:
+        """
+        Returns the grade histograms, building them on first use and keeping them up to date afterwards.
+
+        Returns:
+            GradeDistributions: Histograms of the school, of every class and of every subject.
+        """
+        if self._grade_distributions is None:
+            distributions = GradeDistributions()
+            distributions.add_students(self._roster)
+            self._listeners.append(distributions.on_change)
+            self._grade_distributions = distributions
+        return self._grade_distributions
+
+    def _subjects(self) -> SubjectIndex:
+        """
+        Returns the subject index, building it on first use and keeping it up to date afterwards.
+
+        Returns:
+            SubjectIndex: Index of the grades of all students by subject.
+        """
+        if self._subject_index is None:
+            index = SubjectIndex()
+            index.add_students(self._roster)
+            self._listeners.append(index.on_change)
+            self._subject_index = index
+        return self._subject_index
+
+    @property
+    def students(self) -> list[Student]:
+        """
+        Returns all students in the order they were added.
+
+        Returns:
+            list[Student]: A new list with every student in the system.
+        """
+        return list(self._roster)
+
+    def _index_key(self, student: Student) -> None:
+        """
+        Puts a student into the (name, last_name, year) index, keeping bucket entries in roster order.
+
+        Args:
+            student (Student): Student already present in the roster.
+        """
+        bucket = self._by_key.setdefault((student.name, student.last_name, student.year), [])
+        seq = self._roster[student]
+        position = len(bucket)
+        while position > 0 and self._roster[bucket[position - 1]] > seq:
+            position -= 1
+        bucket.insert(position, student)
+
+    def _unindex_key(self, student: Student, name: str, last_name: str, year: int) -> None:
+        """
+        Takes a student out of the (name, last_name, year) index.
+
+        Args:
+            student (Student): Student to remove from the index.
+            name (str): First name the student is indexed under.
+            last_name (str): Last name the student is indexed under.
+            year (int): Year the student is indexed under.
+        """
+        key = (name, last_name, year)
+        bucket = self._by_key[key]
+        bucket.remove(student)
+        if not bucket:
+            del self._by_key[key]
+
+    @staticmethod
+    def _group_add(index: dict, key, student: Student) -> None:
+        """
+        Adds a student to one group of a secondary index.
+
+        Args:
+            index (dict): Secondary index mapping a group key to its students.
+            key: Group key (already normalised).
+            student (Student): Student to add.
+        """
+        index.setdefault(key, {})[student] = None
+
+    @staticmethod
+    def _group_remove(index: dict, key, student: Student) -> None:
+        """
+        Removes a student from one group of a secondary index.
+
+        Args:
+            index (dict): Secondary index mapping a group key to its students.
+            key: Group key (already normalised).
+            student (Student): Student to remove.
+        """
+        group = index[key]
+        del group[student]
+        if not group:
+            del index[key]
+
+    def _group_members(self, index: dict, key) -> list[Student]:
+        """
+        Returns the students of one group in roster order.
+
+        Students moved between groups are appended to their new group, so the
+        group is re-ordered by roster position (cheap, as it is nearly sorted).
+
+        Args:
+            index (dict): Secondary index mapping a group key to its students.
+            key: Group key (already normalised).
+
+        Returns:
+            list[Student]: Students in the group, in the order they were added to the system.
+        """
+        group = index.get(key)
+        if not group:
+            return []
+        return sorted(group, key=self._roster.__getitem__)
+
+    def _add_totals(self, class_grade: str, grade_sum: float, grade_count: int) -> None:
+        """
+        Applies a change in grade sum and count to the running class and school aggregates.
+
+        Running sums are reset to exactly zero whenever their count drops to zero,
+        so rounding error cannot accumulate across an emptied class or school.
+
+        Args:
+            class_grade (str): Class the grades belong to.
+            grade_sum (float): Change of the sum of grades (negative when grades are removed).
+            grade_count (int): Change of the number of grades (negative when grades are removed).
+        """
+        if grade_count == 0:
+            return
+        totals = self._class_totals.setdefault(class_grade, [0.0, 0])
+        totals[1] += grade_count
+        totals[0] = totals[0] + grade_sum if totals[1] else 0.0
+        if not totals[1]:
+            del self._class_totals[class_grade]
+        self._school_count += grade_count
+        self._school_sum = self._school_sum + grade_sum if self._school_count else 0.0
+
+    def _on_student_change(self, change: str, student: Student, *args) -> None:
+        """
+        Keeps the indexes and running aggregates in sync after a student in the system has been modified.
 
+        Args:
+            change (str): Kind of change reported by the student.
+            student (Student): The modified student.
+            *args: Change details, such as the previous values.
+        """
+        if self._gradebook is not None:
+            self._gradebook.on_student_change(change, student, *args)
+        for version in self._versions:
+            version._on_student_change(change, student, *args)
+        if change == "grade_added":
+            subject, grade = args
+            self._add_totals(student.class_grade, grade, 1)
+        elif change == "grade_removed":
+            subject, grade = args
+            self._add_totals(student.class_grade, -grade, -1)
+        elif change == "subject_deleted":
+            subject, grades_list, removed_sum = args
+            self._add_totals(student.class_grade, -removed_sum, -len(grades_list))
+        elif change == "grades_cleared":
+            old_grades, removed_sum, removed_count = args
+            self._add_totals(student.class_grade, -removed_sum, -removed_count)
+        elif change == "renamed":
+            old_name, old_last_name = args
+            self._unindex_key(student, old_name, old_last_name, student.year)
+            self._index_key(student)
+        elif change == "class_changed":
+            old_class_grade, = args
+            self._group_remove(self._by_class, old_class_grade.lower(), student)
+            self._group_add(self._by_class, student.class_grade.lower(), student)
+            self._add_totals(old_class_grade, -student._grade_sum, -student._grade_count)
+            self._add_totals(student.class_grade, student._grade_sum, student._grade_count)
+        elif change == "major_changed":
+            old_major, = args
+            self._group_remove(self._by_major, old_major.lower(), student)
+            self._group_add(self._by_major, student.major.lower(), student)
+        for listener in self._listeners:
+            listener(change, student, *args)
+
+    def _discard(self, student: Student) -> None:
+        """
+        Removes a student from the roster and all indexes.
+
+        Args:
+            student (Student): Student present in the system.
+        """
+        self._unindex_key(student, student.name, student.last_name, student.year)
+        self._group_remove(self._by_class, student.class_grade.lower(), student)
+        self._group_remove(self._by_major, student.major.lower(), student)
+        self._group_remove(self._by_year, student.year, student)
+        self._add_totals(student.class_grade, -student._grade_sum, -student._grade_count)
+        if self._gradebook is not None:
+            self._gradebook.remove_student(student)
+        for version in self._versions:
+            version._on_student_removed(student, self._roster[student])
+        del self._roster[student]
+        student._remove_listener(self._on_student_change)
+        for listener in self._listeners:
+            listener("student_removed", student)
+
+    @instrumented()
     def add_student(self, student: Student) -> None:
         """
         Adds a student to the system.
 
         Args:
             student (Student): The student to be added.
+
+        Raises:
+            ValueError: If this exact student object is already in the system.
+        """
+        if student in self._roster:
+            raise ValueError(f"Student {student.name} {student.last_name} is already in the system")
+        self._roster[student] = self._next_seq
+        self._next_seq += 1
+        self._index_key(student)
+        self._group_add(self._by_class, student.class_grade.lower(), student)
+        self._group_add(self._by_major, student.major.lower(), student)
+        self._group_add(self._by_year, student.year, student)
+        self._add_totals(student.class_grade, student._grade_sum, student._grade_count)
+        if self._gradebook is not None:
+            self._gradebook.add_student(student)
+        student._add_listener(self._on_student_change)
+        for listener in self._listeners:
+            listener("student_added", student)
+
+    @instrumented(rows=_result_count)
+    def add_students_bulk(self, students) -> int:
         """
-        self.students.append(student)
+        Adds many students at once, e.g. from an importer.
 
+        Does the same as calling add_student for each student, but applies the grade
+        totals per class once per batch and adds the batch to the GradeBook in one go.
+
+        Args:
+            students (Iterable[Student]): Students to add.
+
+        Returns:
+            int: The number of students added.
+
+        Raises:
+            ValueError: If one of the students is already in the system (students before it stay added).
+        """
+        roster = self._roster
+        by_class, by_major, by_year = self._by_class, self._by_major, self._by_year
+        index_key, group_add = self._index_key, self._group_add
+        on_change, listeners = self._on_student_change, self._listeners
+        class_totals: dict[str, list] = {}
+        added: list[Student] = []
+        try:
+            for student in students:
+                if student in roster:
+                    raise ValueError(f"Student {student.name} {student.last_name} is already in the system")
+                roster[student] = self._next_seq
+                self._next_seq += 1
+                index_key(student)
+                group_add(by_class, student.class_grade.lower(), student)
+                group_add(by_major, student.major.lower(), student)
+                group_add(by_year, student.year, student)
+                if student._grade_count:
+                    totals = class_totals.setdefault(student.class_grade, [0.0, 0])
+                    totals[0] += student._grade_sum
+                    totals[1] += student._grade_count
+                student._add_listener(on_change)
+                added.append(student)
+        finally:
+            for class_grade, (grade_sum, grade_count) in class_totals.items():
+                self._add_totals(class_grade, grade_sum, grade_count)
+            if self._gradebook is not None:
+                for student in added:
+                    self._gradebook.add_student(student)
+            for listener in listeners:
+                for student in added:
+                    listener("student_added", student)
+        return len(added)
+
+    @instrumented()
     def remove_student(self, name: str, last_name: str, year: int) -> bool:
         """
-        Removes a student with the given name and last name from the system.
+        Removes a student with the given name, last name and year from the system.
 
         Args:
             name (str): First name of the student.
             last_name (str): Last name of the student.
+            year (int): Year of the student.
 
         Returns:
             bool: True if the student was removed, False if not found.
         """
-        for student in self.students:
-            if (student.name == name and student.last_name == last_name and student.year == year):
-                self.students.remove(student)
-                return True
-        return False
+        student = self.find_student(name, last_name, year)
+        if student is None:
+            return False
+        self._discard(student)
+        return True
 
+    @instrumented(rows=_result_count)
     def remove_students_from_year(self, year: int) -> int:
         """
         Removes all students from the given year.
@@ -48,35 +512,59 @@ class StudentSystem:
         Returns:
             int: The number of students removed.
         """
-        original_count = len(self.students)
-        self.students = [student for student in self.students if student.year != year]
-        removed_count = original_count - len(self.students)
-        return removed_count
+        to_remove = list(self._by_year.get(year, ()))
+        for student in to_remove:
+            self._discard(student)
+        return len(to_remove)
 
+    @instrumented()
     def find_student(self, name: str, last_name: str, year: int) -> Student | None:
         """
-        Finds and returns a student by their first and last name.
+        Finds and returns a student by their first name, last name and year.
 
         Args:
             name (str): First name of the student.
             last_name (str): Last name of the student.
+            year (int): Year of the student.
 
         Returns:
-            Student | None: The found student, or None if not found.
+            Student | None: The found student (the earliest added one if several match), or None if not found.
+        """
+        bucket = self._by_key.get((name, last_name, year))
+        return bucket[0] if bucket else None
+
+    def iter_students(self):
+        """
+        Iterates over all students in the order they were added, without copying the roster.
+
+        Students must not be added or removed while the iteration is in progress.
+
+        Yields:
+            Student: Each student in the system.
+        """
+        yield from self._roster
+
+    def iter_student_lines(self):
         """
-        for student in self.students:
-            if (student.name == name and student.last_name == last_name and student.year == year):
-                return student
-        return None
+        Streams the lines of show_all_students one at a time.
 
+        Yields:
+            str: A student's name and class grade.
+        """
+        for s in self._roster:
+            yield f"{s.name} {s.last_name} {s.class_grade}"
+
+    @instrumented(rows=_roster_size)
     def show_all_students(self) -> str:
         """
         Returns a formatted string listing all students.
 
+        For large schools prefer iter_student_lines, which does not build the whole string.
+
         Returns:
             str: String with all students' names and class grades, one per line.
         """
-        return "\n".join(f"{s.name} {s.last_name} {s.class_grade}" for s in self.students)
+        return "\n".join(self.iter_student_lines())
 
     def get_student_count(self) -> int:
         """
@@ -85,12 +573,50 @@ class StudentSystem:
         Returns:
             int: The number of students.
         """
-        return len(self.students)
+        return len(self._roster)
+
+    @instrumented(rows=_result_size)
+    def search_students(self, query: str, limit: int = 10) -> list[Student]:
+        """
+        Finds students whose first name, last name or full name starts with the query.
+
+        Matching ignores case and diacritics, so 'dabr' finds 'Dąbrowska'. The search index
+        is built on the first search and then maintained as students change.
+
+        Args:
+            query (str): Beginning of a name, e.g. 'kowal' or 'jan kow'.
+            limit (int): Maximum number of students returned.
+
+        Returns:
+            list[Student]: Matching students, ordered by the matching name.
+        """
+        return self._names().prefix(query, limit)
+
+    @instrumented(rows=_result_size)
+    def fuzzy_search_students(self, query: str, max_distance: int | None = None, limit: int = 10) -> list[Student]:
+        """
+        Finds students whose first name, last name or full name is close to the query, e.g. despite a typo.
+
+        Args:
+            query (str): Name to look for, e.g. 'Kowlaski'.
+            max_distance (int | None): Largest number of inserted, deleted or replaced letters allowed;
+                                       None scales it with the length of the query (at most 2).
+            limit (int): Maximum number of students returned.
+
+        Returns:
+            list[Student]: Matching students, closest names first.
+        """
+        return self._names().fuzzy(query, max_distance, limit)
 
+    @instrumented()
     def get_class_average(self, class_grade: str) -> float:
         """
         Calculates the average grade for all students in a specific class.
 
+        The average comes from running aggregates updated on every grade change, so it
+        costs O(1). It may differ from summing every grade from scratch by floating-point
+        rounding only (relative difference well below 1e-9 for any realistic school).
+
         Args:
             class_grade (str): The class grade to calculate the average for.
 
@@ -100,37 +626,174 @@ class StudentSystem:
         Raises:
             ValueError: If no students with grades are found in the class.
         """
-        total = 0
-        count = 0
-        for student in self.students:
-            if student.class_grade == class_grade:
-                for grades_list in student.grades.values():
-                    total += sum(grades_list)
-                    count += len(grades_list)
-        if count == 0:
+        totals = self._class_totals.get(class_grade)
+        if totals is None:
             raise ValueError(f"No students with grades in class {class_grade}")
-        return total / count
+        return totals[0] / totals[1]
 
+    @instrumented()
     def get_school_average(self) -> float:
         """
         Calculates the average grade for all students in the system.
 
+        Like get_class_average, this reads running aggregates in O(1).
+
         Returns:
             float: The overall school average grade.
 
         Raises:
             ValueError: If no students with grades are found.
         """
-        total = 0
-        count = 0
-        for student in self.students:
-            for grades_list in student.grades.values():
-                total += sum(grades_list)
-                count += len(grades_list)
-        if count == 0:
+        if self._school_count == 0:
             raise ValueError(f"No students with grades")
-        return total / count
+        return self._school_sum / self._school_count
+
+    @instrumented()
+    def grade_percentile(self, percent: float, class_grade: str | None = None, subject: str | None = None) -> float:
+        """
+        Returns a percentile of the grades in the school, in a class or in a subject; 50 gives the median.
+
+        Grades are counted in histograms with 0.01-wide bins, built on the first call and then
+        updated on every grade change, so each call costs O(bins) instead of sorting all grades.
+        Percentiles interpolate linearly between neighbouring grades, like numpy.percentile.
+
+        Args:
+            percent (float): Percentile between 0 and 100.
+            class_grade (str | None): Class to restrict to (exact name, like get_class_average).
+            subject (str | None): Subject to restrict to.
+
+        Returns:
+            float: The percentile.
+
+        Raises:
+            ValueError: If there are no matching grades, percent is outside 0–100, or both a class
+                        and a subject are given.
+        """
+        histogram = self._distributions().histogram(class_grade, subject)
+        if histogram is None:
+            raise ValueError(f"No grades in {class_grade if subject is None else subject}")
+        return histogram.percentile(percent)
+
+    @instrumented()
+    def grade_histogram(self, bins: int = HISTOGRAM_BINS, class_grade: str | None = None,
+                        subject: str | None = None) -> tuple[int, ...]:
+        """
+        Returns the number of grades per equal bin of the 1.0–6.0 scale, in the school, a class or a subject.
+
+        Bins follow GroupStats.histogram; like grade_percentile, this reads the maintained
+        histograms in O(bins).
+
+        Args:
+            bins (int): Number of bins.
+            class_grade (str | None): Class to restrict to (exact name).
+            subject (str | None): Subject to restrict to.
+
+        Returns:
+            tuple[int, ...]: Number of grades per bin (all zero if there are none).
+
+        Raises:
+            ValueError: If both a class and a subject are given.
+        """
+        histogram = self._distributions().histogram(class_grade, subject)
+        return (0,) * bins if histogram is None else histogram.histogram(bins)
+
+    @instrumented()
+    def get_subject_average(self, subject: str) -> float:
+        """
+        Calculates the average grade in a subject across all students.
+
+        Like get_class_average, this reads running totals (of the subject index, built on the
+        first subject query and then updated on every grade change) in O(1).
+
+        Args:
+            subject (str): Name of the subject.
+
+        Returns:
+            float: The average grade in the subject.
+
+        Raises:
+            ValueError: If no student has grades in the subject.
+        """
+        grade_sum, grade_count = self._subjects().totals(subject)
+        if not grade_count:
+            raise ValueError(f"No grades for subject: {subject}")
+        return grade_sum / grade_count
+
+    @instrumented()
+    def get_subject_grade_count(self, subject: str) -> int:
+        """
+        Counts the grades in a subject across all students, in O(1).
+
+        Args:
+            subject (str): Name of the subject.
+
+        Returns:
+            int: Number of grades in the subject.
+        """
+        return self._subjects().totals(subject)[1]
+
+    @instrumented(rows=_result_size)
+    def get_students_with_subject(self, subject: str) -> list[Student]:
+        """
+        Returns every student with at least one grade in a subject, visiting only those students.
+
+        Args:
+            subject (str): Name of the subject.
+
+        Returns:
+            list[Student]: The students, in the order they were added to the system.
+        """
+        return sorted(self._subjects().students(subject), key=self._roster.__getitem__)
+
+    @instrumented()
+    def top_students_in_subject(self, k: int, subject: str) -> list[Student]:
+        """
+        Returns the k students with the highest average grade in a subject.
+
+        Uses heap-based selection over the subject's students only (O(m log k) for m students graded in it).
+
+        Args:
+            k (int): Number of students to return.
+            subject (str): Name of the subject.
+
+        Returns:
+            list[Student]: Up to k students, highest subject average first; ties keep roster order.
+        """
+        return self._subjects().top(subject, k, self._roster.__getitem__)
+
+    @instrumented()
+    def get_subject_class_averages(self, subject: str) -> dict[str, float]:
+        """
+        Calculates the average grade in a subject for every class, from running totals per class and subject.
+
+        Args:
+            subject (str): Name of the subject.
+
+        Returns:
+            dict[str, float]: Average per class grade (exact names, like get_class_average), ordered by class.
+        """
+        return self._subjects().class_averages(subject)
+
+    @instrumented(rows=_roster_size)
+    def group_stats(self, by: str = "class_grade", bins: int = HISTOGRAM_BINS) -> dict[object, GroupStats]:
+        """
+        Computes count, mean, min, max, standard deviation and a grade histogram for every group at once.
+
+        One pass over all grades replaces calling get_class_average (or filtering students) once per group.
+
+        Args:
+            by (str): 'class_grade', 'major', 'year' or 'subject'.
+            bins (int): Number of histogram bins over the 1.0–6.0 scale.
+
+        Returns:
+            dict[object, GroupStats]: Statistics per group key, ordered by key; class and major keys are lower-cased.
+
+        Raises:
+            ValueError: If 'by' is not a supported grouping.
+        """
+        return group_stats(self._roster, by, bins)
 
+    @instrumented(rows=_result_size)
     def get_students_from_major(self, major: str) -> list[Student]:
         """
         Returns a list of students with a specific major (specialization).
@@ -141,8 +804,9 @@ class StudentSystem:
         Returns:
             list[Student]: List of students with the given major.
         """
-        return [student for student in self.students if student.major.lower() == major.lower()]
+        return self._group_members(self._by_major, major.lower())
 
+    @instrumented(rows=_result_size)
     def sort_students_by_class_grade(self) -> list[Student]:
         """
         Returns a list of all students sorted alphabetically by class grade.
@@ -150,8 +814,9 @@ class StudentSystem:
         Returns:
             list[Student]: Sorted list of students by class grade.
         """
-        return sorted(self.students, key=lambda student: student.class_grade.lower(), reverse=False)
+        return sorted(self._roster, key=lambda student: student.class_grade.lower(), reverse=False)
 
+    @instrumented(rows=_result_size)
     def sort_students_by_major(self) -> list[Student]:
         """
         Returns a list of all students sorted alphabetically by major.
@@ -159,8 +824,9 @@ class StudentSystem:
         Returns:
             list[Student]: Sorted list of students by major.
         """
-        return sorted(self.students, key=lambda student: student.major.lower(), reverse=False)
+        return sorted(self._roster, key=lambda student: student.major.lower(), reverse=False)
 
+    @instrumented(rows=_result_size)
     def sort_class_by_avg_grade(self) -> list[Student]:
         """
         Returns a list of all students sorted by their average grade (descending).
@@ -169,13 +835,9 @@ class StudentSystem:
         Returns:
             list[Student]: Sorted list of students by average grade (highest first).
         """
-        def safe_avg(student: Student) -> float:
-            try:
-                return student.average_grade()
-            except ValueError:
-                return float('-inf')
-        return sorted(self.students, key=safe_avg, reverse=True)
+        return sorted(self._roster, key=_average_or_lowest, reverse=True)
 
+    @instrumented(rows=_result_size)
     def get_students_by_class(self, class_grade: str) -> list[Student]:
         """
         Returns a list of students belonging to a specific class grade.
@@ -186,8 +848,9 @@ class StudentSystem:
         Returns:
             list[Student]: List of students in the given class grade.
         """
-        return [student for student in self.students if student.class_grade.lower() == class_grade.lower()]
+        return self._group_members(self._by_class, class_grade.lower())
 
+    @instrumented(rows=_result_size)
     def sort_students_by_avg_in_class(self, class_grade: str) -> list[Student]:
         """
         Returns a list of students in a given class, sorted by their average grade (descending).
@@ -200,10 +863,127 @@ class StudentSystem:
             list[Student]: Sorted list of students in the class by average grade.
         """
         students_in_class = self.get_students_by_class(class_grade)
-        def safe_avg(student: Student) -> float:
-            try:
-                return student.average_grade()
-            except ValueError:
-                return float('-inf')
-        return sorted(students_in_class, key=safe_avg, reverse=True)
+        return sorted(students_in_class, key=_average_or_lowest, reverse=True)
+
+    def _ranking_candidates(self, class_grade: str | None, major: str | None):
+        """
+        Returns the students matching the optional class and major filters, in roster order.
+
+        The smaller of the matching index groups is used, so only that group is visited.
+
+        Args:
+            class_grade (str | None): Class grade to filter by (case-insensitive), or None.
+            major (str | None): Major to filter by (case-insensitive), or None.
+
+        Returns:
+            Iterable[Student]: Matching students.
+        """
+        if class_grade is None and major is None:
+            return self._roster
+        if major is None:
+            return self.get_students_by_class(class_grade)
+        if class_grade is None:
+            return self.get_students_from_major(major)
+        class_key, major_key = class_grade.lower(), major.lower()
+        by_class = self._by_class.get(class_key, {})
+        by_major = self._by_major.get(major_key, {})
+        if len(by_class) <= len(by_major):
+            return [s for s in self._group_members(self._by_class, class_key) if s.major.lower() == major_key]
+        return [s for s in self._group_members(self._by_major, major_key) if s.class_grade.lower() == class_key]
+
+    @instrumented()
+    def top_students(self, k: int, class_grade: str | None = None, major: str | None = None) -> list[Student]:
+        """
+        Returns the k students with the highest average grade, optionally within a class and/or major.
+
+        Uses heap-based selection (O(n log k)) instead of sorting everyone. The result equals
+        the first k students of sort_class_by_avg_grade restricted to the same filters:
+        students with no grades come last and ties keep roster order.
+
+        Args:
+            k (int): Number of students to return.
+            class_grade (str | None): Class grade to filter by (case-insensitive).
+            major (str | None): Major to filter by (case-insensitive).
+
+        Returns:
+            list[Student]: Up to k students, highest average first.
+        """
+        return heapq.nlargest(k, self._ranking_candidates(class_grade, major), key=_average_or_lowest)
+
+    @instrumented()
+    def bottom_students(self, k: int, class_grade: str | None = None, major: str | None = None) -> list[Student]:
+        """
+        Returns the k students with the lowest average grade, optionally within a class and/or major.
 
+        Uses heap-based selection like top_students. Students with no grades come last,
+        after every graded student, and ties keep roster order.
+
+        Args:
+            k (int): Number of students to return.
+            class_grade (str | None): Class grade to filter by (case-insensitive).
+            major (str | None): Major to filter by (case-insensitive).
+
+        Returns:
+            list[Student]: Up to k students, lowest average first.
+        """
+        return heapq.nsmallest(k, self._ranking_candidates(class_grade, major), key=_average_no_grades_last)
+
+    def query(self):
+        """
+        Starts a lazy, chainable query over the students, e.g.
+        system.query().where(class_grade="2B").order_by("average", desc=True).limit(20).
+
+        Returns:
+            Query: A query returning every student, to be narrowed with where, order_by and limit.
+        """
+        from src.query import Query
+        return Query(self)
+
+    def snapshot(self):
+        """
+        Takes a cheap point-in-time version of the system for long-running reads, e.g. reports.
+
+        The version keeps showing the students, grades and averages of this moment while the
+        system changes; it only copies the students that change afterwards. Close it (or use
+        it in a with block) when done, as the system keeps it up to date until then.
+
+        Returns:
+            SystemVersion: The read-only version.
+        """
+        return self._open_version()
+
+    def _open_version(self, reading=contextlib.nullcontext):
+        """
+        Creates a version of the system and starts reporting changes to it.
+
+        Args:
+            reading: Callable returning a context manager that holds the system's read lock.
+
+        Returns:
+            SystemVersion: The new version.
+        """
+        from src.versions import SystemVersion
+        version = SystemVersion(self, reading)
+        self._versions.append(version)
+        return version
+
+    def _close_version(self, version) -> None:
+        """
+        Stops reporting changes to a version; called by SystemVersion.close.
+
+        Args:
+            version (SystemVersion): The version to close.
+        """
+        self._versions.remove(version)
+
+    def _run_query(self, query):
+        """
+        Executes a query; overridden by ConcurrentStudentSystem to run it under the read lock.
+
+        Args:
+            query (Query): Query to execute.
+
+        Returns:
+            Iterator[Student]: The results of the query.
+        """
+        return query._run()
@@ -0,0 +1,222 @@
+import heapq
+
+from src.student import Student
+
+
+class SubjectIndex:
+    """
+    Subject-centric index of grades: for every subject, the students graded in it with their
+    grade sum and count, the subject's totals and its totals per class.
+
+    It is kept up to date from the change events of a StudentSystem, so subject averages and
+    counts cost O(1), and listing or ranking a subject's students only visits those students.
+    Running sums are reset to exactly zero when their count drops to zero, like the class
+    aggregates of StudentSystem. Classes are keyed by their exact name, like get_class_average.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty index.
+        """
+        self._students: dict[str, dict[Student, list]] = {}
+        self._totals: dict[str, list] = {}
+        self._class_totals: dict[str, dict[str, list]] = {}
+
+    @staticmethod
+    def _add_totals(totals_by_key: dict, key, grade_sum: float, grade_count: int) -> None:
+        """
+        Applies a change in grade sum and count to one [sum, count] entry, dropping it once empty.
+
+        Args:
+            totals_by_key (dict): Entries by key.
+            key: Key of the entry.
+            grade_sum (float): Change of the sum of grades.
+            grade_count (int): Change of the number of grades.
+        """
+        totals = totals_by_key.get(key)
+        if totals is None:
+            totals = totals_by_key[key] = [0.0, 0]
+        totals[1] += grade_count
+        if totals[1]:
+            totals[0] += grade_sum
+        else:
+            del totals_by_key[key]
+
+    def _add(self, student: Student, class_grade: str, subject: str, grade_sum: float, grade_count: int) -> None:
+        """
+        Applies a change of a student's grades in one subject to every part of the index.
+
+        Args:
+            student (Student): The student.
+            class_grade (str): Class the grades are counted in.
+            subject (str): The subject.
+            grade_sum (float): Change of the sum of grades.
+            grade_count (int): Change of the number of grades.
+        """
+        if grade_count == 0:
+            return
+        self._add_totals(self._students.setdefault(subject, {}), student, grade_sum, grade_count)
+        if not self._students[subject]:
+            del self._students[subject]
+        self._add_totals(self._totals, subject, grade_sum, grade_count)
+        self._add_totals(self._class_totals.setdefault(subject, {}), class_grade, grade_sum, grade_count)
+        if not self._class_totals[subject]:
+            del self._class_totals[subject]
+
+    def _remove_subject(self, student: Student, class_grade: str, subject: str) -> None:
+        """
+        Removes all of a student's grades in one subject, using the totals kept for the student.
+
+        Args:
+            student (Student): The student.
+            class_grade (str): Class the grades are counted in.
+            subject (str): The subject.
+        """
+        totals = self._students.get(subject, {}).get(student)
+        if totals is not None:
+            grade_sum, grade_count = totals
+            self._add(student, class_grade, subject, -grade_sum, -grade_count)
+
+    def _student_subjects(self, student: Student) -> list[str]:
+        """
+        Returns the subjects a student has grades in.
+
+        Args:
+            student (Student): The student.
+
+        Returns:
+            list[str]: The student's graded subjects.
+        """
+        if not student._grade_count:
+            return []
+        return [subject for subject, grades_list in student._grades.items() if grades_list]
+
+    def add_students(self, students) -> None:
+        """
+        Indexes all grades of students not yet in the index, e.g. when building it for a whole system.
+
+        Args:
+            students (Iterable[Student]): Students to index.
+        """
+        by_subject, totals, class_totals = self._students, self._totals, self._class_totals
+        for student in students:
+            if not student._grade_count:
+                continue
+            class_grade = student.class_grade
+            for subject, grades_list in student._grades.items():
+                if not grades_list:
+                    continue
+                grade_sum, grade_count = sum(grades_list), len(grades_list)
+                entries = by_subject.get(subject)
+                if entries is None:
+                    entries = by_subject[subject] = {}
+                    totals[subject] = [0.0, 0]
+                    class_totals[subject] = {}
+                entries[student] = [grade_sum, grade_count]
+                subject_totals = totals[subject]
+                subject_totals[0] += grade_sum
+                subject_totals[1] += grade_count
+                subject_class_totals = class_totals[subject].get(class_grade)
+                if subject_class_totals is None:
+                    class_totals[subject][class_grade] = [grade_sum, grade_count]
+                else:
+                    subject_class_totals[0] += grade_sum
+                    subject_class_totals[1] += grade_count
+
+    def on_change(self, change: str, student: Student, *args) -> None:
+        """
+        Keeps the index up to date; registered as a StudentSystem listener.
+
+        Args:
+            change (str): Kind of change reported by the system.
+            student (Student): The affected student.
+            *args: Change details.
+        """
+        if change == "grade_added":
+            subject, grade = args
+            self._add(student, student.class_grade, subject, grade, 1)
+        elif change == "grade_removed":
+            subject, grade = args
+            self._add(student, student.class_grade, subject, -grade, -1)
+        elif change == "subject_deleted":
+            self._remove_subject(student, student.class_grade, args[0])
+        elif change == "grades_cleared":
+            old_grades, removed_sum, removed_count = args
+            for subject in old_grades:
+                self._remove_subject(student, student.class_grade, subject)
+        elif change == "class_changed":
+            old_class_grade, = args
+            for subject in self._student_subjects(student):
+                grade_sum, grade_count = self._students[subject][student]
+                class_totals = self._class_totals[subject]
+                self._add_totals(class_totals, old_class_grade, -grade_sum, -grade_count)
+                self._add_totals(class_totals, student.class_grade, grade_sum, grade_count)
+        elif change == "student_added":
+            self.add_students((student,))
+        elif change == "student_removed":
+            for subject in self._student_subjects(student):
+                self._remove_subject(student, student.class_grade, subject)
+
+    def subjects(self) -> list[str]:
+        """
+        Returns every subject with at least one grade.
+
+        Returns:
+            list[str]: Subjects in alphabetical order.
+        """
+        return sorted(self._students)
+
+    def totals(self, subject: str) -> tuple[float, int]:
+        """
+        Returns the sum and number of grades in a subject.
+
+        Args:
+            subject (str): The subject.
+
+        Returns:
+            tuple[float, int]: (sum of grades, number of grades); (0.0, 0) for an unknown subject.
+        """
+        totals = self._totals.get(subject)
+        return (totals[0], totals[1]) if totals else (0.0, 0)
+
+    def students(self, subject: str) -> dict[Student, list]:
+        """
+        Returns the students graded in a subject with their [sum, count] in it (not a copy).
+
+        Args:
+            subject (str): The subject.
+
+        Returns:
+            dict[Student, list]: [grade sum, grade count] per student.
+        """
+        return self._students.get(subject, {})
+
+    def top(self, subject: str, k: int, position) -> list[Student]:
+        """
+        Returns the k students with the highest average in a subject.
+
+        Args:
+            subject (str): The subject.
+            k (int): Number of students.
+            position: Callable returning a student's roster position, used to break ties.
+
+        Returns:
+            list[Student]: Up to k students, highest subject average first, ties in roster order.
+        """
+        ranked = heapq.nlargest(k, self.students(subject).items(),
+                                key=lambda item: (item[1][0] / item[1][1], -position(item[0])))
+        return [student for student, _ in ranked]
+
+    def class_averages(self, subject: str) -> dict[str, float]:
+        """
+        Returns the average grade in a subject of every class with grades in it.
+
+        Args:
+            subject (str): The subject.
+
+        Returns:
+            dict[str, float]: Average per class grade, ordered by class grade.
+        """
+        class_totals = self._class_totals.get(subject, {})
+        return {class_grade: class_totals[class_grade][0] / class_totals[class_grade][1]
+                for class_grade in sorted(class_totals)}
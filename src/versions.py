@@ -0,0 +1,538 @@
+import heapq
+from array import array
+from contextlib import nullcontext
+from operator import itemgetter
+
+from src.student import Student
+from src.student_system import StudentSystem, _average_no_grades_last, _average_or_lowest
+
+
+def _frozen_student(student: Student, grades: dict[str, array]) -> Student:
+    """
+    Creates a detached Student (no listeners) with a student's current fields and the given grades.
+
+    Args:
+        student (Student): Student whose name, class, major and year are copied.
+        grades (dict[str, array]): Grades per subject; the arrays are used as they are.
+
+    Returns:
+        Student: The detached copy.
+    """
+    frozen = Student(student.name, student.last_name, student.class_grade, student.major, student.year)
+    _set_grades(frozen, grades)
+    return frozen
+
+
+def _set_grades(frozen: Student, grades: dict[str, array]) -> None:
+    """
+    Gives a detached Student new grades, resetting its totals and cached averages.
+
+    Args:
+        frozen (Student): Detached Student.
+        grades (dict[str, array]): Grades per subject.
+    """
+    frozen._defer_grades(lambda _: grades, sum(map(sum, grades.values())), sum(map(len, grades.values())))
+
+
+class StudentView:
+    """
+    Read-only view of a student as it was when a SystemVersion was taken.
+
+    Reads go to the live Student until it changes; from its first change on, they go to a
+    frozen copy of the student's state at the time of the version.
+    """
+
+    __slots__ = ("_version", "_student")
+
+    def __init__(self, version: "SystemVersion", student: Student):
+        """
+        Initializes a view.
+
+        Args:
+            version (SystemVersion): Version the view belongs to.
+            student (Student): The live student.
+        """
+        self._version = version
+        self._student = student
+
+    def _read(self, read):
+        """
+        Applies a read to the student's state in the version, under the system's read lock if it has one.
+
+        Args:
+            read: Callable taking a Student.
+
+        Returns:
+            The result of the read.
+        """
+        with self._version._reading():
+            return read(self._version._state(self._student))
+
+    @property
+    def name(self) -> str:
+        """
+        Returns the student's first name in the version.
+
+        Returns:
+            str: First name.
+        """
+        return self._read(lambda student: student.name)
+
+    @property
+    def last_name(self) -> str:
+        """
+        Returns the student's last name in the version.
+
+        Returns:
+            str: Last name.
+        """
+        return self._read(lambda student: student.last_name)
+
+    @property
+    def class_grade(self) -> str:
+        """
+        Returns the student's class grade in the version.
+
+        Returns:
+            str: Class grade.
+        """
+        return self._read(lambda student: student.class_grade)
+
+    @property
+    def major(self) -> str:
+        """
+        Returns the student's major in the version.
+
+        Returns:
+            str: Major.
+        """
+        return self._read(lambda student: student.major)
+
+    @property
+    def year(self) -> int:
+        """
+        Returns the student's year in the version.
+
+        Returns:
+            int: Year.
+        """
+        return self._read(lambda student: student.year)
+
+    @property
+    def grades(self) -> dict[str, list[float]]:
+        """
+        Returns a copy of all grades in the version.
+
+        Returns:
+            dict[str, list[float]]: Grades per subject.
+        """
+        return self._read(lambda student: student.grades)
+
+    def get_all_grades(self) -> dict[str, list[float]]:
+        """
+        Returns a copy of all grades in the version.
+
+        Returns:
+            dict[str, list[float]]: Grades per subject.
+        """
+        return self.grades
+
+    def get_subject_grades(self, subject: str) -> list[float]:
+        """
+        Returns the grades of a subject in the version.
+
+        Args:
+            subject (str): Name of the subject.
+
+        Returns:
+            list[float]: A copy of the grades.
+
+        Raises:
+            ValueError: If the subject has no grades.
+        """
+        return self._read(lambda student: student.get_subject_grades(subject))
+
+    def average_grade(self) -> float:
+        """
+        Returns the average grade in the version.
+
+        Returns:
+            float: Overall average grade.
+
+        Raises:
+            ValueError: If the student had no grades.
+        """
+        return self._read(lambda student: student.average_grade())
+
+    def average_subject_grade(self, subject: str) -> float:
+        """
+        Returns the average grade of a subject in the version.
+
+        Args:
+            subject (str): Name of the subject.
+
+        Returns:
+            float: Average grade for the subject.
+
+        Raises:
+            ValueError: If the subject has no grades.
+        """
+        return self._read(lambda student: student.average_subject_grade(subject))
+
+    def get_student_summary(self) -> dict[str, object]:
+        """
+        Returns the summary of Student.get_student_summary in the version.
+
+        Returns:
+            dict[str, object]: Name, class, major, year, subject and grade counts and average.
+        """
+        return self._read(lambda student: student.get_student_summary())
+
+    def __str__(self) -> str:
+        """
+        Returns the string form of Student.__str__ in the version.
+
+        Returns:
+            str: Basic info about the student.
+        """
+        return self._read(str)
+
+    def __repr__(self) -> str:
+        """
+        Returns the representation of Student.__repr__ in the version.
+
+        Returns:
+            str: All key attributes of the student.
+        """
+        return self._read(repr)
+
+
+class SystemVersion:
+    """
+    Point-in-time, read-only version of a StudentSystem, taken by StudentSystem.snapshot().
+
+    Taking a version copies nothing but the per-class grade totals. Afterwards the system
+    reports every change to the version before or as it happens: the first change of a
+    student freezes a detached copy of that student's state, rebuilt by undoing the change
+    from the event details (grade arrays of untouched subjects stay shared with the live
+    student until they change too), and removed students are kept with their roster position.
+    Memory therefore grows with what changed since the version was taken, not with the school.
+
+    Students added after the version are not part of it. A version should be closed once it
+    is no longer needed, as the system keeps updating it until then.
+    """
+
+    def __init__(self, system: StudentSystem, reading=nullcontext):
+        """
+        Takes a version of the current state of a system; called by StudentSystem.snapshot().
+
+        Args:
+            system (StudentSystem): The system.
+            reading: Callable returning a context manager that holds the system's read lock
+                     (a no-op for a single-threaded system).
+        """
+        self._system = system
+        self._reading = reading
+        self._next_seq = system._next_seq
+        self._count = len(system._roster)
+        self._class_totals = {class_grade: tuple(totals) for class_grade, totals in system._class_totals.items()}
+        self._school_totals = (system._school_sum, system._school_count)
+        self._frozen: dict[Student, Student] = {}
+        self._removed: dict[Student, int] = {}
+        self._closed = False
+
+    def _state(self, student: Student) -> Student:
+        """
+        Returns the Student holding a student's state in this version.
+
+        Args:
+            student (Student): The live student.
+
+        Returns:
+            Student: The frozen copy if the student changed since the version, otherwise the student itself.
+
+        Raises:
+            RuntimeError: If the version has been closed.
+        """
+        if self._closed:
+            raise RuntimeError("Snapshot is closed")
+        return self._frozen.get(student, student)
+
+    def _on_student_change(self, change: str, student: Student, *args) -> None:
+        """
+        Freezes the version's state of a student about to diverge from it; called by the system after each change.
+
+        Args:
+            change (str): Kind of change reported by the student.
+            student (Student): The changed student.
+            *args: Change details, such as the previous values.
+        """
+        if self._system._roster.get(student, self._next_seq) >= self._next_seq:
+            return  # added after the version
+        live = student._grades
+        frozen = self._frozen.get(student)
+        if frozen is None:
+            grades = dict(args[0]) if change == "grades_cleared" else dict(live)
+            if change == "grade_added" and student._new_subject is not None:
+                del grades[student._new_subject]  # created by this grade, after the version
+            frozen = self._frozen[student] = _frozen_student(student, grades)
+            if change == "renamed":
+                frozen.name, frozen.last_name = args
+            elif change == "class_changed":
+                frozen.class_grade = args[0]
+            elif change == "major_changed":
+                frozen.major = args[0]
+            elif change == "subject_deleted":
+                grades[args[0]] = args[1]
+                _set_grades(frozen, grades)
+        else:
+            grades = frozen._grades
+        if change in ("grade_added", "grade_removed"):
+            subject, grade = args
+            if grades.get(subject) is not None and grades[subject] is live.get(subject):
+                # The array is still shared with the live student, who has just changed it.
+                if change == "grade_added":
+                    grades[subject] = live[subject][:-1]
+                else:
+                    grades[subject] = live[subject] + array("d", (grade,))
+                _set_grades(frozen, grades)
+
+    def _on_student_removed(self, student: Student, seq: int) -> None:
+        """
+        Keeps a student that is about to leave the system; called by the system before the removal.
+
+        The student no longer reports changes once removed, so any grade array still shared with it is copied.
+
+        Args:
+            student (Student): The student being removed.
+            seq (int): The student's roster position.
+        """
+        if seq >= self._next_seq:
+            return
+        self._removed[student] = seq
+        frozen = self._frozen.get(student)
+        if frozen is None:
+            frozen = self._frozen[student] = _frozen_student(student, dict(student._grades))
+        live = student._grades
+        grades = frozen._grades
+        for subject, grades_list in grades.items():
+            if grades_list is live.get(subject):
+                grades[subject] = array("d", grades_list)
+
+    def _members(self) -> list[Student]:
+        """
+        Lists the students of the version in roster order, from the live roster and the removed students.
+
+        Only references are copied; it runs under the read lock so the roster cannot change meanwhile.
+
+        Returns:
+            list[Student]: The students.
+        """
+        if self._closed:
+            raise RuntimeError("Snapshot is closed")
+        next_seq = self._next_seq
+        with self._reading():
+            live = [(seq, student) for student, seq in self._system._roster.items() if seq < next_seq]
+            removed = sorted(((seq, student) for student, seq in self._removed.items()), key=itemgetter(0))
+        return [student for _, student in heapq.merge(live, removed, key=itemgetter(0))]
+
+    def get_student_count(self) -> int:
+        """
+        Returns the number of students in the version.
+
+        Returns:
+            int: The number of students.
+        """
+        return self._count
+
+    def iter_students(self):
+        """
+        Iterates over the students of the version in roster order; the system may change meanwhile.
+
+        Yields:
+            StudentView: Each student as it was when the version was taken.
+        """
+        for student in self._members():
+            yield StudentView(self, student)
+
+    @property
+    def students(self) -> list[StudentView]:
+        """
+        Returns all students of the version in roster order.
+
+        Returns:
+            list[StudentView]: Views of the students.
+        """
+        return list(self.iter_students())
+
+    def find_student(self, name: str, last_name: str, year: int) -> StudentView | None:
+        """
+        Finds the first student of the version with the given name, last name and year.
+
+        Args:
+            name (str): First name.
+            last_name (str): Last name.
+            year (int): Year.
+
+        Returns:
+            StudentView | None: The student, or None if the version has no such student.
+        """
+        key = (name, last_name, year)
+        with self._reading():
+            candidates = [s for s in self._system._by_key.get(key, ())
+                          if s not in self._frozen and self._system._roster[s] < self._next_seq]
+            candidates += [s for s, frozen in self._frozen.items()
+                           if (frozen.name, frozen.last_name, frozen.year) == key]
+            if not candidates:
+                return None
+            roster = self._system._roster
+            first = min(candidates, key=lambda s: self._removed[s] if s in self._removed else roster[s])
+        return StudentView(self, first)
+
+    def get_class_average(self, class_grade: str) -> float:
+        """
+        Returns the average grade of a class in the version.
+
+        Args:
+            class_grade (str): The class grade.
+
+        Returns:
+            float: The class average.
+
+        Raises:
+            ValueError: If the class had no grades.
+        """
+        totals = self._class_totals.get(class_grade)
+        if totals is None:
+            raise ValueError(f"No students with grades in class {class_grade}")
+        return totals[0] / totals[1]
+
+    def get_school_average(self) -> float:
+        """
+        Returns the average grade of the school in the version.
+
+        Returns:
+            float: The school average.
+
+        Raises:
+            ValueError: If there were no grades.
+        """
+        grade_sum, grade_count = self._school_totals
+        if grade_count == 0:
+            raise ValueError("No students with grades")
+        return grade_sum / grade_count
+
+    def _select(self, keep=None, key=None, k: int | None = None, reverse: bool = False) -> list[StudentView]:
+        """
+        Filters, orders and limits the students of the version, reading their states under one read lock.
+
+        Args:
+            keep: Predicate on a student's state, or None to keep everyone.
+            key: Sort key on a student's state, or None to keep roster order.
+            k (int | None): Number of students to select with a heap, or None for all.
+            reverse (bool): Whether to order from the highest key down.
+
+        Returns:
+            list[StudentView]: The selected students.
+        """
+        members = self._members()
+        with self._reading():
+            states = [(student, self._state(student)) for student in members]
+            if keep is not None:
+                states = [item for item in states if keep(item[1])]
+            if key is not None:
+                item_key = lambda item: key(item[1])
+                if k is None:
+                    states.sort(key=item_key, reverse=reverse)
+                else:
+                    states = (heapq.nlargest if reverse else heapq.nsmallest)(k, states, key=item_key)
+        return [StudentView(self, student) for student, _ in states]
+
+    def get_students_by_class(self, class_grade: str) -> list[StudentView]:
+        """
+        Returns the students of a class (case-insensitive) in the version, in roster order.
+
+        Args:
+            class_grade (str): The class grade.
+
+        Returns:
+            list[StudentView]: Students of the class.
+        """
+        class_key = class_grade.lower()
+        return self._select(keep=lambda student: student.class_grade.lower() == class_key)
+
+    def sort_class_by_avg_grade(self) -> list[StudentView]:
+        """
+        Returns every student of the version sorted by average grade, like StudentSystem.sort_class_by_avg_grade.
+
+        Returns:
+            list[StudentView]: Students, highest average first.
+        """
+        return self._select(key=_average_or_lowest, reverse=True)
+
+    def top_students(self, k: int, class_grade: str | None = None, major: str | None = None) -> list[StudentView]:
+        """
+        Returns the k students with the highest average in the version, like StudentSystem.top_students.
+
+        Args:
+            k (int): Number of students.
+            class_grade (str | None): Class grade to filter by (case-insensitive).
+            major (str | None): Major to filter by (case-insensitive).
+
+        Returns:
+            list[StudentView]: Up to k students, highest average first.
+        """
+        class_key = None if class_grade is None else class_grade.lower()
+        major_key = None if major is None else major.lower()
+
+        def keep(student: Student) -> bool:
+            return ((class_key is None or student.class_grade.lower() == class_key)
+                    and (major_key is None or student.major.lower() == major_key))
+
+        return self._select(keep=keep, key=_average_or_lowest, k=k, reverse=True)
+
+    def bottom_students(self, k: int, class_grade: str | None = None, major: str | None = None) -> list[StudentView]:
+        """
+        Returns the k students with the lowest average in the version, like StudentSystem.bottom_students.
+
+        Args:
+            k (int): Number of students.
+            class_grade (str | None): Class grade to filter by (case-insensitive).
+            major (str | None): Major to filter by (case-insensitive).
+
+        Returns:
+            list[StudentView]: Up to k students, lowest average first; students without grades last.
+        """
+        class_key = None if class_grade is None else class_grade.lower()
+        major_key = None if major is None else major.lower()
+
+        def keep(student: Student) -> bool:
+            return ((class_key is None or student.class_grade.lower() == class_key)
+                    and (major_key is None or student.major.lower() == major_key))
+
+        return self._select(keep=keep, key=_average_no_grades_last, k=k)
+
+    def close(self) -> None:
+        """
+        Stops tracking the system's changes and drops the frozen students; the views can no longer be read.
+        """
+        if not self._closed:
+            self._system._close_version(self)
+            self._closed = True
+            self._frozen.clear()
+            self._removed.clear()
+
+    def __enter__(self):
+        """
+        Returns the version itself for use in a with block.
+
+        Returns:
+            SystemVersion: This version.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Closes the version at the end of a with block.
+        """
+        self.close()
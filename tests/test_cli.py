@@ -0,0 +1,97 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from src.cli import main
+
+CSV_DATA = """name,last_name,class_grade,major,year,subject,grade
+Jan,Kowalski,1A,Physics,2023,math,4.0
+Jan,Kowalski,1A,Physics,2023,physics,5
+Anna,Nowak,1A,Math,2023,math,6
+Ewa,Dąbrowska,2B,Math,2024,math,3.0
+Piotr,Lis,2B,Math,rok,math,3.0
+"""
+
+
+class TestCli(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.db = os.path.join(self.directory.name, "data")
+        self.csv = os.path.join(self.directory.name, "students.csv")
+        with open(self.csv, "w", encoding="utf-8") as file:
+            file.write(CSV_DATA)
+        self.stderr = io.StringIO()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def run_cli(self, *argv, db=None):
+        out = io.StringIO()
+        with redirect_stderr(self.stderr):
+            status = main(["--db", db or self.db, *argv], out=out)
+        return status, out.getvalue()
+
+    # Import z pliku jest zapisywany i widoczny przy kolejnym uruchomieniu
+    def test_import_persists(self):
+        status, output = self.run_cli("import", self.csv)
+        self.assertEqual(status, 0)
+        self.assertEqual(output.strip(), "Imported 3 students and 4 grades, 1 rejected lines")
+        self.assertIn("students.csv:6:", self.stderr.getvalue())
+        _, output = self.run_cli("export", "--class", "1a")
+        self.assertEqual(output.splitlines()[1:], ["Jan,Kowalski,1A,Physics,2023", "Anna,Nowak,1A,Math,2023"])
+
+    # Ranking, wyszukiwanie i statystyki
+    def test_rank_find_stats(self):
+        self.run_cli("import", self.csv)
+        _, output = self.run_cli("rank", "-k", "2")
+        self.assertEqual([line.split()[1] for line in output.splitlines()], ["Anna", "Jan"])
+        _, output = self.run_cli("rank", "-k", "1", "--bottom", "--major", "math")
+        self.assertIn("Dąbrowska", output)
+        _, output = self.run_cli("find", "dabr")
+        self.assertIn("Ewa Dąbrowska", output)
+        _, output = self.run_cli("find", "Kowlaski")
+        self.assertIn("Jan Kowalski", output)
+        _, output = self.run_cli("stats", "--by", "class_grade")
+        lines = output.splitlines()
+        self.assertEqual(lines[0], "school: 3 students, average 4.50")
+        self.assertEqual(lines[2].split(), ["1a", "2", "3", "5.00", "4.00", "6.00", "0.82"])
+
+    # Skrypt wykonuje wiele poleceń w jednym procesie i zatrzymuje się na błędzie
+    def test_script(self):
+        script = os.path.join(self.directory.name, "commands.txt")
+        output_file = os.path.join(self.directory.name, "summary.jsonl")
+        with open(script, "w", encoding="utf-8") as file:
+            file.write(f"# nightly job\nimport '{self.csv}'\n\n"
+                       f"export --summary --format jsonl --output '{output_file}'\nrank -k 1\nrank --nope\nstats\n")
+        status, output = self.run_cli("script", script)
+        self.assertEqual(status, 1)
+        self.assertIn("commands.txt:6: invalid command", self.stderr.getvalue())
+        self.assertIn("Anna Nowak", output)
+        self.assertNotIn("school:", output)
+        with open(output_file, encoding="utf-8") as file:
+            self.assertEqual(len(file.readlines()), 3)
+
+    # Baza SQLite wybierana po rozszerzeniu pliku
+    def test_sqlite_db(self):
+        db = os.path.join(self.directory.name, "students.db")
+        self.run_cli("import", self.csv, db=db)
+        _, output = self.run_cli("export", "--year", "2024", db=db)
+        self.assertEqual(output.splitlines()[1:], ["Ewa,Dąbrowska,2B,Math,2024"])
+        self.assertTrue(os.path.isfile(db))
+
+    # Statystyki pustej bazy
+    def test_stats_empty(self):
+        status, output = self.run_cli("stats")
+        self.assertEqual((status, output.splitlines()[0]), (0, "school: 0 students, average -"))
+
+    # Błąd pliku zwraca kod 1
+    def test_missing_file(self):
+        status, _ = self.run_cli("import", os.path.join(self.directory.name, "missing.csv"))
+        self.assertEqual(status, 1)
+        self.assertIn("error:", self.stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
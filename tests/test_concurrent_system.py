@@ -0,0 +1,89 @@
+import threading
+import unittest
+from src.concurrent_system import ConcurrentStudentSystem, ReadWriteLock
+from src.student import Student
+
+
+class TestReadWriteLock(unittest.TestCase):
+
+    # Wielu czytelników jednocześnie, pisarz na wyłączność
+    def test_readers_share_writer_excludes(self):
+        lock = ReadWriteLock()
+        inside = []
+        both_reading = threading.Barrier(2, timeout=5)
+
+        def reader():
+            with lock.read_locked():
+                both_reading.wait()
+                inside.append("read")
+
+        threads = [threading.Thread(target=reader) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(inside, ["read", "read"])
+        with lock.write_locked():
+            with lock.read_locked():
+                with lock.write_locked():
+                    pass
+
+    # Nie można podnieść blokady odczytu do zapisu
+    def test_no_upgrade(self):
+        lock = ReadWriteLock()
+        with lock.read_locked():
+            with self.assertRaises(RuntimeError):
+                lock.acquire_write()
+
+
+class TestConcurrentStudentSystem(unittest.TestCase):
+
+    # Test obciążeniowy: czytelnicy i importer pracują równolegle bez błędów
+    def test_stress_readers_and_writers(self):
+        system = ConcurrentStudentSystem()
+        errors = []
+        stop = threading.Event()
+
+        def importer(offset):
+            try:
+                for i in range(300):
+                    student = Student(f"Jan{offset + i}", "Kowalski", "1A" if i % 2 else "2B", "Physics", 2023)
+                    system.add_student(student)
+                    with system.writing():
+                        student.add_grade("math", 1.0 + i % 6)
+                    if i % 50 == 49:
+                        system.remove_students_from_year(2023)
+            except Exception as e:
+                errors.append(e)
+
+        def reader():
+            try:
+                while not stop.is_set():
+                    system.find_student("Jan1", "Kowalski", 2023)
+                    students = system.sort_class_by_avg_grade()
+                    self.assertEqual(len(students), len(set(students)))
+                    system.top_students(5, class_grade="1A")
+                    try:
+                        system.get_class_average("1A")
+                    except ValueError:
+                        pass
+                    list(system.iter_student_lines())
+            except Exception as e:
+                errors.append(e)
+
+        readers = [threading.Thread(target=reader) for _ in range(4)]
+        writers = [threading.Thread(target=importer, args=(offset,)) for offset in (0, 1000)]
+        for thread in readers + writers:
+            thread.start()
+        for thread in writers:
+            thread.join(30)
+        stop.set()
+        for thread in readers:
+            thread.join(30)
+        self.assertEqual(errors, [])
+        self.assertEqual(system.get_student_count(), 0)
+        with self.assertRaises(ValueError):
+            system.get_school_average()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import threading
+import unittest
+from src.concurrent_system import ConcurrentStudentSystem
+from src.events import (ClassChanged, GradeAdded, GradeRemoved, GradesCleared, MajorChanged, StudentAdded,
+                        StudentChanged, StudentRemoved, StudentRenamed, SubjectDeleted)
+from src.student import Student
+from src.student_system import StudentSystem
+
+
+class TestEventStream(unittest.TestCase):
+
+    def setUp(self):
+        self.system = StudentSystem()
+        self.s1 = Student("Jan", "Kowalski", "1A", "Math", 2023)
+        self.s2 = Student("Anna", "Nowak", "1A", "Physics", 2024)
+        self.s1.add_grade("math", 3.0)
+        self.system.add_student(self.s1)
+
+    # Zdarzenia wszystkich rodzajów zmian, w kolejności wystąpienia
+    def test_typed_events(self):
+        stream = self.system.subscribe()
+        self.system.add_student(self.s2)
+        self.s1.add_grade("math", 4.0)
+        self.s1.remove_last_grade("math")
+        self.s1.add_grade("art", 5.0)
+        self.s1.delete_subject("art")
+        self.s1.delete_all_grades()
+        self.s1.change_name("Janusz", "Kowal")
+        self.s1.change_class_grade("2B")
+        self.s1.change_major("Art")
+        self.system.remove_students_from_year(2024)
+        batch = stream.poll()
+        self.assertEqual(batch.events, [
+            StudentAdded(self.s2), GradeAdded(self.s1, "math", 4.0), GradeRemoved(self.s1, "math", 4.0),
+            GradeAdded(self.s1, "art", 5.0), SubjectDeleted(self.s1, "art", (5.0,), 5.0),
+            GradesCleared(self.s1, {"math": (3.0,)}, 3.0, 1), StudentRenamed(self.s1, "Jan", "Kowalski"),
+            ClassChanged(self.s1, "1A"), MajorChanged(self.s1, "Math"), StudentRemoved(self.s2)])
+        self.assertFalse(batch.overflowed)
+        self.assertEqual(stream.poll().events, [])
+
+    # Paczki o ograniczonej wielkości
+    def test_batches(self):
+        stream = self.system.subscribe()
+        for grade in (2.0, 3.0, 4.0):
+            self.s1.add_grade("math", grade)
+        self.assertEqual([e.grade for e in stream.poll(2).events], [2.0, 3.0])
+        self.assertEqual(len(stream), 1)
+        self.assertEqual([e.grade for e in stream.poll(2).events], [4.0])
+
+    # Przepełniona kolejka odrzuca najstarsze zdarzenia i to zgłasza
+    def test_overflow(self):
+        stream = self.system.subscribe(maxsize=2)
+        for grade in (2.0, 3.0, 4.0):
+            self.s1.add_grade("math", grade)
+        batch = stream.poll()
+        self.assertEqual([e.grade for e in batch.events], [3.0, 4.0])
+        self.assertTrue(batch.overflowed)
+        self.assertFalse(stream.poll().overflowed)
+        with self.assertRaises(ValueError):
+            self.system.subscribe(maxsize=0)
+
+    # Łączenie zdarzeń: jedno zdarzenie na studenta
+    def test_coalesce(self):
+        stream = self.system.subscribe(coalesce=True)
+        s3 = Student("Ewa", "Lis", "2B", "Math", 2025)
+        self.s1.add_grade("math", 4.0)
+        self.s1.change_class_grade("2B")
+        self.system.add_student(self.s2)
+        self.s2.add_grade("math", 5.0)
+        self.system.add_student(s3)
+        self.system.remove_student("Ewa", "Lis", 2025)
+        self.assertEqual(stream.poll().events, [StudentChanged(self.s1), StudentAdded(self.s2)])
+        self.system.remove_student("Jan", "Kowalski", 2023)
+        self.system.remove_student("Anna", "Nowak", 2024)
+        self.system.add_student(self.s2)
+        self.assertEqual(stream.poll().events, [StudentRemoved(self.s1), StudentChanged(self.s2)])
+
+    # Zamknięty strumień nie otrzymuje zdarzeń
+    def test_close(self):
+        with self.system.subscribe() as stream:
+            self.s1.add_grade("math", 4.0)
+        self.s1.add_grade("math", 5.0)
+        self.assertTrue(stream.closed)
+        self.assertEqual(stream.poll().events, [GradeAdded(self.s1, "math", 4.0)])
+        self.assertEqual(self.system._listeners, [])
+
+
+class TestConcurrentEventStream(unittest.TestCase):
+
+    # Konsument w innym wątku czeka na zdarzenia
+    def test_consumer_thread(self):
+        system = ConcurrentStudentSystem()
+        stream = system.subscribe()
+        received = []
+
+        def consume():
+            while len(received) < 20:
+                received.extend(stream.poll(timeout=5).events)
+
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        for i in range(20):
+            system.add_student(Student(f"S{i}", "Test", "1A", "Math", 2023))
+        consumer.join(5)
+        self.assertEqual([e.student.name for e in received], [f"S{i}" for i in range(20)])
+        stream.close()
+        self.assertEqual(stream.poll(timeout=None).events, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
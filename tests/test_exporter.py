@@ -0,0 +1,60 @@
+import io
+import json
+import unittest
+from src.exporter import export_students, export_summaries, write_lines
+from src.importer import ImportReport, import_records, parse_records, read_csv_rows
+from src.student import Student
+from src.student_system import StudentSystem
+
+
+class TestExporter(unittest.TestCase):
+
+    def setUp(self):
+        self.system = StudentSystem()
+        self.s1 = Student("Jan", "Kowalski", "1A", "Physics", 2023)
+        self.s2 = Student("Ewa", "Dąbrowska", "2B", "Math, Applied", 2024)
+        self.s1.add_grade("math", 4.0)
+        self.s1.add_grade("physics", 5.0)
+        self.system.add_student(self.s1)
+        self.system.add_student(self.s2)
+
+    # Eksport CSV można ponownie zaimportować
+    def test_csv_round_trip(self):
+        output = io.StringIO()
+        export_students(self.system.iter_students(), output, chunk_rows=1)
+        output.seek(0)
+        other = StudentSystem()
+        report = ImportReport()
+        import_records(other, parse_records(read_csv_rows(output), report.errors), report)
+        self.assertEqual(report.errors, [])
+        self.assertEqual(other.find_student("Ewa", "Dąbrowska", 2024).major, "Math, Applied")
+
+    # Podsumowania w JSON-lines, z null dla studenta bez ocen
+    def test_summaries_jsonl(self):
+        output = io.StringIO()
+        export_summaries(self.system.sort_class_by_avg_grade(), output, "jsonl")
+        rows = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(rows[0]["name"], "Jan Kowalski")
+        self.assertEqual(rows[0]["average"], 4.5)
+        self.assertIsNone(rows[1]["average"])
+
+    # Tabela o stałej szerokości kolumn
+    def test_fixed_width(self):
+        output = io.StringIO()
+        export_summaries(self.system.iter_students(), output, "text")
+        lines = output.getvalue().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[0].startswith("name"))
+        self.assertEqual(lines[1].index("1A"), lines[0].index("class"))
+        self.assertIn("4.50", lines[1])
+        with self.assertRaises(ValueError):
+            export_students([], output, "xml")
+
+    # Strumieniowe wypisywanie listy studentów daje ten sam wynik co show_all_students
+    def test_write_lines_matches_show_all_students(self):
+        output = io.StringIO()
+        write_lines(self.system.iter_student_lines(), output, chunk_rows=1)
+        self.assertEqual(output.getvalue(), self.system.show_all_students() + "\n")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import random
+import unittest
+from src.gradebook import np
+from src.student import Student
+from src.student_system import StudentSystem
+
+
+class TestGradeBookFallback(unittest.TestCase):
+
+    # Bez NumPy system działa dalej na czystym Pythonie
+    @unittest.skipUnless(np is None, "NumPy jest zainstalowany")
+    def test_enable_without_numpy(self):
+        system = StudentSystem()
+        self.assertFalse(system.enable_gradebook())
+        self.assertIsNone(system.gradebook)
+
+
+@unittest.skipIf(np is None, "NumPy nie jest zainstalowany")
+class TestGradeBook(unittest.TestCase):
+
+    def setUp(self):
+        self.system = StudentSystem()
+        self.s1 = Student("Jan", "Kowalski", "1A", "Physics", 2023)
+        self.s2 = Student("Anna", "Nowak", "1A", "Math", 2023)
+        self.s3 = Student("Adam", "Malinowski", "2B", "math", 2024)
+        self.s1.add_grade("math", 4.0)
+        self.s1.add_grade("physics", 5.0)
+        self.s2.add_grade("math", 3.0)
+        for student in [self.s1, self.s2, self.s3]:
+            self.system.add_student(student)
+        self.assertTrue(self.system.enable_gradebook())
+        self.s3.add_grade("math", 2.0)
+
+    # Statystyki pogrupowane liczone są jednym przebiegiem po kolumnach
+    def test_grouped_statistics(self):
+        gradebook = self.system.gradebook
+        self.assertEqual(gradebook.grade_count(), 4)
+        self.assertEqual(gradebook.class_averages(), {"1A": 4.0, "2B": 2.0})
+        self.assertEqual(gradebook.major_averages(), {"physics": 4.5, "math": 2.5})
+        self.assertEqual(gradebook.subject_averages(), {"math": 3.0, "physics": 5.0})
+        self.assertEqual(gradebook.subject_counts(), {"math": 3, "physics": 1})
+        self.assertEqual(sum(gradebook.grade_distribution(bins=5)), 4)
+
+    # Średnie systemu i GradeBooka śledzą zmiany studentów i są zgodne
+    def test_system_averages_follow_changes(self):
+        gradebook = self.system.gradebook
+        self.assertAlmostEqual(self.system.get_class_average("1A"), 4.0)
+        self.s1.remove_last_grade("physics")
+        self.s2.change_class_grade("2B")
+        self.assertAlmostEqual(self.system.get_class_average("1A"), 4.0)
+        self.assertAlmostEqual(self.system.get_class_average("2B"), 2.5)
+        self.assertAlmostEqual(gradebook.class_average("2B"), 2.5)
+        self.s1.delete_all_grades()
+        with self.assertRaises(ValueError):
+            self.system.get_class_average("1A")
+        with self.assertRaises(ValueError):
+            gradebook.class_average("1A")
+        self.system.remove_student("Anna", "Nowak", 2023)
+        self.assertAlmostEqual(self.system.get_school_average(), 2.0)
+        self.assertAlmostEqual(gradebook.school_average(), 2.0)
+
+    # Wyniki po wielu zmianach (z kompaktowaniem) zgadzają się z agregatami
+    def test_matches_running_aggregates_after_compaction(self):
+        rng = random.Random(3)
+        students = [Student(f"N{i}", "L", rng.choice(["1A", "2B"]), "Math", 2024) for i in range(50)]
+        for student in students:
+            self.system.add_student(student)
+        for _ in range(5000):
+            student = rng.choice(students)
+            if rng.random() < 0.6:
+                student.add_grade(rng.choice(["math", "art"]), rng.uniform(1.0, 6.0))
+            else:
+                try:
+                    student.delete_subject(rng.choice(["math", "art"]))
+                except ValueError:
+                    pass
+        expected = {c: self.system._class_totals[c][0] / self.system._class_totals[c][1]
+                    for c in self.system._class_totals}
+        for class_grade, average in self.system.gradebook.class_averages().items():
+            self.assertAlmostEqual(average, expected[class_grade], places=9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import random
+import statistics
+import unittest
+from src.histograms import GradeHistogram
+from src.student import Student
+from src.student_system import StudentSystem
+
+
+def reference_percentile(grades, percent):
+    grades = sorted(grades)
+    position = percent / 100 * (len(grades) - 1)
+    lower = int(position)
+    if lower + 1 == len(grades):
+        return grades[lower]
+    return grades[lower] + (grades[lower + 1] - grades[lower]) * (position - lower)
+
+
+class TestGradeHistogram(unittest.TestCase):
+
+    # Percentyle zgodne z sortowaniem wszystkich ocen
+    def test_percentiles(self):
+        rng = random.Random(3)
+        grades = [rng.choice([1.0, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5, 5.0, 5.5, 6.0]) for _ in range(501)]
+        histogram = GradeHistogram()
+        histogram.update(grades)
+        self.assertEqual(histogram.percentile(50), statistics.median(grades))
+        for percent in (0, 10, 25, 33.3, 75, 90, 100):
+            self.assertAlmostEqual(histogram.percentile(percent), reference_percentile(grades, percent))
+
+    # Usuwanie ocen i pusty histogram
+    def test_remove(self):
+        histogram = GradeHistogram()
+        histogram.update([3.0, 4.0, 5.0])
+        histogram.update([5.0], -1)
+        self.assertEqual(histogram.percentile(50), 3.5)
+        histogram.update([3.0, 4.0], -1)
+        with self.assertRaises(ValueError):
+            histogram.percentile(50)
+        with self.assertRaises(ValueError):
+            GradeHistogram().percentile(120)
+
+
+class TestSystemPercentiles(unittest.TestCase):
+
+    def setUp(self):
+        self.system = StudentSystem()
+        self.s1 = Student("Jan", "Kowalski", "1A", "Math", 2023)
+        self.s2 = Student("Anna", "Nowak", "1A", "Physics", 2023)
+        self.s3 = Student("Ewa", "Lis", "2B", "Math", 2024)
+        self.s1.add_grade("math", 3.0)
+        self.s1.add_grade("physics", 4.5)
+        self.s2.add_grade("math", 5.0)
+        self.s3.add_grade("math", 2.0)
+        for s in (self.s1, self.s2, self.s3):
+            self.system.add_student(s)
+
+    # Mediana szkoły, klasy i przedmiotu
+    def test_median(self):
+        self.assertEqual(self.system.grade_percentile(50), 3.75)
+        self.assertEqual(self.system.grade_percentile(50, class_grade="1A"), 4.5)
+        self.assertEqual(self.system.grade_percentile(50, subject="math"), 3.0)
+        self.assertEqual(self.system.grade_percentile(100, subject="physics"), 4.5)
+
+    # Histogramy aktualizowane przy każdej zmianie ocen
+    def test_updates(self):
+        self.system.grade_percentile(50)
+        self.s3.add_grade("math", 6.0)
+        self.s1.remove_last_grade("physics")
+        self.assertEqual(self.system.grade_percentile(50), 4.0)
+        self.s2.change_class_grade("2B")
+        self.assertEqual(self.system.grade_percentile(50, class_grade="2B"), 5.0)
+        self.assertEqual(self.system.grade_percentile(0, class_grade="1A"), 3.0)
+        self.s3.delete_subject("math")
+        self.s1.delete_all_grades()
+        self.assertEqual(self.system.grade_percentile(50), 5.0)
+        with self.assertRaises(ValueError):
+            self.system.grade_percentile(50, class_grade="1A")
+        self.system.remove_student("Anna", "Nowak", 2023)
+        with self.assertRaises(ValueError):
+            self.system.grade_percentile(50, subject="math")
+        self.system.add_student(self.s2)
+        self.assertEqual(self.system.grade_percentile(50, subject="math"), 5.0)
+
+    # Histogram zgodny z group_stats
+    def test_histogram(self):
+        self.assertEqual(self.system.grade_histogram(), (0, 0, 1, 0, 1, 0, 0, 1, 1, 0))
+        self.assertEqual(self.system.grade_histogram(class_grade="1A"),
+                         self.system.group_stats("class_grade")["1a"].histogram)
+        self.assertEqual(self.system.grade_histogram(5, subject="history"), (0,) * 5)
+
+    # Klasa i przedmiot naraz nie są obsługiwane
+    def test_class_and_subject(self):
+        with self.assertRaises(ValueError):
+            self.system.grade_percentile(50, class_grade="1A", subject="math")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import io
+import os
+import tempfile
+import unittest
+from src.importer import import_file, import_records, parse_records, read_csv_rows, read_jsonl_rows, ImportReport
+from src.student import Student
+from src.student_system import StudentSystem
+
+CSV_DATA = """name,last_name,class_grade,major,year,subject,grade
+Jan,Kowalski,1A,Physics,2023,math,4.0
+Jan,Kowalski,1A,Physics,2023,physics,5
+Anna,Nowak,1A,Math,2023,,
+Adam,Malinowski,2B,Math,2024,math,7.0
+Ewa,,1A,Physics,2023,math,3.0
+Piotr,Lis,3A,Chemistry,rok,math,3.0
+"""
+
+JSONL_DATA = """{"name": "Jan", "last_name": "Kowalski", "class_grade": "1A", "major": "Physics", "year": 2023, "grades": {"math": [4.0, 5.0]}}
+
+{"name": "Anna", "last_name": "Nowak", "class_grade": "1A", "major": "Math", "year": 2023, "subject": "art", "grade": 6}
+not json
+{"name": "Adam", "last_name": "Malinowski", "class_grade": "2B", "major": "Math", "year": 2024, "grades": {"math": [0.5]}}
+"""
+
+
+class TestImporter(unittest.TestCase):
+
+    def setUp(self):
+        self.system = StudentSystem()
+
+    def run_import(self, rows, batch_size=2):
+        report = ImportReport()
+        import_records(self.system, parse_records(rows, report.errors), report, batch_size)
+        return report
+
+    # Import CSV: poprawne wiersze trafiają do systemu, błędne są raportowane z numerem linii
+    def test_import_csv(self):
+        report = self.run_import(read_csv_rows(io.StringIO(CSV_DATA)))
+        self.assertEqual(report.students_added, 2)
+        self.assertEqual(report.grades_added, 2)
+        self.assertEqual([error.line for error in report.errors], [5, 6, 7])
+        self.assertIn("between 1.0 and 6.0", report.errors[0].message)
+        jan = self.system.find_student("Jan", "Kowalski", 2023)
+        self.assertEqual(jan.get_all_grades(), {"math": [4.0], "physics": [5.0]})
+        self.assertAlmostEqual(self.system.get_class_average("1A"), 4.5)
+
+    # Import JSON-lines z listami ocen
+    def test_import_jsonl(self):
+        report = self.run_import(read_jsonl_rows(io.StringIO(JSONL_DATA)))
+        self.assertEqual(report.students_added, 2)
+        self.assertEqual(report.grades_added, 3)
+        self.assertEqual([error.line for error in report.errors], [4, 5])
+        self.assertEqual(self.system.find_student("Anna", "Nowak", 2023).get_subject_grades("art"), [6.0])
+
+    # Oceny, które nie są słownikiem, dają błąd wiersza zamiast przerwania importu
+    def test_import_grades_not_a_mapping(self):
+        rows = [(1, {"name": "Jan", "last_name": "Kowalski", "class_grade": "1A", "major": "Physics",
+                     "year": 2023, "grades": [4, 5]}),
+                (2, {"name": "Anna", "last_name": "Nowak", "class_grade": "1A", "major": "Math",
+                     "year": 2023, "grades": "x"}),
+                (3, {"name": "Ewa", "last_name": "Lis", "class_grade": "1A", "major": "Math",
+                     "year": 2023, "grades": {"math": [4.0]}})]
+        report = self.run_import(rows)
+        self.assertEqual(report.students_added, 1)
+        self.assertEqual([error.line for error in report.errors], [1, 2])
+        self.assertIn("Invalid grades", report.errors[0].message)
+
+    # Oceny z listy i z kolumny przedmiotu są łączone bez zmiany wiersza wejściowego
+    def test_import_grades_and_subject_column(self):
+        listed = {"math": [4]}
+        rows = [(1, {"name": "Jan", "last_name": "Kowalski", "class_grade": "1A", "major": "Physics",
+                     "year": 2023, "grades": listed, "subject": "math", "grade": 5}),
+                (2, {"name": "Anna", "last_name": "Nowak", "class_grade": "1A", "major": "Math",
+                     "year": 2023, "grades": {"math": 4}, "subject": "math", "grade": 5})]
+        report = self.run_import(rows)
+        self.assertEqual(report.errors, [])
+        self.assertEqual(listed, {"math": [4]})
+        self.assertEqual(self.system.find_student("Jan", "Kowalski", 2023).get_subject_grades("math"), [4.0, 5.0])
+        self.assertEqual(self.system.find_student("Anna", "Nowak", 2023).get_subject_grades("math"), [4.0, 5.0])
+
+    # Ocena "nan" jest odrzucana
+    def test_import_nan_grade(self):
+        report = self.run_import([(1, {"name": "Jan", "last_name": "Kowalski", "class_grade": "1A",
+                                       "major": "Physics", "year": 2023, "subject": "math", "grade": "nan"})])
+        self.assertEqual(report.students_added, 0)
+        self.assertIn("between 1.0 and 6.0", report.errors[0].message)
+
+    # Oceny dla istniejącego studenta są dopisywane, a nie tworzony jest duplikat
+    def test_import_adds_grades_to_existing_student(self):
+        jan = Student("Jan", "Kowalski", "1A", "Physics", 2023)
+        self.system.add_student(jan)
+        self.run_import(read_csv_rows(io.StringIO(CSV_DATA)), batch_size=1)
+        self.assertEqual(self.system.get_student_count(), 2)
+        self.assertEqual(jan.get_all_grades(), {"math": [4.0], "physics": [5.0]})
+
+    # Import z pliku rozpoznaje format po rozszerzeniu
+    def test_import_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "students.jsonl")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(JSONL_DATA)
+            report = import_file(self.system, path)
+        self.assertEqual(report.students_added, 2)
+        with self.assertRaises(ValueError):
+            import_file(self.system, path, file_format="xml")
+
+    # Dodawanie hurtowe aktualizuje indeksy i średnie
+    def test_add_students_bulk(self):
+        s1 = Student("Jan", "Kowalski", "1A", "Physics", 2023)
+        s2 = Student("Anna", "Nowak", "1a", "Math", 2023)
+        s1.add_grade("math", 4.0)
+        s2.add_grade("math", 2.0)
+        self.assertEqual(self.system.add_students_bulk([s1, s2]), 2)
+        self.assertEqual(self.system.get_students_by_class("1A"), [s1, s2])
+        self.assertAlmostEqual(self.system.get_school_average(), 3.0)
+        s2.add_grade("math", 6.0)
+        self.assertAlmostEqual(self.system.get_class_average("1a"), 4.0)
+        with self.assertRaises(ValueError):
+            self.system.add_students_bulk([s1])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import os
+import tempfile
+import unittest
+from src.journal import SNAPSHOT_FILE, JournalStorage
+from src.student import Student
+
+
+class TestJournalStorage(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = self.directory.name
+        with JournalStorage(self.path) as storage:
+            system = storage.load()
+            jan = Student("Jan", "Kowalski", "1A", "Physics", 2023)
+            jan.add_grade("math", 4.0)
+            system.add_student(jan)
+            jan.add_grade("math", 5.0)
+            jan.add_grade("physics", 3.0)
+            anna = Student("Anna", "Nowak", "2B", "Math", 2024)
+            system.add_student(anna)
+            anna.add_grade("math", 2.0)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def reopen(self, **options):
+        storage = JournalStorage(self.path, **options)
+        self.addCleanup(storage.close)
+        return storage, storage.load()
+
+    def journal_path(self, storage):
+        return os.path.join(self.path, storage._journal_name)
+
+    # Odtworzenie stanu z samego dziennika
+    def test_replay(self):
+        _, system = self.reopen()
+        self.assertEqual(system.get_student_count(), 2)
+        jan = system.find_student("Jan", "Kowalski", 2023)
+        self.assertEqual(jan.get_all_grades(), {"math": [4.0, 5.0], "physics": [3.0]})
+        self.assertAlmostEqual(system.get_school_average(), 3.5)
+
+    # Wszystkie rodzaje zmian są zapisywane w dzienniku
+    def test_changes_are_journalled(self):
+        storage, system = self.reopen()
+        jan = system.find_student("Jan", "Kowalski", 2023)
+        jan.remove_last_grade("math")
+        jan.delete_subject("physics")
+        jan.change_name("Janusz", "Kowalski")
+        jan.change_class_grade("3C")
+        jan.change_major("Chemistry")
+        system.remove_student("Anna", "Nowak", 2024)
+        storage.close()
+        _, system = self.reopen()
+        self.assertEqual(system.get_student_count(), 1)
+        janusz = system.find_student("Janusz", "Kowalski", 2023)
+        self.assertEqual((janusz.class_grade, janusz.major), ("3C", "Chemistry"))
+        self.assertEqual(janusz.get_all_grades(), {"math": [4.0]})
+
+    # Migawka zastępuje dziennik, a późniejsze zmiany trafiają do nowego dziennika
+    def test_snapshot_and_tail(self):
+        storage, system = self.reopen()
+        old_journal = self.journal_path(storage)
+        storage.snapshot()
+        self.assertFalse(os.path.exists(old_journal))
+        self.assertEqual(os.path.getsize(self.journal_path(storage)), 0)
+        system.find_student("Anna", "Nowak", 2024).add_grade("art", 6.0)
+        system.add_student(Student("Ewa", "Lis", "1A", "Math", 2023))
+        storage.close()
+        storage, system = self.reopen()
+        self.assertEqual(storage._entries, 2)
+        self.assertEqual(system.find_student("Anna", "Nowak", 2024).get_all_grades(),
+                         {"math": [2.0], "art": [6.0]})
+        self.assertIsNotNone(system.find_student("Ewa", "Lis", 2023))
+        self.assertAlmostEqual(system.get_class_average("2B"), 4.0)
+
+    # Migawka jest robiona automatycznie co określoną liczbę wpisów
+    def test_automatic_snapshot(self):
+        storage, system = self.reopen(snapshot_every=10)
+        self.assertEqual(storage._entries, 5)
+        anna = system.find_student("Anna", "Nowak", 2024)
+        for _ in range(5):
+            anna.add_grade("math", 3.0)
+        self.assertTrue(os.path.exists(os.path.join(self.path, SNAPSHOT_FILE)))
+        self.assertEqual(storage._entries, 0)
+        storage.close()
+        _, system = self.reopen()
+        self.assertEqual(system.find_student("Anna", "Nowak", 2024).get_subject_grades("math"), [2.0] + [3.0] * 5)
+
+    # Automatyczna migawka w trakcie dodawania wielu studentów naraz czeka na koniec paczki
+    def test_automatic_snapshot_during_bulk_add(self):
+        storage, system = self.reopen(snapshot_every=5)
+        students = [Student(f"S{i}", "Test", "1A", "Math", 2023) for i in range(10)]
+        students[3].add_grade("math", 4.0)
+        system.add_students_bulk(students)
+        self.assertEqual(storage._entries, 0)
+        self.assertTrue(os.path.exists(os.path.join(self.path, SNAPSHOT_FILE)))
+        storage.close()
+        _, system = self.reopen()
+        self.assertEqual(system.get_student_count(), 12)
+        self.assertEqual(system.find_student("S3", "Test", 2023).get_all_grades(), {"math": [4.0]})
+
+    # Urwana ostatnia linia dziennika (awaria w trakcie zapisu) jest pomijana
+    def test_torn_last_entry(self):
+        storage, _ = self.reopen()
+        path = self.journal_path(storage)
+        storage.close()
+        with open(path, "a", encoding="utf-8") as file:
+            file.write('["grade_added", 1, "ma')
+        storage, system = self.reopen()
+        self.assertEqual(system.find_student("Jan", "Kowalski", 2023).get_subject_grades("math"), [4.0, 5.0])
+        system.find_student("Jan", "Kowalski", 2023).add_grade("math", 6.0)
+        storage.close()
+        _, system = self.reopen()
+        self.assertEqual(system.find_student("Jan", "Kowalski", 2023).get_subject_grades("math"), [4.0, 5.0, 6.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
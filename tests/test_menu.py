@@ -1,7 +1,8 @@
 import unittest
 from unittest.mock import patch
 from src.student_system import StudentSystem
-from menu import add_student_to_system
+from src import metrics
+from menu import add_student_to_system, show_performance_stats
 
 class TestMenuAddStudent(unittest.TestCase):
     @patch("builtins.input", side_effect=["Jan", "Kowalski", "1A", "Physics", "2024"])
@@ -26,5 +27,27 @@ class TestMenuRemoveStudent(unittest.TestCase):
         remove_student_from_system(system)
         self.assertEqual(system.get_student_count(), 0)
 
+class TestMenuPerformanceStats(unittest.TestCase):
+    def tearDown(self):
+        metrics.disable()
+
+    # Zbieranie statystyk można włączyć, wyzerować i wyłączyć z menu
+    def test_enable_reset_disable(self):
+        system = StudentSystem()
+        with patch("builtins.input", side_effect=["1"]):
+            show_performance_stats()
+        self.assertIsNone(metrics.active())
+        with patch("builtins.input", side_effect=["2"]):
+            show_performance_stats()
+        self.assertIsNotNone(metrics.active())
+        system.search_students("Jan")
+        self.assertTrue(metrics.active().snapshot())
+        with patch("builtins.input", side_effect=["4"]):
+            show_performance_stats()
+        self.assertEqual(metrics.active().snapshot(), {})
+        with patch("builtins.input", side_effect=["3"]):
+            show_performance_stats()
+        self.assertIsNone(metrics.active())
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+from src import metrics
+from src.student import Student
+from src.student_system import StudentSystem
+
+
+class TestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.system = StudentSystem()
+        for i in range(5):
+            student = Student(f"Jan{i}", "Kowalski", "1A" if i < 3 else "2B", "Physics", 2023)
+            student.add_grade("math", 4.0)
+            self.system.add_student(student)
+
+    def tearDown(self):
+        metrics.disable()
+
+    # Wyłączone pomiary nie opakowują metod
+    def test_disabled_by_default(self):
+        self.assertIsNone(metrics.active())
+        self.assertFalse(hasattr(StudentSystem.find_student, "__wrapped__"))
+
+    # Zliczanie wywołań, przeskanowanych wierszy i błędów
+    def test_records_calls_and_rows(self):
+        collected = metrics.enable()
+        self.system.find_student("Jan1", "Kowalski", 2023)
+        self.system.get_students_by_class("1A")
+        self.system.sort_class_by_avg_grade()
+        with self.assertRaises(ValueError):
+            self.system.get_class_average("3C")
+        snapshot = collected.snapshot()
+        self.assertEqual(snapshot["StudentSystem.find_student"]["calls"], 1)
+        self.assertEqual(snapshot["StudentSystem.get_students_by_class"]["rows"], 3)
+        self.assertEqual(snapshot["StudentSystem.sort_class_by_avg_grade"]["rows"], 5)
+        self.assertEqual(snapshot["StudentSystem.get_class_average"]["errors"], 1)
+        self.assertEqual(snapshot["Student.average_grade"]["calls"], 5)
+        self.assertEqual(sum(snapshot["StudentSystem.find_student"]["histogram"].values()), 1)
+        self.assertIn("StudentSystem.find_student", metrics.format_snapshot(snapshot))
+
+    # Wyłączenie przywraca oryginalne metody
+    def test_disable_restores_methods(self):
+        original = StudentSystem.find_student
+        collected = metrics.enable()
+        self.assertIsNot(StudentSystem.find_student, original)
+        metrics.disable()
+        self.assertIs(StudentSystem.find_student, original)
+        self.system.find_student("Jan1", "Kowalski", 2023)
+        self.assertEqual(collected.snapshot(), {})
+
+if __name__ == "__main__":
+    unittest.main()
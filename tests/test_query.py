@@ -0,0 +1,91 @@
+import unittest
+from src.concurrent_system import ConcurrentStudentSystem
+from src.student import Student
+from src.student_system import StudentSystem
+
+
+class TestQuery(unittest.TestCase):
+
+    def setUp(self):
+        self.system = StudentSystem()
+        self.s1 = Student("Jan", "Kowalski", "2B", "Math", 2023)
+        self.s2 = Student("Anna", "Nowak", "2b", "math", 2024)
+        self.s3 = Student("Ewa", "Lis", "2B", "Physics", 2023)
+        self.s4 = Student("Piotr", "Zając", "1A", "Math", 2023)
+        self.s5 = Student("Ola", "Wiśniewska", "2B", "MATH", 2023)
+        self.s1.add_grade("math", 4.0)
+        self.s2.add_grade("math", 5.0)
+        self.s3.add_grade("math", 6.0)
+        self.s4.add_grade("math", 3.0)
+        for s in (self.s1, self.s2, self.s3, self.s4, self.s5):
+            self.system.add_student(s)
+
+    # Bez warunków zapytanie zwraca wszystkich studentów w kolejności dodania
+    def test_all_students(self):
+        self.assertEqual(self.system.query().all(), [self.s1, self.s2, self.s3, self.s4, self.s5])
+
+    # Filtry klasy i kierunku ignorują wielkość liter
+    def test_where(self):
+        query = self.system.query().where(class_grade="2b", major="Math")
+        self.assertEqual(query.all(), [self.s1, self.s2, self.s5])
+        self.assertEqual(query.where(year=2023).all(), [self.s1, self.s5])
+        self.assertEqual(query.where(lambda s: s.name.startswith("A")).all(), [self.s2])
+
+    # Wyszukanie po imieniu, nazwisku i roku
+    def test_where_name(self):
+        self.assertEqual(self.system.query().where(name="Ewa", last_name="Lis", year=2023).all(), [self.s3])
+        self.assertEqual(self.system.query().where(name="Ewa", last_name="Lis", year=2024).all(), [])
+
+    # Sprzeczne warunki nie zwracają nikogo
+    def test_conflicting_filters(self):
+        self.assertEqual(self.system.query().where(class_grade="2B").where(class_grade="1A").all(), [])
+
+    # Sortowanie po średniej jak w top_students i bottom_students
+    def test_order_by_average(self):
+        query = self.system.query().where(class_grade="2B")
+        self.assertEqual(query.order_by("average", desc=True).all(), [self.s3, self.s2, self.s1, self.s5])
+        self.assertEqual(query.order_by("average").all(), [self.s1, self.s2, self.s3, self.s5])
+        self.assertEqual(query.order_by("average", desc=True).limit(2).all(),
+                         self.system.top_students(2, class_grade="2B"))
+        self.assertEqual(query.order_by("average").limit(3).all(), self.system.bottom_students(3, class_grade="2B"))
+
+    # Sortowanie po innych polach zachowuje kolejność dodania przy remisach
+    def test_order_by_field(self):
+        self.assertEqual(self.system.query().order_by("major").all(), [self.s1, self.s2, self.s4, self.s5, self.s3])
+        self.assertEqual(self.system.query().order_by("year", desc=True).all(),
+                         [self.s2, self.s1, self.s3, self.s4, self.s5])
+
+    # Limit, pierwszy wynik i liczba wyników
+    def test_limit_first_count(self):
+        query = self.system.query().where(major="math")
+        self.assertEqual(query.limit(2).all(), [self.s1, self.s2])
+        self.assertEqual(query.limit(2).limit(5).count(), 2)
+        self.assertEqual(query.count(), 4)
+        self.assertIs(query.order_by("average", desc=True).first(), self.s2)
+        self.assertIsNone(self.system.query().where(class_grade="3C").first())
+
+    # Zapytanie jest leniwe i widzi zmiany wprowadzone po jego utworzeniu
+    def test_lazy(self):
+        query = self.system.query().where(class_grade="1A")
+        self.s3.change_class_grade("1a")
+        self.assertEqual(query.all(), [self.s3, self.s4])
+
+    # Nieobsługiwane pola i ujemny limit
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            self.system.query().where(grade=5.0)
+        with self.assertRaises(ValueError):
+            self.system.query().order_by("grades")
+        with self.assertRaises(ValueError):
+            self.system.query().limit(-1)
+
+    # Zapytanie w systemie współbieżnym
+    def test_concurrent_system(self):
+        system = ConcurrentStudentSystem()
+        for s in (self.s1, self.s2, self.s3):
+            system.add_student(s)
+        self.assertEqual(system.query().where(major="math").order_by("average", desc=True).all(), [self.s2, self.s1])
+
+
+if __name__ == "__main__":
+    unittest.main()
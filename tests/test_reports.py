@@ -0,0 +1,50 @@
+import unittest
+from src.reports import generate_reports, group_records
+from src.student import Student
+from src.student_system import StudentSystem
+
+
+class TestReports(unittest.TestCase):
+
+    def setUp(self):
+        self.system = StudentSystem()
+        self.s1 = Student("Jan", "Kowalski", "1A", "Math", 2023)
+        self.s2 = Student("Anna", "Nowak", "1a", "Physics", 2023)
+        self.s3 = Student("Ewa", "Lis", "2B", "math", 2024)
+        self.s1.add_grade("math", 3.0)
+        self.s2.add_grade("math", 5.0)
+        self.s2.add_grade("physics", 6.0)
+        for s in (self.s1, self.s2, self.s3):
+            self.system.add_student(s)
+
+    # Grupowanie klas i kierunków bez rozróżniania wielkości liter
+    def test_group_records(self):
+        groups = group_records(self.system)
+        self.assertEqual(sorted(groups), [("class", "1a"), ("class", "2b"), ("major", "math"), ("major", "physics")])
+        self.assertEqual([record[0] for record in groups[("class", "1a")]], ["Jan Kowalski", "Anna Nowak"])
+        self.assertEqual(groups[("class", "1a")][1][-3:], (2, 5.5, 11.0))
+
+    # Raport klasy: średnia grupy i studenci od najlepszej średniej, bez ocen na końcu
+    def test_report_content(self):
+        reports = generate_reports(self.system, workers=1)
+        lines = reports[("class", "1a")].splitlines()
+        self.assertIn("2 students, average 4.67", lines[0])
+        self.assertIn("Anna Nowak", lines[1])
+        self.assertIn("average=5.50", lines[1])
+        self.assertIn("Jan Kowalski", lines[2])
+        major = reports[("major", "math")].splitlines()
+        self.assertIn("Ewa Lis", major[2])
+        self.assertIn("average=-", major[2])
+
+    # Pula procesów daje te same raporty co przetwarzanie w jednym procesie
+    def test_process_pool_matches_serial(self):
+        self.assertEqual(generate_reports(self.system, workers=2), generate_reports(self.system, workers=1))
+
+    # Tylko wybrany rodzaj grup
+    def test_only_classes(self):
+        reports = generate_reports(self.system, workers=0, kinds=("class",))
+        self.assertEqual(list(reports), [("class", "1a"), ("class", "2b")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+from src.search import NameIndex, bounded_distance, normalize
+from src.student import Student
+from src.student_system import StudentSystem
+
+
+class TestNormalize(unittest.TestCase):
+
+    # Usuwanie polskich znaków (także ł) i wielkości liter
+    def test_normalize(self):
+        self.assertEqual(normalize("Dąbrowska"), "dabrowska")
+        self.assertEqual(normalize("  PaWEŁ   Łukasz "), "pawel lukasz")
+        self.assertEqual(normalize("Małgorzata Żółć"), "malgorzata zolc")
+
+    # Odległość edycyjna z limitem
+    def test_bounded_distance(self):
+        self.assertEqual(bounded_distance("kowalski", "kowlaski", 2), 2)
+        self.assertEqual(bounded_distance("kowalski", "kowalsky", 2), 1)
+        self.assertEqual(bounded_distance("kowalski", "nowak", 2), 3)
+
+
+class TestNameSearch(unittest.TestCase):
+
+    def setUp(self):
+        self.system = StudentSystem()
+        self.jan = Student("Jan", "Kowalski", "1A", "Physics", 2023)
+        self.ewa = Student("Ewa", "Dąbrowska", "2B", "Math", 2024)
+        self.anna = Student("Anna", "Kowalska", "1A", "Math", 2024)
+        for s in (self.jan, self.ewa, self.anna):
+            self.system.add_student(s)
+
+    # Wyszukiwanie po początku imienia, nazwiska lub pełnego imienia i nazwiska
+    def test_prefix(self):
+        self.assertEqual(self.system.search_students("kowal"), [self.anna, self.jan])
+        self.assertEqual(self.system.search_students("Jan Kow"), [self.jan])
+        self.assertEqual(self.system.search_students("kowalski j"), [self.jan])
+        self.assertEqual(self.system.search_students("Dabr"), [self.ewa])
+        self.assertEqual(self.system.search_students("kowal", limit=1), [self.anna])
+        self.assertEqual(self.system.search_students("kowal", limit=0), [])
+        self.assertEqual(self.system.fuzzy_search_students("kowalsky", limit=0), [])
+        self.assertEqual(self.system.search_students(""), [])
+
+    # Wyszukiwanie przybliżone, np. literówki i brak polskich znaków
+    def test_fuzzy(self):
+        self.assertEqual(self.system.fuzzy_search_students("Kowlaski"), [self.jan])
+        self.assertEqual(self.system.fuzzy_search_students("Kowlaski", max_distance=3), [self.jan, self.anna])
+        self.assertEqual(self.system.fuzzy_search_students("Ewa Dabrowsak"), [self.ewa])
+        self.assertEqual(self.system.fuzzy_search_students("Kowlaski", max_distance=1), [])
+
+    # Student dopasowany imieniem i nazwiskiem dostaje lepszą z odległości
+    def test_fuzzy_keeps_best_distance(self):
+        jon_jan = Student("Jon", "Jan", "1A", "Math", 2024)
+        jon_smith = Student("Jon", "Smith", "1A", "Math", 2024)
+        self.system.add_student(jon_jan)
+        self.system.add_student(jon_smith)
+        self.assertEqual(self.system.fuzzy_search_students("jon")[:2], [jon_jan, jon_smith])
+
+    # Bardzo krótkie zapytania bez wspólnych trigramów z imieniem
+    def test_fuzzy_short_names(self):
+        li = Student("Li", "Wu", "1A", "Math", 2024)
+        self.system.add_student(li)
+        self.assertEqual(self.system.fuzzy_search_students("Le", max_distance=1), [li])
+        self.assertEqual(self.system.fuzzy_search_students("Le"), [])
+
+    # Indeks nadąża za dodawaniem, usuwaniem i zmianą nazwiska
+    def test_index_follows_changes(self):
+        self.system.search_students("a")
+        piotr = Student("Piotr", "Łukasiewicz", "3C", "Math", 2022)
+        self.system.add_student(piotr)
+        self.assertEqual(self.system.search_students("lukas"), [piotr])
+        self.jan.change_name("Janusz", "Nowak")
+        self.assertEqual(self.system.search_students("kowal"), [self.anna])
+        self.assertEqual(self.system.search_students("nowak janu"), [self.jan])
+        self.system.remove_student("Anna", "Kowalska", 2024)
+        self.assertEqual(self.system.search_students("kowal"), [])
+        self.assertEqual(self.system.fuzzy_search_students("kowalska"), [])
+
+    # Wiele nowych nazw naraz przebudowuje posortowaną listę
+    def test_bulk_additions(self):
+        index = NameIndex()
+        students = [Student(f"Imie{i:03}", "Lis", "1A", "Math", 2024) for i in range(200)]
+        for s in students:
+            index.add(s)
+        self.assertEqual(index.prefix("imie19", limit=20), students[190:200])
+        index.remove(students[195])
+        self.assertEqual(len(index.prefix("imie19", limit=20)), 9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import asyncio
+import json
+import unittest
+from src.service import StudentService
+from src.student import Student
+from src.student_system import StudentSystem
+
+
+class TestStudentService(unittest.TestCase):
+
+    def setUp(self):
+        self.system = StudentSystem()
+        self.jan = Student("Jan", "Kowalski", "1A", "Physics", 2023)
+        self.anna = Student("Anna", "Nowak", "1A", "Math", 2023)
+        self.jan.add_grade("math", 4.0)
+        self.anna.add_grade("math", 5.0)
+        self.system.add_student(self.jan)
+        self.system.add_student(self.anna)
+
+    def exchange(self, requests):
+        async def run():
+            service = StudentService(self.system)
+            server = await service.start("127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            for request in requests:
+                writer.write((request if isinstance(request, str) else json.dumps(request)).encode() + b"\n")
+            await writer.drain()
+            responses = [json.loads(await reader.readline()) for _ in requests]
+            writer.close()
+            await service.stop(server)
+            return service, responses
+        return asyncio.run(run())
+
+    # Potokowe zapytania są obsługiwane partiami, a odpowiedzi mają identyfikatory zapytań
+    def test_pipelined_requests(self):
+        service, responses = self.exchange([
+            {"id": 1, "op": "find", "args": {"name": "Jan", "last_name": "Kowalski", "year": 2023}},
+            {"id": 2, "op": "add_grade", "args": {"name": "Jan", "last_name": "Kowalski", "year": 2023,
+                                                  "subject": "math", "grade": 6.0}},
+            {"id": 3, "op": "class_average", "args": {"class_grade": "1A"}},
+            {"id": 4, "op": "top", "args": {"k": 1}},
+            {"id": 5, "op": "school_average"},
+        ])
+        by_id = {response["id"]: response for response in responses}
+        self.assertEqual(by_id[1]["result"]["name"], "Jan Kowalski")
+        self.assertTrue(by_id[2]["result"])
+        self.assertAlmostEqual(by_id[3]["result"], 5.0)
+        self.assertEqual(by_id[4]["result"][0]["first_name"], "Jan")
+        self.assertEqual(service.requests, 5)
+        self.assertLessEqual(service.batches, 5)
+        self.assertEqual(self.jan.get_subject_grades("math"), [4.0, 6.0])
+
+    # Błędy są zwracane klientowi, a połączenie działa dalej
+    def test_errors(self):
+        _, responses = self.exchange([
+            "not json",
+            {"id": 1, "op": "unknown"},
+            {"id": 2, "op": "class_average", "args": {"class_grade": "3C"}},
+            {"id": 3, "op": "add_grade", "args": {"name": "X", "last_name": "Y", "year": 1,
+                                                  "subject": "math", "grade": 4.0}},
+            {"id": 4, "op": "find", "args": {"bad": 1}},
+        ])
+        self.assertTrue(all(not response["ok"] for response in responses))
+        self.assertEqual(sorted(str(response["id"]) for response in responses), ["1", "2", "3", "4", "None"])
+
+    # Nieoczekiwany błąd jednego zapytania nie psuje pozostałych zapytań partii
+    def test_error_in_mixed_batch(self):
+        service = StudentService(self.system)
+        self.addCleanup(service._executor.shutdown)
+        responses = service._execute_batch([
+            {"id": 1, "op": "add_grade", "args": {"name": "Jan", "last_name": "Kowalski", "year": 2023,
+                                                  "subject": "math", "grade": 6.0}},
+            {"id": 2, "op": "top", "args": {"class_grade": 5}},
+            {"id": 3, "op": "school_average"},
+        ])
+        self.assertEqual([response["ok"] for response in responses], [True, False, True])
+        self.assertAlmostEqual(responses[2]["result"], 5.0)
+        self.assertEqual(self.jan.get_subject_grades("math"), [4.0, 6.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
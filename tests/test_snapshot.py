@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+from src.snapshot import Snapshot, load_snapshot, write_snapshot
+from src.student import Student
+from src.student_system import StudentSystem
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "students.snap")
+        self.system = StudentSystem()
+        jan = Student("Jan", "Kowalski", "1A", "Physics", 2023)
+        jan.add_grade("math", 4.0)
+        jan.add_grade("math", 5.5)
+        jan.add_grade("fizyka", 3.0)
+        anna = Student("Anna", "Dąbrowska", "2B", "Physics", 2024)
+        self.system.add_student(jan)
+        self.system.add_student(anna)
+        write_snapshot(self.system, self.path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    # Zapis i odczyt całego systemu, także polskich znaków
+    def test_round_trip(self):
+        system = load_snapshot(self.path)
+        self.assertEqual([str(s) for s in system.students], [str(s) for s in self.system.students])
+        jan = system.find_student("Jan", "Kowalski", 2023)
+        self.assertEqual(jan.get_all_grades(), {"math": [4.0, 5.5], "fizyka": [3.0]})
+        self.assertIsNotNone(system.find_student("Anna", "Dąbrowska", 2024))
+        self.assertAlmostEqual(system.get_school_average(), 12.5 / 3)
+
+    # Oceny są czytane z pliku dopiero przy pierwszym użyciu
+    def test_lazy_grades(self):
+        with Snapshot(self.path) as snapshot:
+            system = snapshot.to_system()
+            jan = system.find_student("Jan", "Kowalski", 2023)
+            self.assertIsNone(jan._grade_store)
+            self.assertAlmostEqual(system.get_class_average("1A"), 12.5 / 3)
+            self.assertIsNone(jan._grade_store)
+            self.assertEqual(jan.get_subject_grades("math"), [4.0, 5.5])
+            jan.add_grade("art", 6.0)
+            self.assertAlmostEqual(system.get_class_average("1A"), 18.5 / 4)
+
+    # Dostęp do pojedynczych studentów bez budowania systemu
+    def test_random_access(self):
+        with Snapshot(self.path) as snapshot:
+            self.assertEqual(len(snapshot), 2)
+            anna = snapshot[1]
+            jan = snapshot[-2]
+        self.assertEqual((anna.name, anna.last_name, anna.year), ("Anna", "Dąbrowska", 2024))
+        self.assertEqual(jan.get_subject_grades("fizyka"), [3.0])
+        with Snapshot(self.path) as snapshot, self.assertRaises(IndexError):
+            snapshot[2]
+
+    # Nadpisanie pliku nie psuje otwartej migawki, która nadal czyta poprzednią wersję
+    def test_rewrite_while_open(self):
+        with Snapshot(self.path) as snapshot:
+            other = StudentSystem()
+            for i in range(2000):
+                student = Student(f"S{i}", "Test", "3C", "Math", 2025)
+                student.add_grade("math", 2.0)
+                other.add_student(student)
+            write_snapshot(other, self.path)
+            system = snapshot.to_system()
+            self.assertEqual(system.find_student("Jan", "Kowalski", 2023).get_subject_grades("math"), [4.0, 5.5])
+        self.assertEqual(len(load_snapshot(self.path).students), 2000)
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+
+    # Plik, który nie jest migawką, jest odrzucany
+    def test_invalid_file(self):
+        with open(self.path, "wb") as file:
+            file.write(b"x" * 100)
+        with self.assertRaises(ValueError):
+            Snapshot(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
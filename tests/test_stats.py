@@ -0,0 +1,60 @@
+import statistics
+import unittest
+from src.stats import GroupStats, group_stats, histogram_edges
+from src.student import Student
+from src.student_system import StudentSystem
+
+
+class TestGroupStats(unittest.TestCase):
+
+    def setUp(self):
+        self.system = StudentSystem()
+        self.s1 = Student("Jan", "Kowalski", "1A", "Math", 2023)
+        self.s2 = Student("Anna", "Nowak", "1a", "Physics", 2023)
+        self.s3 = Student("Ewa", "Lis", "2B", "math", 2024)
+        self.s1.add_grade("math", 3.0)
+        self.s1.add_grade("physics", 4.5)
+        self.s2.add_grade("math", 5.0)
+        self.s2.add_grade("math", 6.0)
+        for s in (self.s1, self.s2, self.s3):
+            self.system.add_student(s)
+
+    # Statystyki klas: liczba ocen, średnia, min, max, odchylenie i histogram
+    def test_by_class(self):
+        stats = self.system.group_stats("class_grade")
+        self.assertEqual(list(stats), ["1a", "2b"])
+        first = stats["1a"]
+        self.assertEqual((first.students, first.count, first.min, first.max), (2, 4, 3.0, 6.0))
+        self.assertAlmostEqual(first.mean, 4.625)
+        self.assertAlmostEqual(first.stdev, statistics.pstdev([3.0, 4.5, 5.0, 6.0]))
+        self.assertEqual(first.histogram, (0, 0, 0, 0, 1, 0, 0, 1, 1, 1))
+        self.assertEqual(stats["2b"], GroupStats("2b", 1, 0, None, None, None, None, (0,) * 10))
+
+    # Grupowanie po kierunku, roku i przedmiocie
+    def test_other_groupings(self):
+        self.assertEqual({key: s.students for key, s in self.system.group_stats("major").items()},
+                         {"math": 2, "physics": 1})
+        self.assertEqual(self.system.group_stats("year")[2024].count, 0)
+        subjects = self.system.group_stats("subject")
+        self.assertEqual((subjects["math"].students, subjects["math"].count), (2, 3))
+        self.assertEqual(subjects["physics"].mean, 4.5)
+
+    # Średnie zgodne z get_class_average
+    def test_matches_class_average(self):
+        self.assertAlmostEqual(self.system.group_stats()["1a"].mean,
+                               (self.system.get_class_average("1A") * 2 + self.system.get_class_average("1a") * 2) / 4)
+
+    # Liczba przedziałów histogramu i ocena 6.0 w ostatnim przedziale
+    def test_bins(self):
+        stats = group_stats([self.s2], "subject", bins=5)
+        self.assertEqual(stats["math"].histogram, (0, 0, 0, 0, 2))
+        self.assertEqual(histogram_edges(5), [1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+
+    # Nieznane grupowanie
+    def test_unknown_grouping(self):
+        with self.assertRaises(ValueError):
+            self.system.group_stats("name")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import os
+import tempfile
+import unittest
+from src.storage import SQLiteStorage, Storage
+from src.student import Student
+
+
+class TestSQLiteStorage(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "students.db")
+        with SQLiteStorage(self.path) as storage:
+            system = storage.load()
+            jan = Student("Jan", "Kowalski", "1A", "Physics", 2023)
+            jan.add_grade("math", 4.0)
+            system.add_student(jan)
+            jan.add_grade("math", 5.0)
+            jan.add_grade("physics", 3.0)
+            anna = Student("Anna", "Nowak", "2B", "Math", 2024)
+            system.add_student(anna)
+            anna.add_grade("math", 2.0)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def reopen(self):
+        storage = SQLiteStorage(self.path)
+        self.addCleanup(storage.close)
+        return storage, storage.load()
+
+    # Studenci i oceny przetrwają zamknięcie i ponowne otwarcie bazy
+    def test_round_trip(self):
+        _, system = self.reopen()
+        self.assertEqual(system.get_student_count(), 2)
+        jan = system.find_student("Jan", "Kowalski", 2023)
+        self.assertEqual(jan.get_all_grades(), {"math": [4.0, 5.0], "physics": [3.0]})
+        self.assertAlmostEqual(system.get_school_average(), 3.5)
+
+    # Oceny są wczytywane dopiero przy pierwszym użyciu
+    def test_grades_loaded_lazily(self):
+        _, system = self.reopen()
+        anna = system.find_student("Anna", "Nowak", 2024)
+        self.assertIsNone(anna._grade_store)
+        self.assertAlmostEqual(system.get_class_average("2B"), 2.0)
+        self.assertIsNone(anna._grade_store)
+        self.assertEqual(anna.get_subject_grades("math"), [2.0])
+        self.assertIsNotNone(anna._grade_store)
+
+    # Zmiany danych i ocen są zapisywane
+    def test_changes_are_persisted(self):
+        storage, system = self.reopen()
+        jan = system.find_student("Jan", "Kowalski", 2023)
+        jan.remove_last_grade("math")
+        jan.delete_subject("physics")
+        jan.change_name("Janusz", "Kowalski")
+        jan.change_class_grade("3C")
+        jan.change_major("Chemistry")
+        system.remove_student("Anna", "Nowak", 2024)
+        storage.close()
+        _, system = self.reopen()
+        self.assertEqual(system.get_student_count(), 1)
+        janusz = system.find_student("Janusz", "Kowalski", 2023)
+        self.assertEqual((janusz.class_grade, janusz.major), ("3C", "Chemistry"))
+        self.assertEqual(janusz.get_all_grades(), {"math": [4.0]})
+
+    # Usunięty student zachowuje swoje oceny w pamięci
+    def test_removed_student_keeps_grades(self):
+        storage, system = self.reopen()
+        anna = system.find_student("Anna", "Nowak", 2024)
+        system.remove_students_from_year(2024)
+        storage.flush()
+        self.assertEqual(anna.get_subject_grades("math"), [2.0])
+
+    # Zapisy są grupowane w partie
+    def test_batched_writes(self):
+        storage = SQLiteStorage(":memory:", batch_size=100)
+        system = storage.load()
+        student = Student("Ewa", "Dąbrowska", "1A", "Physics", 2023)
+        system.add_student(student)
+        for _ in range(150):
+            student.add_grade("math", 4.0)
+        self.assertEqual(len(storage._pending), 51)
+        storage.flush()
+        self.assertEqual(storage._pending, [])
+        count, = storage._connection.execute("SELECT COUNT(*) FROM grades").fetchone()
+        self.assertEqual(count, 150)
+        storage.close()
+
+
+class TestStorage(unittest.TestCase):
+
+    # Niepełnego backendu nie można utworzyć
+    def test_incomplete_backend(self):
+        class LoadOnly(Storage):
+            def load(self):
+                return None
+
+        with self.assertRaises(TypeError):
+            LoadOnly()
+
+
+if __name__ == "__main__":
+    unittest.main()
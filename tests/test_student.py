@@ -29,6 +29,12 @@ class TestStudent(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.student.add_grade("math", 6.5)
 
+    # Test oceny NaN (nie jest liczbą z zakresu)
+    def test_grade_nan(self):
+        with self.assertRaises(ValueError):
+            self.student.add_grade("math", float("nan"))
+        self.assertEqual(self.student.get_all_grades(), {})
+
     # Test obliczania średniej z przedmiotu
     def test_average_subject_grade(self):
         self.student.add_grade("math", 4.0)
@@ -144,5 +150,41 @@ class TestStudent(unittest.TestCase):
         self.assertEqual(summary["subjects"], 0)
         self.assertEqual(summary["total_grades"], 0)
 
+    # Średnia jest przeliczana po każdej zmianie ocen
+    def test_average_cache_invalidated(self):
+        self.student.add_grade("math", 2.0)
+        self.assertAlmostEqual(self.student.average_grade(), 2.0)
+        self.assertAlmostEqual(self.student.average_subject_grade("math"), 2.0)
+        self.student.add_grade("math", 4.0)
+        self.assertAlmostEqual(self.student.average_grade(), 3.0)
+        self.assertAlmostEqual(self.student.average_subject_grade("math"), 3.0)
+        self.student.add_grade("physics", 6.0)
+        self.student.remove_last_grade("math")
+        self.assertAlmostEqual(self.student.average_grade(), 4.0)
+        self.student.delete_subject("physics")
+        self.assertAlmostEqual(self.student.average_grade(), 2.0)
+        self.student.delete_all_grades()
+        with self.assertRaises(ValueError):
+            self.student.average_grade()
+        with self.assertRaises(ValueError):
+            self.student.average_subject_grade("math")
+
+    # Zwracane listy ocen są kopiami i nie zmieniają stanu studenta
+    def test_returned_grades_are_copies(self):
+        self.student.add_grade("math", 4.0)
+        self.student.get_subject_grades("math").append(1.0)
+        self.student.get_all_grades()["math"].append(1.0)
+        self.student.grades["math"].append(1.0)
+        self.assertEqual(self.student.get_subject_grades("math"), [4.0])
+        self.assertAlmostEqual(self.student.average_grade(), 4.0)
+
+    # Student nie ma słownika atrybutów, a oceny są w spakowanych tablicach
+    def test_compact_storage(self):
+        self.assertFalse(hasattr(self.student, "__dict__"))
+        self.student.add_grade("math", 4)
+        self.assertEqual(self.student.get_subject_grades("math"), [4.0])
+        self.assertIsInstance(self.student.get_subject_grades("math"), list)
+        self.assertEqual(self.student.remove_last_grade("math"), 4.0)
+
 if __name__ == "__main__":
     unittest.main()
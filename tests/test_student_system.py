@@ -125,5 +125,132 @@ class TestStudentSystem(unittest.TestCase):
         non_null_avgs = [a for a in avgs if a is not None]
         self.assertEqual(non_null_avgs, sorted(non_null_avgs, reverse=True))
 
+    # Wyszukiwanie po zmianie imienia i nazwiska korzysta z aktualnego indeksu
+    def test_find_student_after_change_name(self):
+        self.s3.change_name("Adrian", "Malinowski")
+        self.assertIsNone(self.system.find_student("Adam", "Malinowski", 2024))
+        self.assertIs(self.system.find_student("Adrian", "Malinowski", 2024), self.s3)
+
+    # Usunięty student nie jest już wyszukiwany
+    def test_remove_student_updates_index(self):
+        self.assertTrue(self.system.remove_student("Anna", "Nowak", 2023))
+        self.assertIsNone(self.system.find_student("Anna", "Nowak", 2023))
+        self.assertFalse(self.system.remove_student("Anna", "Nowak", 2023))
+        self.assertNotIn(self.s2, self.system.students)
+
+    # Przy duplikatach znajdowany i usuwany jest najwcześniej dodany student
+    def test_duplicate_students_first_added_wins(self):
+        duplicate = Student("Jan", "Kowalski", "3C", "Chemistry", 2023)
+        self.system.add_student(duplicate)
+        self.assertIs(self.system.find_student("Jan", "Kowalski", 2023), self.s1)
+        self.system.remove_student("Jan", "Kowalski", 2023)
+        self.assertIs(self.system.find_student("Jan", "Kowalski", 2023), duplicate)
+
+    # Studenci usunięci z rocznika znikają z indeksu
+    def test_remove_students_from_year_updates_index(self):
+        self.system.remove_students_from_year(2023)
+        self.assertIsNone(self.system.find_student("Ewa", "Dąbrowska", 2023))
+        self.assertIs(self.system.find_student("Adam", "Malinowski", 2024), self.s3)
+
+    # Ten sam obiekt studenta nie może zostać dodany dwukrotnie
+    def test_add_same_student_twice(self):
+        with self.assertRaises(ValueError):
+            self.system.add_student(self.s1)
+
+    # Zmiana klasy przenosi studenta między grupami
+    def test_change_class_grade_updates_class_index(self):
+        self.s1.change_class_grade("2b")
+        self.assertEqual(self.system.get_students_by_class("1A"), [self.s2, self.s4])
+        self.assertEqual(self.system.get_students_by_class("2B"), [self.s1, self.s3])
+        # Średnia klasy nadal porównuje nazwę klasy dokładnie
+        self.assertAlmostEqual(self.system.get_class_average("2B"), 2.0)
+
+    # Zmiana specjalizacji aktualizuje indeks specjalizacji
+    def test_change_major_updates_major_index(self):
+        self.s2.change_major("Physics")
+        self.assertEqual(self.system.get_students_from_major("physics"), [self.s1, self.s2, self.s4])
+        self.assertEqual(self.system.get_students_from_major("MATH"), [self.s3])
+
+    # Usunięty student znika z indeksów klas i specjalizacji
+    def test_remove_student_updates_group_indexes(self):
+        self.system.remove_student("Ewa", "Dąbrowska", 2023)
+        self.assertNotIn(self.s4, self.system.get_students_by_class("1A"))
+        self.assertNotIn(self.s4, self.system.get_students_from_major("Physics"))
+        self.assertEqual(self.system.remove_students_from_year(2023), 2)
+        self.assertEqual(self.system.get_students_by_class("1a"), [])
+
+    # Średnie klasy i szkoły śledzą zmiany ocen
+    def test_averages_follow_grade_changes(self):
+        self.s2.add_grade("math", 6.0)
+        self.assertAlmostEqual(self.system.get_class_average("1A"), 27 / 6)
+        self.s1.remove_last_grade("physics")
+        self.assertAlmostEqual(self.system.get_class_average("1A"), 22 / 5)
+        self.s4.delete_subject("math")
+        self.assertAlmostEqual(self.system.get_class_average("1A"), 17 / 4)
+        self.s2.delete_all_grades()
+        self.assertAlmostEqual(self.system.get_class_average("1A"), 8 / 2)
+        self.assertAlmostEqual(self.system.get_school_average(), 10 / 3)
+
+    # Zmiana klasy przenosi oceny studenta do nowej klasy
+    def test_averages_follow_class_change(self):
+        self.s3.change_class_grade("1A")
+        self.assertAlmostEqual(self.system.get_class_average("1A"), 23 / 6)
+        with self.assertRaises(ValueError):
+            self.system.get_class_average("2B")
+
+    # Usunięcie studentów usuwa ich oceny ze średnich
+    def test_averages_follow_removal(self):
+        self.system.remove_students_from_year(2023)
+        self.assertAlmostEqual(self.system.get_school_average(), 2.0)
+        self.system.remove_student("Adam", "Malinowski", 2024)
+        with self.assertRaises(ValueError):
+            self.system.get_school_average()
+
+    # Agregaty zgadzają się z liczeniem od zera po wielu losowych zmianach
+    def test_running_averages_match_full_recount(self):
+        import random
+        rng = random.Random(7)
+        students = [self.s1, self.s2, self.s3, self.s4]
+        for _ in range(2000):
+            student = rng.choice(students)
+            action = rng.random()
+            if action < 0.7:
+                student.add_grade(rng.choice(["math", "physics", "art"]), rng.uniform(1.0, 6.0))
+            elif action < 0.9:
+                try:
+                    student.remove_last_grade(rng.choice(["math", "physics", "art"]))
+                except ValueError:
+                    pass
+            else:
+                student.change_class_grade(rng.choice(["1A", "2B"]))
+        for class_grade in ["1A", "2B"]:
+            grades = [g for s in students if s.class_grade == class_grade
+                      for grades_list in s.grades.values() for g in grades_list]
+            if grades:
+                self.assertAlmostEqual(self.system.get_class_average(class_grade),
+                                       sum(grades) / len(grades), places=9)
+        all_grades = [g for s in students for grades_list in s.grades.values() for g in grades_list]
+        self.assertAlmostEqual(self.system.get_school_average(), sum(all_grades) / len(all_grades), places=9)
+
+    # Najlepsi studenci w szkole, w klasie i na specjalizacji
+    def test_top_students(self):
+        no_grades = Student("Piotr", "Zieliński", "1A", "Math", 2024)
+        self.system.add_student(no_grades)
+        self.assertEqual(self.system.top_students(2), [self.s1, self.s4])
+        self.assertEqual(self.system.top_students(10), self.system.sort_class_by_avg_grade())
+        self.assertEqual(self.system.top_students(10, class_grade="1a"),
+                         self.system.sort_students_by_avg_in_class("1A"))
+        self.assertEqual(self.system.top_students(5, class_grade="1A", major="math"), [self.s2, no_grades])
+        self.assertEqual(self.system.top_students(5, major="Chemistry"), [])
+
+    # Najsłabsi studenci; studenci bez ocen są na końcu
+    def test_bottom_students(self):
+        no_grades = Student("Piotr", "Zieliński", "1A", "Math", 2024)
+        self.system.add_student(no_grades)
+        self.assertEqual(self.system.bottom_students(2), [self.s3, self.s2])
+        self.assertEqual(self.system.bottom_students(10, class_grade="1A"),
+                         [self.s2, self.s1, self.s4, no_grades])
+        self.assertEqual(self.system.bottom_students(0), [])
+
 if __name__ == "__main__":
     unittest.main()
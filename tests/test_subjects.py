@@ -0,0 +1,72 @@
+import unittest
+from src.student import Student
+from src.student_system import StudentSystem
+
+
+class TestSubjectQueries(unittest.TestCase):
+
+    def setUp(self):
+        self.system = StudentSystem()
+        self.s1 = Student("Jan", "Kowalski", "1A", "Math", 2023)
+        self.s2 = Student("Anna", "Nowak", "1A", "Physics", 2023)
+        self.s3 = Student("Ewa", "Lis", "2B", "Math", 2024)
+        self.s1.add_grade("math", 3.0)
+        self.s1.add_grade("math", 5.0)
+        self.s1.add_grade("physics", 4.5)
+        self.s2.add_grade("math", 4.0)
+        self.s3.add_grade("math", 2.0)
+        for s in (self.s1, self.s2, self.s3):
+            self.system.add_student(s)
+
+    # Średnia i liczba ocen z przedmiotu w całej szkole
+    def test_average_and_count(self):
+        self.assertAlmostEqual(self.system.get_subject_average("math"), 3.5)
+        self.assertEqual(self.system.get_subject_grade_count("math"), 4)
+        self.assertEqual(self.system.get_subject_grade_count("history"), 0)
+        with self.assertRaises(ValueError):
+            self.system.get_subject_average("history")
+
+    # Studenci z oceną z przedmiotu, w kolejności dodania
+    def test_students_with_subject(self):
+        self.assertEqual(self.system.get_students_with_subject("math"), [self.s1, self.s2, self.s3])
+        self.assertEqual(self.system.get_students_with_subject("physics"), [self.s1])
+
+    # Najlepsi studenci z przedmiotu; remisy w kolejności dodania
+    def test_top_students(self):
+        self.assertEqual(self.system.top_students_in_subject(2, "math"), [self.s1, self.s2])
+        self.s3.add_grade("math", 6.0)
+        self.assertEqual(self.system.top_students_in_subject(3, "math"), [self.s1, self.s2, self.s3])
+        self.assertEqual(self.system.top_students_in_subject(5, "history"), [])
+
+    # Średnie z przedmiotu w poszczególnych klasach
+    def test_class_averages(self):
+        self.assertEqual(self.system.get_subject_class_averages("math"), {"1A": 4.0, "2B": 2.0})
+        self.s3.change_class_grade("1A")
+        self.assertEqual(self.system.get_subject_class_averages("math"), {"1A": 3.5})
+
+    # Indeks aktualizowany przez zmiany ocen i studentów
+    def test_updates(self):
+        self.system.get_subject_average("math")
+        self.s1.remove_last_grade("physics")
+        self.assertEqual(self.system.get_students_with_subject("physics"), [])
+        self.s2.delete_subject("math")
+        self.assertEqual(self.system.get_subject_grade_count("math"), 3)
+        self.s1.delete_all_grades()
+        self.assertEqual(self.system.get_students_with_subject("math"), [self.s3])
+        self.system.remove_student("Ewa", "Lis", 2024)
+        self.assertEqual(self.system.get_subject_grade_count("math"), 0)
+        self.assertEqual(self.system.get_subject_class_averages("math"), {})
+        self.system.add_student(self.s3)
+        self.assertEqual(self.system.get_subject_average("math"), 2.0)
+
+    # Wyniki zgodne z pełnym przeglądem wszystkich studentów
+    def test_matches_scan(self):
+        for s in (self.s1, self.s2, self.s3):
+            s.add_grade("art", 5.5)
+        grades = [g for s in self.system.students for g in s.get_all_grades().get("art", [])]
+        self.assertAlmostEqual(self.system.get_subject_average("art"), sum(grades) / len(grades))
+        self.assertEqual(self.system.get_subject_grade_count("art"), len(grades))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+import threading
+import unittest
+from src.concurrent_system import ConcurrentStudentSystem
+from src.student import Student
+from src.student_system import StudentSystem
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.system = StudentSystem()
+        self.s1 = Student("Jan", "Kowalski", "1A", "Math", 2023)
+        self.s2 = Student("Anna", "Nowak", "1A", "Physics", 2023)
+        self.s3 = Student("Ewa", "Lis", "2B", "Math", 2024)
+        self.s1.add_grade("math", 3.0)
+        self.s1.add_grade("physics", 4.5)
+        self.s2.add_grade("math", 5.0)
+        self.s3.add_grade("math", 2.0)
+        for s in (self.s1, self.s2, self.s3):
+            self.system.add_student(s)
+        self.version = self.system.snapshot()
+
+    def tearDown(self):
+        self.version.close()
+
+    def names(self, views):
+        return [view.name for view in views]
+
+    # Oceny w wersji nie zmieniają się po dodaniu i usunięciu ocen
+    def test_grades_frozen(self):
+        self.s1.add_grade("math", 6.0)
+        self.s1.add_grade("art", 4.0)
+        self.s2.remove_last_grade("math")
+        view1, view2, _ = self.version.students
+        self.assertEqual(view1.grades, {"math": [3.0], "physics": [4.5]})
+        self.assertEqual(view1.average_grade(), 3.75)
+        with self.assertRaises(ValueError):
+            view2.get_subject_grades("physics")
+        self.assertEqual(view2.get_subject_grades("math"), [5.0])
+        self.assertEqual(self.s1.get_subject_grades("math"), [3.0, 6.0])
+        self.assertEqual(self.s2.get_all_grades(), {"math": []})
+
+    # Przedmiot bez ocen w chwili utworzenia wersji zostaje w niej jako pusta lista
+    def test_empty_subject_kept(self):
+        self.s2.remove_last_grade("math")
+        with self.system.snapshot() as version:
+            self.s2.add_grade("math", 4.0)
+            self.s2.add_grade("art", 5.0)
+            self.assertEqual(version.students[1].grades, {"math": []})
+            self.assertEqual(self.s2.get_all_grades(), {"math": [4.0], "art": [5.0]})
+            self.s3.add_grade("art", 6.0)
+            self.assertEqual(version.students[2].grades, {"math": [2.0]})
+
+    # Usunięcie przedmiotu i wszystkich ocen
+    def test_delete_subject_and_clear(self):
+        self.s1.delete_subject("math")
+        self.s3.delete_all_grades()
+        self.s3.add_grade("math", 6.0)
+        view1, _, view3 = self.version.students
+        self.assertEqual(view1.get_subject_grades("math"), [3.0])
+        self.assertEqual(view1.average_grade(), 3.75)
+        self.assertEqual(view3.get_all_grades(), {"math": [2.0]})
+
+    # Zmiana nazwiska, klasy i kierunku
+    def test_renamed_and_moved(self):
+        self.s1.change_name("Janusz", "Kowal")
+        self.s1.change_class_grade("3C")
+        self.s2.change_major("Art")
+        self.assertEqual((self.version.students[0].name, self.version.students[0].class_grade), ("Jan", "1A"))
+        self.assertEqual(self.version.students[1].major, "Physics")
+        self.assertEqual(self.names(self.version.get_students_by_class("1a")), ["Jan", "Anna"])
+        self.assertEqual(self.version.find_student("Jan", "Kowalski", 2023).last_name, "Kowalski")
+        self.assertIsNone(self.version.find_student("Janusz", "Kowal", 2023))
+        self.assertEqual(self.s1.class_grade, "3C")
+
+    # Usunięci studenci zostają w wersji, nowi się nie pojawiają
+    def test_removed_and_added(self):
+        self.system.remove_student("Anna", "Nowak", 2023)
+        self.s2.add_grade("math", 1.0)
+        self.system.add_student(Student("Ola", "Mak", "1A", "Math", 2023))
+        self.system.add_student(self.s2)
+        self.assertEqual(self.names(self.version.students), ["Jan", "Anna", "Ewa"])
+        self.assertEqual(self.version.get_student_count(), 3)
+        self.assertEqual(self.version.students[1].grades, {"math": [5.0]})
+        self.assertIsNone(self.version.find_student("Ola", "Mak", 2023))
+
+    # Średnie i rankingi z chwili utworzenia wersji
+    def test_averages_and_rankings(self):
+        self.s3.add_grade("math", 6.0)
+        self.s2.delete_all_grades()
+        self.assertEqual(self.version.get_class_average("1A"), 12.5 / 3)
+        self.assertEqual(self.version.get_school_average(), 14.5 / 4)
+        with self.assertRaises(ValueError):
+            self.version.get_class_average("3C")
+        self.assertEqual(self.names(self.version.sort_class_by_avg_grade()), ["Anna", "Jan", "Ewa"])
+        self.assertEqual(self.names(self.version.top_students(1, class_grade="1a")), ["Anna"])
+        self.assertEqual(self.names(self.version.bottom_students(2)), ["Ewa", "Jan"])
+        self.assertEqual(self.system.get_school_average(), 15.5 / 4)
+
+    # Zamknięta wersja nie śledzi zmian i nie pozwala na odczyt
+    def test_close(self):
+        view = self.version.students[0]
+        with self.system.snapshot() as other:
+            self.assertEqual(len(self.system._versions), 2)
+        self.version.close()
+        self.assertEqual(self.system._versions, [])
+        self.s1.add_grade("math", 6.0)
+        with self.assertRaises(RuntimeError):
+            view.grades
+        with self.assertRaises(RuntimeError):
+            other.students
+
+
+class TestConcurrentSnapshot(unittest.TestCase):
+
+    # Raport czyta wersję, podczas gdy inny wątek zmienia oceny
+    def test_report_while_writing(self):
+        system = ConcurrentStudentSystem()
+        students = [Student(f"S{i}", "Test", "1A", "Math", 2023) for i in range(50)]
+        for s in students:
+            s.add_grade("math", 3.0)
+        system.add_students_bulk(students)
+
+        def write():
+            for s in students:
+                with system.writing():
+                    s.add_grade("math", 5.0)
+                    s.change_class_grade("2B")
+
+        with system.snapshot() as version:
+            writer = threading.Thread(target=write)
+            writer.start()
+            report = [(view.class_grade, view.average_grade()) for view in version.iter_students()]
+            writer.join()
+            self.assertEqual(report, [("1A", 3.0)] * 50)
+            self.assertEqual(version.get_class_average("1A"), 3.0)
+        self.assertEqual(system.get_class_average("2B"), 4.0)
+
+
+if __name__ == "__main__":
+    unittest.main()